@@ -1,8 +1,11 @@
-import json
+import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Optional, Pattern, cast
 
 from dbt.cli.main import dbtRunner, dbtRunnerResult
+from dbt.contracts.graph.manifest import Manifest
 from google.protobuf.json_format import MessageToDict
 
 from elementary.clients.dbt.command_line_dbt_runner import (
@@ -11,12 +14,27 @@ from elementary.clients.dbt.command_line_dbt_runner import (
 )
 from elementary.clients.dbt.dbt_log import DbtLog
 from elementary.exceptions.exceptions import DbtCommandError
+from elementary.utils import json_utils
 from elementary.utils.cwd import with_chdir
 from elementary.utils.env_vars_context import env_vars_context
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# dbt commands that load a manifest and can therefore be handed a preloaded one.
+_MANIFEST_COMMANDS = {
+    "run-operation",
+    "run",
+    "test",
+    "ls",
+    "list",
+    "seed",
+    "snapshot",
+    "source",
+    "build",
+    "compile",
+}
+
 
 @dataclass
 class APIDbtCommandResult(DbtCommandResult):
@@ -24,12 +42,32 @@ class APIDbtCommandResult(DbtCommandResult):
 
 
 class APIDbtRunner(CommandLineDbtRunner):
+    def __init__(self, *args: Any, reuse_manifest: bool = False, **kwargs: Any):
+        # Session mode - the manifest is parsed once (per set of vars) and handed to every following dbt
+        # invocation, instead of having dbt re-parse the project on each command.
+        # Set before calling super().__init__ since it might already run 'dbt deps'.
+        self.reuse_manifest = reuse_manifest
+        self._manifests: Dict[Optional[str], Manifest] = {}
+        self._manifests_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def deps(self, *args: Any, **kwargs: Any) -> bool:
+        success = super().deps(*args, **kwargs)
+        # Installed packages might have changed, so previously parsed manifests are stale.
+        self.clear_manifests()
+        return success
+
+    def clear_manifests(self) -> None:
+        with self._manifests_lock:
+            self._manifests.clear()
+
     def _inner_run_command(
         self,
         dbt_command_args: List[str],
         quiet: bool,
         log_output: bool,
         log_format: str,
+        log_pattern: Optional[Pattern] = None,
     ) -> DbtCommandResult:
         # The dbt python API always prints the output and we collect the logs using a programmatic callback so no
         # need to capture the output anymore here.
@@ -41,11 +79,12 @@ class APIDbtRunner(CommandLineDbtRunner):
 
         def collect_dbt_command_logs(event):
             if event.info.name in ["JinjaLogInfo", "RunningOperationCaughtError"]:
-                event_dump = json.dumps(MessageToDict(event))  # type: ignore[arg-type]
+                event_dump = json_utils.dumps(MessageToDict(event))  # type: ignore[arg-type]
                 dbt_logs.append(event_dump)
 
+        manifest = self._get_manifest(dbt_command_args)
         with env_vars_context(self.env_vars):
-            dbt = dbtRunner(callbacks=[collect_dbt_command_logs])
+            dbt = dbtRunner(manifest=manifest, callbacks=[collect_dbt_command_logs])
             with with_chdir(self.project_dir):
                 res: dbtRunnerResult = dbt.invoke(dbt_command_args)
         output = "\n".join(dbt_logs) or None
@@ -69,6 +108,74 @@ class APIDbtRunner(CommandLineDbtRunner):
             result_obj=res,
         )
 
+    def _get_manifest(self, dbt_command_args: List[str]) -> Optional[Manifest]:
+        if not self.reuse_manifest:
+            return None
+        if self._get_command_name(dbt_command_args) not in _MANIFEST_COMMANDS:
+            return None
+
+        # The manifest depends on the vars it was parsed with, so we keep one per vars value.
+        vars_json = self._get_arg_value(dbt_command_args, "--vars")
+        with self._manifests_lock:
+            if vars_json not in self._manifests:
+                manifest = self._parse_manifest(vars_json)
+                if manifest is None:
+                    return None
+                self._manifests[vars_json] = manifest
+            return self._manifests[vars_json]
+
+    def _parse_manifest(self, vars_json: Optional[str]) -> Optional[Manifest]:
+        parse_args = [
+            "parse",
+            "--quiet",
+            "--project-dir",
+            os.path.abspath(self.project_dir),
+        ]
+        if self.profiles_dir:
+            parse_args.extend(["--profiles-dir", os.path.abspath(self.profiles_dir)])
+        if self.target:
+            parse_args.extend(["--target", self.target])
+        if vars_json:
+            parse_args.extend(["--vars", vars_json])
+
+        parse_start = time.time()
+        with env_vars_context(self.env_vars):
+            with with_chdir(self.project_dir):
+                res: dbtRunnerResult = dbtRunner().invoke(parse_args)
+        if not res.success or not isinstance(res.result, Manifest):
+            logger.debug(
+                "Could not preload the dbt manifest, falling back to parsing per command: %s",
+                res.exception,
+            )
+            return None
+
+        logger.debug(
+            "Parsed dbt manifest for '%s' in %.2f seconds.",
+            self.project_dir,
+            time.time() - parse_start,
+        )
+        return res.result
+
+    @staticmethod
+    def _get_command_name(dbt_command_args: List[str]) -> Optional[str]:
+        args_iter = iter(dbt_command_args)
+        for arg in args_iter:
+            if arg == "--log-format":
+                next(args_iter, None)
+                continue
+            if not arg.startswith("-"):
+                return arg
+        return None
+
+    @staticmethod
+    def _get_arg_value(dbt_command_args: List[str], arg_name: str) -> Optional[str]:
+        if arg_name not in dbt_command_args:
+            return None
+        arg_index = dbt_command_args.index(arg_name)
+        if arg_index + 1 >= len(dbt_command_args):
+            return None
+        return dbt_command_args[arg_index + 1]
+
     def _parse_ls_command_result(
         self, select: Optional[str], result: DbtCommandResult
     ) -> List[str]:
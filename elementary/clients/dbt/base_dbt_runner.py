@@ -3,6 +3,11 @@ from typing import Any, Dict, Optional
 
 
 class BaseDbtRunner(ABC):
+    # How many dbt commands of this runner can safely run at the same time.
+    max_concurrent_commands: int = 1
+    # Max length of a single command argument (e.g. macro args), None if commands don't go through a command line.
+    max_command_arg_length: Optional[int] = None
+
     def __init__(
         self,
         project_dir: str,
@@ -35,6 +40,14 @@ class BaseDbtRunner(ABC):
     def run_operation(self, *args, **kwargs):
         raise NotImplementedError
 
+    @abstractmethod
+    def run_operations_batch(self, *args, **kwargs):
+        raise NotImplementedError
+
+    @abstractmethod
+    def run_operation_rows(self, *args, **kwargs):
+        raise NotImplementedError
+
     @abstractmethod
     def run(self, *args, **kwargs):
         raise NotImplementedError
@@ -1,8 +1,21 @@
 import json
 import os
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import sys
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
 import yaml
 from tenacity import (
@@ -18,7 +31,10 @@ from elementary.clients.dbt.dbt_log import parse_dbt_output
 from elementary.clients.dbt.transient_errors import is_transient_error
 from elementary.exceptions.exceptions import DbtCommandError, DbtLsCommandError
 from elementary.monitor.dbt_project_utils import is_dbt_package_up_to_date
+from elementary.utils import json_utils
 from elementary.utils.env_vars import is_debug
+from elementary.utils.json_file_cache import JsonFileCache
+from elementary.utils.json_utils import iter_json_array
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -49,17 +65,43 @@ def _before_retry_log(retry_state: RetryCallState) -> None:
     )
 
 
+def _parse_results_file_value(value: Any) -> Any:
+    # agate writes every number as a float, so whole numbers are turned back to ints.
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
 MACRO_RESULT_PATTERN = re.compile(
     "Elementary: --ELEMENTARY-MACRO-OUTPUT-START--(.*)--ELEMENTARY-MACRO-OUTPUT-END--"
 )
+BATCH_MACRO_RESULT_PATTERN = re.compile(
+    "Elementary: --ELEMENTARY-BATCH-MACRO-OUTPUT-START--([0-9]+)--(.*)--ELEMENTARY-MACRO-OUTPUT-END--"
+)
 RAW_EDR_LOGS_PATTERN = re.compile("Elementary: (.*)")
 
+# Directory (under the runner's results dir) that macros write their result sets to.
+MACRO_RESULTS_DIR_NAME = "macro_results"
+
+STARTUP_STATE_CACHE_FILE_NAME = "dbt_runner_startup_state.json"
+
 
 @dataclass
 class DbtCommandResult:
     success: bool
     output: Optional[str]
     stderr: Optional[str]
+    # Matches of the requested log pattern, for runners that consume the output as a stream and hand
+    # matching logs directly to the caller instead of keeping them in the output.
+    log_matches: Optional[List[Match]] = field(default=None, kw_only=True)
+
+
+@dataclass
+class DbtRunnerStartupState:
+    """What a runner learns about its project when it starts, derived only from the project's files."""
+
+    adapter_type: Optional[str]
+    deps_satisfied: bool
 
 
 class CommandLineDbtRunner(BaseDbtRunner):
@@ -75,6 +117,8 @@ class CommandLineDbtRunner(BaseDbtRunner):
         allow_macros_without_package_prefix: bool = False,
         run_deps_if_needed: bool = True,
         force_dbt_deps: bool = False,
+        results_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
         super().__init__(
             project_dir,
@@ -84,14 +128,76 @@ class CommandLineDbtRunner(BaseDbtRunner):
             secret_vars,
             allow_macros_without_package_prefix,
         )
-        self.adapter_type = self._get_adapter_type()
+        self.cache_dir = cache_dir
+        self.startup_state = self._get_startup_state()
+        self.adapter_type = self.startup_state.adapter_type
         self.raise_on_failure = raise_on_failure
         self.env_vars = env_vars
+        self.results_dir = results_dir
+        if results_dir:
+            # Created up front, commands that run side by side would race to create it otherwise.
+            os.makedirs(
+                os.path.join(os.path.abspath(results_dir), MACRO_RESULTS_DIR_NAME),
+                exist_ok=True,
+            )
         if force_dbt_deps:
             self.deps()
         elif run_deps_if_needed:
             self._run_deps_if_needed()
 
+    def _get_startup_state(self) -> DbtRunnerStartupState:
+        """Computes the startup state, or reuses the cached one when none of the files it's derived from changed."""
+        cache = (
+            JsonFileCache(os.path.join(self.cache_dir, STARTUP_STATE_CACHE_FILE_NAME))
+            if self.cache_dir
+            else None
+        )
+        cache_key = f"{os.path.abspath(self.project_dir)}:{self._get_profiles_path()}:{self.target}"
+        files_mtimes = self._get_startup_files_mtimes()
+        if cache is not None:
+            cache_entry = cache.load().get(cache_key)
+            if cache_entry and cache_entry.get("files_mtimes") == files_mtimes:
+                return DbtRunnerStartupState(**cache_entry["state"])
+
+        startup_state = DbtRunnerStartupState(
+            adapter_type=self._get_adapter_type(),
+            deps_satisfied=self._get_deps_update_reason() is None,
+        )
+        # Missing deps are about to be installed, which changes the files anyway.
+        if cache is not None and startup_state.deps_satisfied:
+            cache_entries = cache.load()
+            cache_entries[cache_key] = dict(
+                files_mtimes=files_mtimes, state=asdict(startup_state)
+            )
+            cache.save(cache_entries)
+        return startup_state
+
+    def _get_startup_files_mtimes(self) -> Dict[str, Optional[int]]:
+        packages_dir = self._get_packages_dir()
+        startup_files = [
+            self._get_profiles_path(),
+            os.path.join(self.project_dir, "dbt_project.yml"),
+            os.path.join(self.project_dir, "packages.yml"),
+            # A directory's mtime changes whenever packages are added or removed.
+            packages_dir,
+            os.path.join(packages_dir, "elementary", "dbt_project.yml"),
+        ]
+        files_mtimes: Dict[str, Optional[int]] = {}
+        for path in startup_files:
+            try:
+                files_mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                files_mtimes[path] = None
+        return files_mtimes
+
+    def _get_profiles_path(self) -> str:
+        profiles_dir = (
+            self.profiles_dir
+            if self.profiles_dir
+            else os.path.join(os.path.expanduser("~"), ".dbt")
+        )
+        return os.path.abspath(os.path.join(profiles_dir, "profiles.yml"))
+
     def _get_adapter_type(self) -> Optional[str]:
         """Resolve the adapter type from ``profiles.yml``.
 
@@ -101,12 +207,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
 
         Returns ``None`` when profiles.yml or the expected keys are missing.
         """
-        profiles_dir = (
-            self.profiles_dir
-            if self.profiles_dir
-            else os.path.join(os.path.expanduser("~"), ".dbt")
-        )
-        profiles_path = os.path.join(profiles_dir, "profiles.yml")
+        profiles_path = self._get_profiles_path()
         if not os.path.exists(profiles_path):
             logger.debug("profiles.yml not found at %s", profiles_path)
             return None
@@ -159,6 +260,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
         quiet: bool,
         log_output: bool,
         log_format: str,
+        log_pattern: Optional[Pattern] = None,
     ) -> DbtCommandResult:
         raise NotImplementedError
 
@@ -174,6 +276,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
         vars: Optional[dict] = None,
         quiet: bool = False,
         log_output: bool = True,
+        log_pattern: Optional[Pattern] = None,
     ) -> DbtCommandResult:
         dbt_command_args = []
         dbt_command_args.extend(["--log-format", log_format])
@@ -212,6 +315,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
                 quiet=quiet,
                 log_output=log_output,
                 log_format=log_format,
+                log_pattern=log_pattern,
             )
         except DbtTransientError as exc:
             logger.exception(
@@ -240,6 +344,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
         quiet: bool,
         log_output: bool,
         log_format: str,
+        log_pattern: Optional[Pattern] = None,
     ) -> DbtCommandResult:
         """Run one dbt command attempt. Raises DbtTransientError for transient failures so tenacity can retry."""
         try:
@@ -248,6 +353,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
                 quiet=quiet,
                 log_output=log_output,
                 log_format=log_format,
+                log_pattern=log_pattern,
             )
         except DbtCommandError as exc:
             output_text = str(exc)
@@ -333,11 +439,7 @@ class CommandLineDbtRunner(BaseDbtRunner):
         log_output: bool = False,
         return_raw_edr_logs: bool = False,
     ) -> list:
-        if "." not in macro_name and not self.allow_macros_without_package_prefix:
-            raise ValueError(
-                f"Macro name '{macro_name}' is missing package prefix. "
-                f"Please use the following format: <package_name>.<macro_name>"
-            )
+        self._validate_macro_name(macro_name)
         macro_to_run = macro_name
         macro_to_run_args = macro_args if macro_args else dict()
         if not return_raw_edr_logs:
@@ -345,24 +447,199 @@ class CommandLineDbtRunner(BaseDbtRunner):
             macro_to_run_args = dict(
                 macro_name=macro_name, macro_args=macro_args if macro_args else dict()
             )
-        command_args = ["run-operation", macro_to_run]
-        json_args = json.dumps(macro_to_run_args, ensure_ascii=False)
-        command_args.extend(["--args", json_args])
-        result = self._run_command(
-            command_args=command_args,
+        log_pattern = (
+            RAW_EDR_LOGS_PATTERN if return_raw_edr_logs else MACRO_RESULT_PATTERN
+        )
+        result = self._run_operation_command(
+            macro_to_run,
+            macro_to_run_args,
             vars=vars,
             quiet=quiet,
             log_output=log_output,
+            log_pattern=log_pattern,
         )
         if log_errors and not result.success:
             logger.error(
                 f'Failed to run macro: "{macro_name}"\nRun output: {result.output}'
             )
-        run_operation_results = []
 
-        log_pattern = (
-            RAW_EDR_LOGS_PATTERN if return_raw_edr_logs else MACRO_RESULT_PATTERN
+        return [
+            match.group(1)
+            for match in self._iter_run_operation_matches(
+                result, log_pattern, log_errors
+            )
+        ]
+
+    def run_operations_batch(
+        self,
+        macros: Sequence[Tuple[str, Optional[dict]]],
+        log_errors: bool = True,
+        vars: Optional[dict] = None,
+        quiet: bool = False,
+        log_output: bool = False,
+    ) -> Dict[str, list]:
+        """Run several macros in a single dbt invocation.
+
+        Every macro's results are logged by the ``elementary_cli.log_macros_results`` dispatcher, tagged with
+        the position of the macro in ``macros``.
+        Returns the results keyed by macro name, each in the same format ``run_operation`` returns.
+        """
+        macro_names = [macro_name for macro_name, _ in macros]
+        if len(set(macro_names)) != len(macro_names):
+            raise ValueError(
+                f"Batched macros must be unique, got: {', '.join(macro_names)}"
+            )
+        for macro_name in macro_names:
+            self._validate_macro_name(macro_name)
+
+        run_operation_results: Dict[str, list] = {
+            macro_name: [] for macro_name in macro_names
+        }
+        if not macros:
+            return run_operation_results
+
+        macro_calls = [
+            dict(call_id=call_id, macro_name=macro_name, macro_args=macro_args or {})
+            for call_id, (macro_name, macro_args) in enumerate(macros)
+        ]
+        result = self._run_operation_command(
+            "elementary_cli.log_macros_results",
+            dict(macros=macro_calls),
+            vars=vars,
+            quiet=quiet,
+            log_output=log_output,
+            log_pattern=BATCH_MACRO_RESULT_PATTERN,
         )
+        if log_errors and not result.success:
+            logger.error(
+                f'Failed to run macros: "{", ".join(macro_names)}"\nRun output: {result.output}'
+            )
+
+        for match in self._iter_run_operation_matches(
+            result, BATCH_MACRO_RESULT_PATTERN, log_errors
+        ):
+            call_id = int(match.group(1))
+            if call_id < len(macro_names):
+                run_operation_results[macro_names[call_id]].append(match.group(2))
+        return run_operation_results
+
+    def run_operation_rows(
+        self,
+        macro_name: str,
+        macro_args: Optional[dict] = None,
+        log_errors: bool = True,
+        vars: Optional[dict] = None,
+        quiet: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Run a macro that returns a result set and iterate over its rows.
+
+        When the runner has a ``results_dir``, the macro is given a ``results_path`` argument and writes its rows
+        there as newline-delimited JSON (see ``elementary_cli.return_result_set``). The rows are then read lazily
+        from the file instead of being passed through dbt's logs. Otherwise, the rows are parsed from the logged
+        macro results.
+        """
+        if self.results_dir is None:
+            run_operation_results = self.run_operation(
+                macro_name,
+                macro_args=macro_args,
+                log_errors=log_errors,
+                vars=vars,
+                quiet=quiet,
+            )
+            return self._iter_logged_rows(run_operation_results)
+
+        results_path = os.path.join(
+            os.path.abspath(self.results_dir),
+            MACRO_RESULTS_DIR_NAME,
+            f"{uuid.uuid4()}.ndjson",
+        )
+        try:
+            run_operation_results = self.run_operation(
+                macro_name,
+                macro_args={**(macro_args or {}), "results_path": results_path},
+                log_errors=log_errors,
+                vars=vars,
+                quiet=quiet,
+            )
+        except Exception:
+            # The macro may have failed after it wrote its rows.
+            if os.path.exists(results_path):
+                os.remove(results_path)
+            raise
+        if not os.path.exists(results_path):
+            return self._iter_logged_rows(run_operation_results)
+        return self._iter_results_file_rows(self._open_results_file(results_path))
+
+    @staticmethod
+    def _iter_logged_rows(run_operation_results: list) -> Iterator[Dict[str, Any]]:
+        for macro_results in run_operation_results:
+            yield from iter_json_array(macro_results)
+
+    @staticmethod
+    def _open_results_file(results_path: str) -> TextIO:
+        """
+        Opens a macro's results file and removes it from the results dir right away, so it doesn't stay there
+        when its rows are never read. The open file stays readable until it is closed.
+        """
+        if sys.platform == "win32":
+            # Windows can't remove an open file, so it is removed once it is closed instead.
+            return open(
+                os.open(results_path, os.O_RDONLY | os.O_TEMPORARY), encoding="utf-8"
+            )
+        results_file = open(results_path, encoding="utf-8")
+        try:
+            os.remove(results_path)
+        except OSError:
+            results_file.close()
+            raise
+        return results_file
+
+    @staticmethod
+    def _iter_results_file_rows(results_file: TextIO) -> Iterator[Dict[str, Any]]:
+        with results_file:
+            for line in results_file:
+                if not line.strip():
+                    continue
+                # Column names are lowercased, as elementary.agate_to_dicts does for the logged results.
+                yield {
+                    column_name.lower(): _parse_results_file_value(value)
+                    for column_name, value in json_utils.loads(line).items()
+                }
+
+    def _validate_macro_name(self, macro_name: str) -> None:
+        if "." not in macro_name and not self.allow_macros_without_package_prefix:
+            raise ValueError(
+                f"Macro name '{macro_name}' is missing package prefix. "
+                f"Please use the following format: <package_name>.<macro_name>"
+            )
+
+    def _run_operation_command(
+        self,
+        macro_name: str,
+        macro_args: dict,
+        vars: Optional[dict] = None,
+        quiet: bool = False,
+        log_output: bool = False,
+        log_pattern: Optional[Pattern] = None,
+    ) -> DbtCommandResult:
+        command_args = ["run-operation", macro_name]
+        json_args = json_utils.dumps(macro_args)
+        command_args.extend(["--args", json_args])
+        return self._run_command(
+            command_args=command_args,
+            vars=vars,
+            quiet=quiet,
+            log_output=log_output,
+            log_pattern=log_pattern,
+        )
+
+    @staticmethod
+    def _iter_run_operation_matches(
+        result: DbtCommandResult, log_pattern: Pattern, log_errors: bool
+    ) -> Iterator[Match]:
+        if result.log_matches:
+            yield from result.log_matches
+
         if result.output is not None:
             for log in parse_dbt_output(result.output):
                 if log_errors and log.level == "error":
@@ -372,15 +649,12 @@ class CommandLineDbtRunner(BaseDbtRunner):
                 if log.msg:
                     match = log_pattern.match(log.msg)
                     if match:
-                        run_operation_results.append(match.group(1))
+                        yield match
 
         if result.stderr is not None and log_errors:
             for log in parse_dbt_output(result.stderr):
                 if log.level == "error":
                     logger.error(log.msg)
-                    continue
-
-        return run_operation_results
 
     def run(
         self,
@@ -444,10 +718,13 @@ class CommandLineDbtRunner(BaseDbtRunner):
         result = self._run_command(command_args=["source", "freshness"])
         return result.success
 
-    def _get_installed_packages_names(self):
-        packages_dir = os.path.join(
+    def _get_packages_dir(self) -> str:
+        return os.path.join(
             self.project_dir, os.environ.get("DBT_PACKAGES_FOLDER", "dbt_packages")
         )
+
+    def _get_installed_packages_names(self):
+        packages_dir = self._get_packages_dir()
         try:
             return [
                 name
@@ -470,23 +747,26 @@ class CommandLineDbtRunner(BaseDbtRunner):
             if "package" in package_entry
         ]
 
-    def _run_deps_if_needed(self):
+    def _get_deps_update_reason(self) -> Optional[str]:
         if not os.path.exists(self.project_dir):
-            return
-
-        should_run_deps = False
+            return None
 
         installed_package_names = set(self._get_installed_packages_names())
         required_package_names = set(self._get_required_packages_names())
         if not required_package_names.issubset(installed_package_names):
-            logger.info("Installing packages for edr internal dbt package...")
-            should_run_deps = True
+            return "Installing packages for edr internal dbt package..."
         elif not is_dbt_package_up_to_date(self.project_dir):
             # Run deps also if Elementary's dbt package is not up-to-date
             # NOTE - we can't do this check for all packages, because the version in dbt_project.yaml is not enforced to be the same
             #        as the dbt hub version (but for our package we do ensure they are aligned)
-            logger.info("edr internal dbt package is not up-to-date, updating it...")
-            should_run_deps = True
+            return "edr internal dbt package is not up-to-date, updating it..."
+        return None
 
-        if should_run_deps:
-            self.deps()
+    def _run_deps_if_needed(self):
+        if self.startup_state.deps_satisfied:
+            return
+
+        deps_update_reason = self._get_deps_update_reason()
+        if deps_update_reason:
+            logger.info(deps_update_reason)
+        self.deps()
@@ -2,6 +2,7 @@ import json
 from dataclasses import dataclass
 from typing import Iterator, Optional
 
+from elementary.utils import json_utils
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -15,7 +16,7 @@ class DbtLog:
 
     @classmethod
     def from_log_line(cls, log_line: str) -> "DbtLog":
-        log = json.loads(log_line)
+        log = json_utils.loads(log_line)
         return cls(
             msg=log.get("info", {}).get("msg") or log.get("data", {}).get("msg"),
             level=log.get("info", {}).get("level") or log.get("level"),
@@ -31,10 +32,17 @@ class DbtLog:
 
 def parse_dbt_output(output: str, log_format: str = "json") -> Iterator[DbtLog]:
     for log_line in output.strip().splitlines():
-        try:
-            if log_format == "json":
-                yield DbtLog.from_log_line(log_line)
-            elif log_format == "text":
-                yield DbtLog(msg=log_line, level="info", exception=None)
-        except json.JSONDecodeError:
-            logger.debug(f"Unable to parse dbt log message: {log_line}", exc_info=True)
+        log = parse_dbt_log_line(log_line, log_format)
+        if log is not None:
+            yield log
+
+
+def parse_dbt_log_line(log_line: str, log_format: str = "json") -> Optional[DbtLog]:
+    try:
+        if log_format == "json":
+            return DbtLog.from_log_line(log_line)
+        elif log_format == "text":
+            return DbtLog(msg=log_line, level="info", exception=None)
+    except json.JSONDecodeError:
+        logger.debug(f"Unable to parse dbt log message: {log_line}", exc_info=True)
+    return None
@@ -29,10 +29,20 @@ def create_dbt_runner(
     allow_macros_without_package_prefix: bool = False,
     run_deps_if_needed: bool = True,
     force_dbt_deps: bool = False,
+    results_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
     runner_method: Optional[RunnerMethod] = None,
+    reuse_manifest: bool = False,
+    stream_output: bool = False,
 ) -> CommandLineDbtRunner:
     runner_method = runner_method or get_dbt_runner_method()
     runner_class = get_dbt_runner_class(runner_method)
+    runner_kwargs: Dict[str, Any] = {}
+    if runner_method == RunnerMethod.API:
+        # Only the dbt python API can hand a preloaded manifest to its invocations.
+        runner_kwargs["reuse_manifest"] = reuse_manifest
+    elif issubclass(runner_class, SubprocessDbtRunner):
+        runner_kwargs["stream_output"] = stream_output
     return runner_class(
         project_dir=project_dir,
         profiles_dir=profiles_dir,
@@ -44,6 +54,9 @@ def create_dbt_runner(
         allow_macros_without_package_prefix=allow_macros_without_package_prefix,
         run_deps_if_needed=run_deps_if_needed,
         force_dbt_deps=force_dbt_deps,
+        results_dir=results_dir,
+        cache_dir=cache_dir,
+        **runner_kwargs,
     )
 
 
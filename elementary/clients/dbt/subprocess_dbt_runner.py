@@ -1,28 +1,141 @@
 import os
+import shutil
 import subprocess
-from typing import List, Optional
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Match, Optional, Pattern
 
 from elementary.clients.dbt.command_line_dbt_runner import (
     CommandLineDbtRunner,
     DbtCommandResult,
 )
-from elementary.clients.dbt.dbt_log import parse_dbt_output
+from elementary.clients.dbt.dbt_log import parse_dbt_log_line, parse_dbt_output
 from elementary.exceptions.exceptions import DbtCommandError
 from elementary.utils.env_vars import is_debug
 from elementary.utils.json_utils import try_load_json
 from elementary.utils.log import get_logger
 
+try:
+    import resource
+except ImportError:
+    # Not available on Windows.
+    resource = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# dbt commands that don't take a --target-path option.
+COMMANDS_WITHOUT_TARGET_PATH = {"deps", "debug", "init"}
+
+PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+
 
 class SubprocessDbtRunner(CommandLineDbtRunner):
+    # Every command runs in its own dbt process, so they can run side by side.
+    max_concurrent_commands = 4
+    # Linux caps a single argument at 128KB, Windows caps the whole command line at 32K characters.
+    max_command_arg_length = 30_000 if os.name == "nt" else 100_000
+
+    def __init__(self, *args: Any, stream_output: bool = False, **kwargs: Any):
+        # Streaming mode - dbt's stdout is consumed line by line instead of being buffered as a whole,
+        # and logs matching the requested pattern are handed to the caller without keeping them in the output.
+        self.stream_output = stream_output
+        # Commands that run side by side can't share dbt's target and log dirs (partial parsing state, manifest,
+        # run results and logs), so every command takes a slot and each slot has dirs of its own.
+        self._free_command_slots = list(range(self.max_concurrent_commands))
+        self._command_slots_condition = threading.Condition()
+        super().__init__(*args, **kwargs)
+
+    @contextmanager
+    def _command_slot(self, dbt_command_args: List[str]) -> Iterator[List[str]]:
+        """Takes the lowest free slot for a command, and yields the dbt args that point it at the slot's dirs."""
+        with self._command_slots_condition:
+            self._command_slots_condition.wait_for(lambda: self._free_command_slots)
+            slot = min(self._free_command_slots)
+            self._free_command_slots.remove(slot)
+        try:
+            yield self._get_command_slot_args(slot, dbt_command_args)
+        finally:
+            with self._command_slots_condition:
+                self._free_command_slots.append(slot)
+                self._command_slots_condition.notify()
+
+    def _get_command_slot_args(
+        self, slot: int, dbt_command_args: List[str]
+    ) -> List[str]:
+        # Commands that run one at a time always get the first slot, which keeps the project's own dirs.
+        if slot == 0:
+            return []
+        env = self._get_command_env()
+        slot_dir_name = f"command_slot_{slot}"
+        log_path = env.get("DBT_LOG_PATH", os.path.join(self.project_dir, "logs"))
+        command_slot_args = ["--log-path", os.path.join(log_path, slot_dir_name)]
+        # The dbt args start with the log format option (see _run_command), followed by the command.
+        if dbt_command_args[2] in COMMANDS_WITHOUT_TARGET_PATH:
+            return command_slot_args
+
+        target_path = env.get(
+            "EDR_INTERNAL_TARGET_PATH", os.path.join(self.project_dir, "target")
+        )
+        slot_target_path = os.path.join(target_path, slot_dir_name)
+        self._copy_partial_parse_state(target_path, slot_target_path)
+        return ["--target-path", slot_target_path, *command_slot_args]
+
+    @staticmethod
+    def _copy_partial_parse_state(target_path: str, slot_target_path: str) -> None:
+        """
+        A slot's target dir starts out empty, so dbt would fully parse the project for the slot's first command.
+        It gets the first slot's partial parsing state instead, whenever that state is newer than its own.
+        """
+        partial_parse_path = os.path.join(target_path, PARTIAL_PARSE_FILE_NAME)
+        slot_partial_parse_path = os.path.join(
+            slot_target_path, PARTIAL_PARSE_FILE_NAME
+        )
+        try:
+            partial_parse_mtime = os.path.getmtime(partial_parse_path)
+        except OSError:
+            # No partial parsing state yet, the slot's command parses the project on its own.
+            return
+        if (
+            os.path.exists(slot_partial_parse_path)
+            and os.path.getmtime(slot_partial_parse_path) >= partial_parse_mtime
+        ):
+            return
+        os.makedirs(slot_target_path, exist_ok=True)
+        # The first slot's command may be rewriting the state, so the copy replaces the slot's state at once.
+        # dbt falls back to a full parse if it still reads a partially written state.
+        temp_path = f"{slot_partial_parse_path}.{threading.get_ident()}.tmp"
+        shutil.copy2(partial_parse_path, temp_path)
+        os.replace(temp_path, slot_partial_parse_path)
+
     def _inner_run_command(
         self,
         dbt_command_args: List[str],
         quiet: bool,
         log_output: bool,
         log_format: str,
+        log_pattern: Optional[Pattern] = None,
+    ) -> DbtCommandResult:
+        with self._command_slot(dbt_command_args) as command_slot_args:
+            return self._run_dbt_process(
+                dbt_command_args + command_slot_args,
+                log_output,
+                log_format,
+                log_pattern,
+            )
+
+    def _run_dbt_process(
+        self,
+        dbt_command_args: List[str],
+        log_output: bool,
+        log_format: str,
+        log_pattern: Optional[Pattern],
     ) -> DbtCommandResult:
+        if self.stream_output:
+            return self._inner_run_command_streamed(
+                dbt_command_args, log_output, log_format, log_pattern
+            )
+
         try:
             result = subprocess.run(
                 [self._get_dbt_command_name()] + dbt_command_args,
@@ -49,6 +162,84 @@ class SubprocessDbtRunner(CommandLineDbtRunner):
                 base_command_args=dbt_command_args, logs=logs, err=err
             )
 
+    def _inner_run_command_streamed(
+        self,
+        dbt_command_args: List[str],
+        log_output: bool,
+        log_format: str,
+        log_pattern: Optional[Pattern],
+    ) -> DbtCommandResult:
+        command_args = [self._get_dbt_command_name()] + dbt_command_args
+        output_lines: List[str] = []
+        log_matches: List[Match] = []
+        # stderr goes to a file so a chatty stderr can't block the process while we're reading stdout.
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                command_args,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                env=self._get_command_env(),
+                cwd=self.project_dir,
+            ) as process:
+                assert process.stdout is not None
+                for raw_line in process.stdout:
+                    line = raw_line.decode().rstrip("\r\n")
+                    log_match = self._match_log_line(line, log_format, log_pattern)
+                    if log_match is not None:
+                        log_matches.append(log_match)
+                    else:
+                        output_lines.append(line)
+                returncode = process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode() or None
+        self._log_peak_memory_usage()
+
+        output = "\n".join(output_lines) or None
+        if returncode != 0 and self.raise_on_failure:
+            logs = list(parse_dbt_output(output, log_format)) if output else []
+            if log_output or is_debug():
+                for log in logs:
+                    logger.info(log.msg)
+            err = subprocess.CalledProcessError(
+                returncode,
+                command_args,
+                output=output.encode() if output else None,
+                stderr=stderr.encode() if stderr else None,
+            )
+            raise DbtCommandError(
+                base_command_args=dbt_command_args, logs=logs, err=err
+            )
+
+        return DbtCommandResult(
+            success=returncode == 0,
+            output=output,
+            stderr=stderr,
+            log_matches=log_matches if log_pattern else None,
+        )
+
+    @staticmethod
+    def _match_log_line(
+        line: str, log_format: str, log_pattern: Optional[Pattern]
+    ) -> Optional[Match]:
+        if log_pattern is None or not line:
+            return None
+        log = parse_dbt_log_line(line, log_format)
+        # Errors are left in the output, to be reported along with the rest of the command's logs.
+        if log is None or not log.msg or log.level == "error":
+            return None
+        return log_pattern.match(log.msg)
+
+    @staticmethod
+    def _log_peak_memory_usage() -> None:
+        if resource is None:
+            return
+        # ru_maxrss is in kilobytes on Linux (bytes on macOS).
+        logger.debug(
+            "Peak memory usage: %s (self), %s (dbt processes).",
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        )
+
     def _get_dbt_command_name(self) -> str:
         return "dbt"
 
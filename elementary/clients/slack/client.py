@@ -1,18 +1,24 @@
 import json
 import ssl
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
 from ratelimit import limits, sleep_and_retry
-from slack_sdk import WebClient, WebhookClient
+from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from slack_sdk.webhook.webhook_response import WebhookResponse
 
 from elementary.clients.slack.schema import SlackMessageSchema
 from elementary.config.config import Config
+from elementary.messages.messaging_integrations.slack_directory_cache import (
+    SlackDirectoryCache,
+    find_channel_id,
+    join_cached_channel,
+)
 from elementary.tracking.tracking_interface import Tracking
+from elementary.utils.http_session import PooledWebhookClient, create_http_session
 from elementary.utils.log import get_logger
 from elementary.utils.ssl import create_ssl_context
 
@@ -43,7 +49,18 @@ class SlackClient(ABC):
         ssl_context = create_ssl_context(config.ssl_ca_bundle)
         if config.slack_token:
             return SlackWebClient(
-                token=config.slack_token, tracking=tracking, ssl_context=ssl_context
+                token=config.slack_token,
+                tracking=tracking,
+                ssl_context=ssl_context,
+                directory_cache=(
+                    SlackDirectoryCache.get_shared(
+                        config.config_dir,
+                        config.slack_token,
+                        ttl=config.slack_directory_cache_ttl,
+                    )
+                    if config.slack_directory_cache_ttl > 0
+                    else None
+                ),
             )
         elif config.slack_webhook:
             return SlackWebhookClient(
@@ -51,6 +68,11 @@ class SlackClient(ABC):
                 is_workflow=config.is_slack_workflow,
                 tracking=tracking,
                 ssl_context=ssl_context,
+                session=create_http_session(
+                    timeout=config.webhook_timeout,
+                    pool_maxsize=config.webhook_pool_maxsize,
+                    ssl_context=ssl_context,
+                ),
             )
         return None
 
@@ -91,8 +113,10 @@ class SlackWebClient(SlackClient):
         token: str,
         tracking: Optional[Tracking] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
+        directory_cache: Optional[SlackDirectoryCache] = None,
     ):
         self.token = token
+        self.directory_cache = directory_cache
         super().__init__(tracking, ssl_context)
 
     def _initial_client(self, ssl_context: Optional[ssl.SSLContext]):
@@ -154,18 +178,31 @@ class SlackWebClient(SlackClient):
             logger.error("Failed to send report to Slack.")
         return send_succeed
 
-    @sleep_and_retry
-    @limits(calls=50, period=ONE_MINUTE)
     def get_user_id_from_email(self, email: str) -> Optional[str]:
-        try:
-            if email not in self.email_to_user_id_cache:
-                user_id = self.client.users_lookupByEmail(email=email)["user"]["id"]
-                self.email_to_user_id_cache[email] = user_id
+        if email in self.email_to_user_id_cache:
             return self.email_to_user_id_cache[email]
+        if self.directory_cache:
+            is_cached, cached_user_id = self.directory_cache.get_user_id(email)
+            if is_cached:
+                return cached_user_id
+        try:
+            user_id = self._lookup_user_id(email)
+            self.email_to_user_id_cache[email] = user_id
+            if self.directory_cache:
+                self.directory_cache.set_user_id(email, user_id)
+            return user_id
         except SlackApiError as err:
             logger.error(f"Unable to get Slack user ID from email: {err}.")
+            if self.directory_cache and err.response.data["error"] == "users_not_found":
+                self.directory_cache.set_user_id(email, None)
             return None
 
+    # Only actual lookups are rate limited, cached users are returned right away.
+    @sleep_and_retry
+    @limits(calls=50, period=ONE_MINUTE)
+    def _lookup_user_id(self, email: str) -> str:
+        return self.client.users_lookupByEmail(email=email)["user"]["id"]
+
     @sleep_and_retry
     @limits(calls=20, period=ONE_MINUTE)
     def _get_channels(
@@ -186,15 +223,27 @@ class SlackWebClient(SlackClient):
         cursor = response.get("response_metadata", {}).get("next_cursor")
         return channels, cursor
 
-    def _get_channel_id(self, channel_name: str) -> Optional[str]:
+    def _iter_channels(self) -> Iterator[dict]:
         cursor = None
         while True:
             channels, cursor = self._get_channels(cursor)
-            for channel in channels:
-                if channel["name"] == channel_name:
-                    return channel["id"]
+            yield from channels
             if not cursor:
-                return None
+                return
+
+    def _get_channel_id(self, channel_name: str) -> Optional[str]:
+        return find_channel_id(
+            channel_name, self._iter_channels(), self.directory_cache
+        )
+
+    def _join_channel_by_name(self, channel_name: str) -> bool:
+        if join_cached_channel(channel_name, self.directory_cache, self._join_channel):
+            return True
+        channel_id = self._get_channel_id(channel_name)
+        if not channel_id:
+            logger.info(f'Elementary app could not find the channel "{channel_name}".')
+            return False
+        return self._join_channel(channel_id=channel_id)
 
     def _join_channel(self, channel_id: str) -> bool:
         try:
@@ -213,14 +262,10 @@ class SlackWebClient(SlackClient):
             logger.info(
                 f'Elementary app is not in the channel "{channel_name}". Attempting to join.'
             )
-            channel_id = self._get_channel_id(channel_name)
-            if not channel_id:
-                logger.info(
-                    f'Elementary app could not find the channel "{channel_name}".'
-                )
-                return False
-            return self._join_channel(channel_id=channel_id)
+            return self._join_channel_by_name(channel_name)
         elif err_type == "channel_not_found":
+            if self.directory_cache:
+                self.directory_cache.invalidate_channel(channel_name)
             logger.error(
                 f"Channel {channel_name} was not found by the Elementary app. Please add the app to the channel."
             )
@@ -238,21 +283,23 @@ class SlackWebhookClient(SlackClient):
         is_workflow: bool,
         tracking: Optional[Tracking] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
+        session: Optional[requests.Session] = None,
     ):
         self.webhook = webhook
         self.is_workflow = is_workflow
+        self.session = session
         super().__init__(tracking, ssl_context)
 
     def _initial_client(self, ssl_context: Optional[ssl.SSLContext]):
+        # Both kinds of webhooks send through a pooled session, so consecutive messages reuse the connection.
+        session = self.session or create_http_session(ssl_context=ssl_context)
         if self.is_workflow:
-            # Workflow webhooks do not support the ssl_context parameter.
-            # requests.Session() uses the requests default CA bundle (certifi).
-            return requests.Session()
+            return session
 
-        return WebhookClient(
+        return PooledWebhookClient(
             url=self.webhook,
+            session=session,
             default_headers={"Content-type": "application/json"},
-            ssl=ssl_context,
         )
 
     @sleep_and_retry
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import google.auth  # type: ignore[import]
 from dateutil import tz
@@ -39,6 +39,14 @@ class Config:
 
     DEFAULT_GROUP_ALERTS_THRESHOLD = 100
 
+    DEFAULT_ALERTS_SEND_CONCURRENCY = 8
+
+    DEFAULT_WEBHOOK_TIMEOUT = 30
+
+    DEFAULT_WEBHOOK_POOL_MAXSIZE = 10
+
+    DEFAULT_SLACK_DIRECTORY_CACHE_TTL = 24 * 60 * 60
+
     def __init__(
         self,
         config_dir: str = DEFAULT_CONFIG_DIR,
@@ -54,6 +62,11 @@ class Config:
         slack_channel_name: Optional[str] = None,
         slack_group_alerts_by: Optional[str] = None,
         group_alerts_threshold: Optional[int] = None,
+        slack_directory_cache_ttl: Optional[int] = None,
+        alerts_send_concurrency: Optional[int] = None,
+        alerts_digest: Optional[bool] = None,
+        webhook_timeout: Optional[float] = None,
+        webhook_pool_maxsize: Optional[int] = None,
         timezone: Optional[str] = None,
         aws_profile_name: Optional[str] = None,
         aws_region_name: Optional[str] = None,
@@ -72,11 +85,14 @@ class Config:
         report_url: Optional[str] = None,
         teams_webhook: Optional[str] = None,
         maximum_columns_in_alert_samples: Optional[int] = None,
+        test_sample_rows_limit: Optional[int] = None,
+        test_sample_columns: Optional[List[str]] = None,
         env: str = DEFAULT_ENV,
         run_dbt_deps_if_needed: Optional[bool] = None,
         project_name: Optional[str] = None,
         quiet_logs: Optional[bool] = None,
         ssl_ca_bundle: Optional[str] = None,
+        bootstrap_cache_ttl: Optional[int] = None,
     ):
         self.config_dir = config_dir
         self.profiles_dir = profiles_dir
@@ -113,6 +129,17 @@ class Config:
             4,
         )
 
+        # Caps the sample rows fetched per test result, so a test with many failed rows can't blow up the payload.
+        # All the rows are fetched by default.
+        self.test_sample_rows_limit = self._first_not_none(
+            test_sample_rows_limit,
+            config.get("test_sample_rows_limit"),
+        )
+        self.test_sample_columns = self._first_not_none(
+            test_sample_columns,
+            config.get("test_sample_columns"),
+        )
+
         self.timezone = self._first_not_none(
             timezone,
             config.get("timezone"),
@@ -145,6 +172,38 @@ class Config:
             slack_config.get("group_alerts_threshold"),
             self.DEFAULT_GROUP_ALERTS_THRESHOLD,
         )
+        # Seconds to keep the Slack channel and user ids resolved by edr under the config dir, 0 to not keep them.
+        self.slack_directory_cache_ttl = self._first_not_none(
+            slack_directory_cache_ttl,
+            slack_config.get("directory_cache_ttl"),
+            self.DEFAULT_SLACK_DIRECTORY_CACHE_TTL,
+        )
+
+        # Alerts to different channels / webhooks are sent concurrently, each destination is rate limited separately.
+        self.alerts_send_concurrency = self._first_not_none(
+            alerts_send_concurrency,
+            config.get("alerts_send_concurrency"),
+            self.DEFAULT_ALERTS_SEND_CONCURRENCY,
+        )
+
+        # Packs consecutive alerts to the same destination into digest messages, as large as the platform allows.
+        self.alerts_digest = self._first_not_none(
+            alerts_digest,
+            config.get("alerts_digest"),
+            False,
+        )
+
+        # The webhook integrations keep their connections alive in a pool, these are its timeout and size.
+        self.webhook_timeout = self._first_not_none(
+            webhook_timeout,
+            config.get("webhook_timeout"),
+            self.DEFAULT_WEBHOOK_TIMEOUT,
+        )
+        self.webhook_pool_maxsize = self._first_not_none(
+            webhook_pool_maxsize,
+            config.get("webhook_pool_maxsize"),
+            self.DEFAULT_WEBHOOK_POOL_MAXSIZE,
+        )
 
         teams_config = config.get(self._TEAMS, {})
         self.teams_webhook = self._first_not_none(
@@ -229,6 +288,11 @@ class Config:
             config.get("ssl_ca_bundle"),
         )
 
+        # Seconds to reuse the environment details fetched when edr starts, 0 to fetch them on every run.
+        self.bootstrap_cache_ttl = self._first_not_none(
+            bootstrap_cache_ttl, config.get("bootstrap_cache_ttl"), 0
+        )
+
     def _load_configuration(self) -> dict:
         config_file_path = os.path.join(self.config_dir, self._CONFIG_FILE_NAME)
         if not os.path.exists(config_file_path):
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Generic, Optional, TypeVar
@@ -6,6 +7,7 @@ from elementary.messages.message_body import MessageBody
 from elementary.messages.messaging_integrations.exceptions import (
     MessageIntegrationReplyNotSupportedError,
 )
+from elementary.messages.packing import MessageSizeLimit
 from elementary.utils.log import get_logger
 from elementary.utils.pydantic_shim import BaseModel
 
@@ -38,6 +40,14 @@ class BaseMessagingIntegration(ABC, Generic[DestinationType, MessageContextType]
     ) -> MessageSendResult[MessageContextType]:
         raise NotImplementedError
 
+    async def async_send_message(
+        self,
+        destination: DestinationType,
+        body: MessageBody,
+    ) -> MessageSendResult[MessageContextType]:
+        # Integrations without an async client send the message from a worker thread, so the event loop isn't blocked.
+        return await asyncio.to_thread(self.send_message, destination, body)
+
     @abstractmethod
     def supports_reply(self) -> bool:
         raise NotImplementedError
@@ -45,6 +55,12 @@ class BaseMessagingIntegration(ABC, Generic[DestinationType, MessageContextType]
     def supports_actions(self) -> bool:
         return False
 
+    def get_message_size_limit(
+        self, destination: DestinationType
+    ) -> Optional[MessageSizeLimit]:
+        # Messages are sent as they are when the size limit of the platform isn't known.
+        return None
+
     def reply_to_message(
         self,
         destination: DestinationType,
@@ -54,3 +70,15 @@ class BaseMessagingIntegration(ABC, Generic[DestinationType, MessageContextType]
         if not self.supports_reply():
             raise MessageIntegrationReplyNotSupportedError(type(self).__name__)
         raise NotImplementedError
+
+    async def async_reply_to_message(
+        self,
+        destination: DestinationType,
+        message_context: MessageContextType,
+        body: MessageBody,
+    ) -> MessageSendResult[MessageContextType]:
+        if not self.supports_reply():
+            raise MessageIntegrationReplyNotSupportedError(type(self).__name__)
+        return await asyncio.to_thread(
+            self.reply_to_message, destination, message_context, body
+        )
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class MessagingIntegrationError(Exception):
     pass
 
@@ -6,3 +9,9 @@ class MessageIntegrationReplyNotSupportedError(MessagingIntegrationError):
     def __init__(self, integration_name: str):
         self.integration_name = integration_name
         super().__init__(f"{integration_name} does not support replying to messages")
+
+
+class MessagingIntegrationRateLimitError(MessagingIntegrationError):
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(message)
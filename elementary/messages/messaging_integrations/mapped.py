@@ -1,4 +1,4 @@
-from typing import Any, Generic, Mapping
+from typing import Any, Generic, Mapping, Optional
 
 from elementary.messages.message_body import MessageBody
 from elementary.messages.messaging_integrations.base_messaging_integration import (
@@ -9,6 +9,7 @@ from elementary.messages.messaging_integrations.base_messaging_integration impor
 from elementary.messages.messaging_integrations.exceptions import (
     MessagingIntegrationError,
 )
+from elementary.messages.packing import MessageSizeLimit
 
 
 class MappedMessagingIntegration(
@@ -33,6 +34,13 @@ class MappedMessagingIntegration(
             raise MessagingIntegrationError(f"Invalid destination: {destination}")
         return self._mapping[destination].send_message(None, body)
 
+    async def async_send_message(
+        self, destination: str, body: MessageBody
+    ) -> MessageSendResult[MessageContextType]:
+        if destination not in self._mapping:
+            raise MessagingIntegrationError(f"Invalid destination: {destination}")
+        return await self._mapping[destination].async_send_message(None, body)
+
     def supports_reply(self) -> bool:
         return all(
             integration.supports_reply() for integration in self._mapping.values()
@@ -43,9 +51,23 @@ class MappedMessagingIntegration(
             integration.supports_actions() for integration in self._mapping.values()
         )
 
+    def get_message_size_limit(self, destination: str) -> Optional[MessageSizeLimit]:
+        if destination not in self._mapping:
+            raise MessagingIntegrationError(f"Invalid destination: {destination}")
+        return self._mapping[destination].get_message_size_limit(None)
+
     def reply_to_message(
         self, destination: str, message_context: MessageContextType, body: MessageBody
     ) -> MessageSendResult[MessageContextType]:
         if destination not in self._mapping:
             raise MessagingIntegrationError(f"Invalid destination: {destination}")
         return self._mapping[destination].reply_to_message(None, message_context, body)
+
+    async def async_reply_to_message(
+        self, destination: str, message_context: MessageContextType, body: MessageBody
+    ) -> MessageSendResult[MessageContextType]:
+        if destination not in self._mapping:
+            raise MessagingIntegrationError(f"Invalid destination: {destination}")
+        return await self._mapping[destination].async_reply_to_message(
+            None, message_context, body
+        )
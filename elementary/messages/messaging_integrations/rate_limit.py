@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, TypeVar
+
+from elementary.messages.messaging_integrations.exceptions import (
+    MessagingIntegrationRateLimitError,
+)
+from elementary.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Used when a rate limited response doesn't say how long to wait.
+DEFAULT_RETRY_AFTER = 1.0
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+def get_retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """Returns the seconds to wait according to a Retry-After header (either seconds or an HTTP date)."""
+    for header_name, value in headers.items():
+        if header_name.lower() != "retry-after":
+            continue
+        # Some clients (like slack_sdk) keep every header's values as a list.
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else None
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class TokenBucket:
+    """Allows `calls` calls per `period` seconds on average, with bursts of up to `burst` calls."""
+
+    def __init__(
+        self,
+        calls: int,
+        period: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = calls / period
+        self.capacity = max(burst, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Takes a token if there is one, otherwise returns how long to wait for it."""
+        now = self._clock()
+        if now < self._updated_at:
+            # Paused.
+            return self._updated_at - now
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                wait_time = self._try_acquire()
+            if wait_time <= 0:
+                return
+            self._sleep(wait_time)
+
+    async def async_acquire(self) -> None:
+        while True:
+            with self._lock:
+                wait_time = self._try_acquire()
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+    def pause(self, seconds: float) -> None:
+        """Stops handing out tokens for the given seconds, then allows a single call before refilling."""
+        with self._lock:
+            self._updated_at = max(self._updated_at, self._clock() + seconds)
+            self._tokens = 1.0
+
+
+class DestinationRateLimiter:
+    """Rate limits calls per destination (a channel, a webhook...) with a token bucket for each of them.
+
+    Calls to different destinations don't wait for each other, so they can be sent concurrently. When a destination
+    responds that it is rate limited, its bucket is paused for the time it asked for and the call is retried.
+    """
+
+    def __init__(
+        self,
+        calls: int,
+        period: float,
+        burst: int = 1,
+        max_retries: int = MAX_RATE_LIMIT_RETRIES,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.calls = calls
+        self.period = period
+        self.burst = burst
+        self.max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[Hashable, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    def _get_bucket(self, destination: Hashable) -> TokenBucket:
+        with self._buckets_lock:
+            if destination not in self._buckets:
+                self._buckets[destination] = TokenBucket(
+                    self.calls, self.period, self.burst, self._clock, self._sleep
+                )
+            return self._buckets[destination]
+
+    def _handle_rate_limited(
+        self,
+        destination: Hashable,
+        bucket: TokenBucket,
+        err: MessagingIntegrationRateLimitError,
+        attempt: int,
+    ) -> None:
+        if attempt >= self.max_retries:
+            raise err
+        retry_after = (
+            err.retry_after if err.retry_after is not None else DEFAULT_RETRY_AFTER
+        )
+        logger.debug(
+            'Rate limited by destination "%s", retrying in %s seconds.',
+            destination,
+            retry_after,
+        )
+        bucket.pause(retry_after)
+
+    def call(self, destination: Hashable, func: Callable[[], T]) -> T:
+        bucket = self._get_bucket(destination)
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                return func()
+            except MessagingIntegrationRateLimitError as err:
+                self._handle_rate_limited(destination, bucket, err, attempt)
+                attempt += 1
+
+    async def async_call(
+        self, destination: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> T:
+        bucket = self._get_bucket(destination)
+        attempt = 0
+        while True:
+            # Waiting for the destination doesn't block the event loop (or a worker thread).
+            await bucket.async_acquire()
+            try:
+                return await func()
+            except MessagingIntegrationRateLimitError as err:
+                self._handle_rate_limited(destination, bucket, err, attempt)
+                attempt += 1
@@ -0,0 +1,205 @@
+import atexit
+import os
+import threading
+import time
+from typing import Callable, ClassVar, Dict, Iterable, Optional, Tuple
+
+from elementary.utils.hash import hash
+from elementary.utils.json_file_cache import JsonFileCache
+
+SLACK_DIRECTORY_CACHE_FILE_NAME = "slack_directory_cache.json"
+DEFAULT_SLACK_DIRECTORY_CACHE_TTL = 24 * 60 * 60
+# Users that weren't found might join the workspace soon, so they are looked up again sooner.
+DEFAULT_NOT_FOUND_CACHE_TTL = 60 * 60
+
+_CHANNELS = "channels"
+_USERS = "users"
+
+
+class SlackDirectoryCache:
+    """Channel ids by name and user ids by email, kept on disk between runs.
+
+    Resolving a channel pages through the workspace's channels and resolving a user calls Slack as well, both are
+    heavily rate limited. Entries are kept per workspace (by a hash of its token) and expire after `ttl` seconds.
+    Emails that don't belong to a user are cached too, for `not_found_ttl` seconds.
+    Updates are kept in memory and written by `flush`, along with what other runs wrote in the meantime.
+    """
+
+    _shared_caches: ClassVar[Dict[tuple, "SlackDirectoryCache"]] = {}
+    _shared_caches_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: str,
+        token: str,
+        ttl: float = DEFAULT_SLACK_DIRECTORY_CACHE_TTL,
+        not_found_ttl: float = DEFAULT_NOT_FOUND_CACHE_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache = JsonFileCache(
+            os.path.join(cache_dir, SLACK_DIRECTORY_CACHE_FILE_NAME)
+        )
+        # The token itself is never written to disk.
+        self.workspace_key = hash(token)
+        self.ttl = ttl
+        self.not_found_ttl = min(not_found_ttl, ttl)
+        self._clock = clock
+        self._directory: Optional[Dict[str, dict]] = None
+        # The updates that weren't written to the cache file yet (None removes an entry).
+        self._pending_updates: Dict[str, Dict[str, Optional[list]]] = {
+            _CHANNELS: {},
+            _USERS: {},
+        }
+        # Users are looked up from worker threads when alerts are sent concurrently.
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(
+        cls,
+        cache_dir: str,
+        token: str,
+        ttl: float = DEFAULT_SLACK_DIRECTORY_CACHE_TTL,
+    ) -> "SlackDirectoryCache":
+        """Returns the cache of the workspace that all the Slack clients of the process share.
+
+        Its updates are written when the process exits (and right away for listed channels).
+        """
+        key = (os.path.abspath(cache_dir), hash(token), ttl)
+        with cls._shared_caches_lock:
+            if key not in cls._shared_caches:
+                cache = cls(cache_dir, token, ttl=ttl)
+                atexit.register(cache.flush)
+                cls._shared_caches[key] = cache
+            return cls._shared_caches[key]
+
+    def get_channel_id(self, channel_name: str) -> Optional[str]:
+        with self._lock:
+            entry = self._get_directory()[_CHANNELS].get(channel_name)
+        return entry[0] if entry else None
+
+    def set_channel_ids(self, channel_ids: Dict[str, str]) -> None:
+        if not channel_ids:
+            return
+        now = self._clock()
+        self._update(
+            _CHANNELS,
+            {
+                channel_name: [channel_id, now]
+                for channel_name, channel_id in channel_ids.items()
+            },
+        )
+        # Listing the channels is what's expensive, so they're written right away.
+        self.flush()
+
+    def invalidate_channel(self, channel_name: str) -> None:
+        self._update(_CHANNELS, {channel_name: None})
+
+    def get_user_id(self, email: str) -> Tuple[bool, Optional[str]]:
+        """Returns whether the email is cached, and its user id (None if there's no such user)."""
+        with self._lock:
+            entry = self._get_directory()[_USERS].get(email)
+        if not entry:
+            return False, None
+        return True, entry[0]
+
+    def set_user_id(self, email: str, user_id: Optional[str]) -> None:
+        self._update(_USERS, {email: [user_id, self._clock()]})
+
+    def _is_fresh(self, entry: list, now: float) -> bool:
+        value, cached_at = entry
+        ttl = self.ttl if value is not None else self.not_found_ttl
+        return now - cached_at <= ttl
+
+    def _load_directory(self, cache: dict) -> Dict[str, dict]:
+        now = self._clock()
+        workspace_directory = cache.get(self.workspace_key) or {}
+        directory: Dict[str, dict] = {}
+        for section in (_CHANNELS, _USERS):
+            directory[section] = {
+                key: entry
+                for key, entry in (workspace_directory.get(section) or {}).items()
+                if self._is_fresh(entry, now)
+            }
+        return directory
+
+    def _get_directory(self) -> Dict[str, dict]:
+        if self._directory is None:
+            self._directory = self._load_directory(self.cache.load())
+        return self._directory
+
+    def _update(self, section: str, entries: Dict[str, Optional[list]]) -> None:
+        """Updates the given entries (None removes one), they're written to the cache file by the next flush."""
+        with self._lock:
+            self._apply_updates(self._get_directory(), {section: entries})
+            self._pending_updates[section].update(entries)
+
+    def flush(self) -> None:
+        """Writes the pending updates to the cache file, with what other runs wrote since the directory was loaded."""
+        with self._lock:
+            if not any(self._pending_updates.values()):
+                return
+            cache = self.cache.load()
+            directory = self._load_directory(cache)
+            self._apply_updates(directory, self._pending_updates)
+            self._pending_updates = {_CHANNELS: {}, _USERS: {}}
+            self._directory = directory
+            cache[self.workspace_key] = directory
+            self.cache.save(cache)
+
+    @staticmethod
+    def _apply_updates(
+        directory: Dict[str, dict], updates: Dict[str, Dict[str, Optional[list]]]
+    ) -> None:
+        for section, entries in updates.items():
+            for key, entry in entries.items():
+                if entry is None:
+                    directory[section].pop(key, None)
+                else:
+                    directory[section][key] = entry
+
+
+def find_channel_id(
+    channel_name: str,
+    channels: Iterable[dict],
+    directory_cache: Optional[SlackDirectoryCache],
+) -> Optional[str]:
+    """Returns the id of a channel from the directory cache, or else from the channels (listed lazily, up to it).
+
+    Every channel listed on the way is cached, so other channels are resolved without listing them again.
+    """
+    if directory_cache:
+        cached_channel_id = directory_cache.get_channel_id(channel_name)
+        if cached_channel_id:
+            return cached_channel_id
+
+    channel_ids: Dict[str, str] = {}
+    try:
+        for channel in channels:
+            channel_ids[channel["name"]] = channel["id"]
+            if channel["name"] == channel_name:
+                return channel["id"]
+        return None
+    finally:
+        if directory_cache:
+            directory_cache.set_channel_ids(channel_ids)
+
+
+def join_cached_channel(
+    channel_name: str,
+    directory_cache: Optional[SlackDirectoryCache],
+    join_channel: Callable[[str], bool],
+) -> bool:
+    """Joins a channel by its cached id, returns whether it was joined.
+
+    The cached id might be stale (the channel was recreated), so it's dropped if the channel can't be joined, and the
+    caller looks the channel up again.
+    """
+    if not directory_cache:
+        return False
+    cached_channel_id = directory_cache.get_channel_id(channel_name)
+    if not cached_channel_id:
+        return False
+    if join_channel(cached_channel_id):
+        return True
+    directory_cache.invalidate_channel(channel_name)
+    return False
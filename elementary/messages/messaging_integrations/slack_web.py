@@ -1,3 +1,4 @@
+import asyncio
 import json
 import ssl
 import time
@@ -20,7 +21,18 @@ from elementary.messages.messaging_integrations.base_messaging_integration impor
 )
 from elementary.messages.messaging_integrations.exceptions import (
     MessagingIntegrationError,
+    MessagingIntegrationRateLimitError,
 )
+from elementary.messages.messaging_integrations.rate_limit import (
+    DestinationRateLimiter,
+    get_retry_after,
+)
+from elementary.messages.messaging_integrations.slack_directory_cache import (
+    SlackDirectoryCache,
+    find_channel_id,
+    join_cached_channel,
+)
+from elementary.messages.packing import BlockKitSizeLimit, MessageSizeLimit
 from elementary.tracking.tracking_interface import Tracking
 from elementary.utils.log import get_logger
 from elementary.utils.pydantic_shim import BaseModel
@@ -47,11 +59,15 @@ class SlackWebMessagingIntegration(
         client: WebClient,
         tracking: Optional[Tracking] = None,
         reply_broadcast: bool = False,
+        directory_cache: Optional[SlackDirectoryCache] = None,
     ) -> None:
         self.client = client
         self.tracking = tracking
         self._email_to_user_id_cache: Dict[str, str] = {}
+        self.directory_cache = directory_cache
         self.reply_broadcast = reply_broadcast
+        # Slack allows posting about one message per second to each channel.
+        self._rate_limiter = DestinationRateLimiter(calls=1, period=ONE_SECOND)
 
     @classmethod
     def from_token(
@@ -74,6 +90,9 @@ class SlackWebMessagingIntegration(
     def supports_actions(self) -> bool:
         return True
 
+    def get_message_size_limit(self, destination: Channel) -> MessageSizeLimit:
+        return BlockKitSizeLimit()
+
     def send_message(
         self, destination: Channel, body: MessageBody
     ) -> MessageSendResult[SlackWebMessageContext]:
@@ -94,14 +113,70 @@ class SlackWebMessagingIntegration(
             reply_broadcast=self.reply_broadcast,
         )
 
-    @sleep_and_retry
-    @limits(calls=1, period=ONE_SECOND)
+    async def async_send_message(
+        self, destination: Channel, body: MessageBody
+    ) -> MessageSendResult[SlackWebMessageContext]:
+        # Formatting might look users up by their emails, which calls Slack as well.
+        formatted_message = await asyncio.to_thread(
+            format_block_kit, body, self.get_user_id_from_email
+        )
+        return await self._async_send_message(destination, formatted_message)
+
+    async def async_reply_to_message(
+        self,
+        destination: Channel,
+        message_context: SlackWebMessageContext,
+        body: MessageBody,
+    ) -> MessageSendResult[SlackWebMessageContext]:
+        formatted_message = await asyncio.to_thread(
+            format_block_kit, body, self.get_user_id_from_email
+        )
+        return await self._async_send_message(
+            destination,
+            formatted_message,
+            thread_ts=message_context.id,
+            reply_broadcast=self.reply_broadcast,
+        )
+
     def _send_message(
         self,
         destination: Channel,
         formatted_message: FormattedBlockKitMessage,
         thread_ts: Optional[str] = None,
         reply_broadcast: bool = False,
+    ) -> MessageSendResult[SlackWebMessageContext]:
+        return self._rate_limiter.call(
+            destination,
+            lambda: self._post_message(
+                destination, formatted_message, thread_ts, reply_broadcast
+            ),
+        )
+
+    async def _async_send_message(
+        self,
+        destination: Channel,
+        formatted_message: FormattedBlockKitMessage,
+        thread_ts: Optional[str] = None,
+        reply_broadcast: bool = False,
+    ) -> MessageSendResult[SlackWebMessageContext]:
+        # slack_sdk's async client requires aiohttp, so the blocking client is called from a worker thread.
+        return await self._rate_limiter.async_call(
+            destination,
+            lambda: asyncio.to_thread(
+                self._post_message,
+                destination,
+                formatted_message,
+                thread_ts,
+                reply_broadcast,
+            ),
+        )
+
+    def _post_message(
+        self,
+        destination: Channel,
+        formatted_message: FormattedBlockKitMessage,
+        thread_ts: Optional[str] = None,
+        reply_broadcast: bool = False,
     ) -> MessageSendResult[SlackWebMessageContext]:
         try:
             response = self.client.chat_postMessage(
@@ -132,9 +207,13 @@ class SlackWebMessagingIntegration(
             logger.info(
                 f'Elementary app is not in the channel "{channel_name}". Attempting to join.'
             )
-            channel_id = self._get_channel_id(channel_name, only_public=True)
-            self._join_channel(channel_id=channel_id)
+            self._join_channel_by_name(channel_name)
             logger.info(f"Joined channel {channel_name}")
+        elif err_type == "ratelimited":
+            raise MessagingIntegrationRateLimitError(
+                f"Rate limited while sending a message to channel - {channel_name}",
+                retry_after=get_retry_after(err.response.headers),
+            )
         elif err_type == "channel_not_found":
             raise MessagingIntegrationError(
                 f"Channel {channel_name} was not found by the Elementary app. Please add the app to the channel."
@@ -174,10 +253,29 @@ class SlackWebMessagingIntegration(
             yield from self._iter_channels(next_cursor, only_public, timeout_left)
 
     def _get_channel_id(self, channel_name: str, only_public: bool = False) -> str:
-        for channel in self._iter_channels(only_public=only_public):
-            if channel["name"] == channel_name:
-                return channel["id"]
-        raise MessagingIntegrationError(f"Channel {channel_name} not found")
+        channel_id = find_channel_id(
+            channel_name,
+            self._iter_channels(only_public=only_public),
+            self.directory_cache,
+        )
+        if not channel_id:
+            raise MessagingIntegrationError(f"Channel {channel_name} not found")
+        return channel_id
+
+    def _join_channel_by_name(self, channel_name: str) -> None:
+        if join_cached_channel(
+            channel_name, self.directory_cache, self._try_join_channel
+        ):
+            return
+        channel_id = self._get_channel_id(channel_name, only_public=True)
+        self._join_channel(channel_id=channel_id)
+
+    def _try_join_channel(self, channel_id: str) -> bool:
+        try:
+            self._join_channel(channel_id=channel_id)
+            return True
+        except MessagingIntegrationError:
+            return False
 
     def _join_channel(self, channel_id: str) -> None:
         try:
@@ -187,16 +285,28 @@ class SlackWebMessagingIntegration(
                 self.tracking.record_internal_exception(e)
             raise MessagingIntegrationError(f"Failed to join channel {channel_id}")
 
-    @sleep_and_retry
-    @limits(calls=50, period=ONE_MINUTE)
     def get_user_id_from_email(self, email: str) -> Optional[str]:
         if email in self._email_to_user_id_cache:
             return self._email_to_user_id_cache[email]
+        if self.directory_cache:
+            is_cached, cached_user_id = self.directory_cache.get_user_id(email)
+            if is_cached:
+                return cached_user_id
         try:
-            user_id = self.client.users_lookupByEmail(email=email)["user"]["id"]
+            user_id = self._lookup_user_id(email)
             self._email_to_user_id_cache[email] = user_id
+            if self.directory_cache:
+                self.directory_cache.set_user_id(email, user_id)
             return user_id
         except SlackApiError as err:
             if err.response.data["error"] != "users_not_found":
                 logger.error(f"Unable to get Slack user ID from email: {err}.")
+            elif self.directory_cache:
+                self.directory_cache.set_user_id(email, None)
             return None
+
+    # Only actual lookups are rate limited, cached users are returned right away.
+    @sleep_and_retry
+    @limits(calls=50, period=ONE_MINUTE)
+    def _lookup_user_id(self, email: str) -> str:
+        return self.client.users_lookupByEmail(email=email)["user"]["id"]
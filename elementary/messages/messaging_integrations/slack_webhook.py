@@ -1,11 +1,11 @@
+import asyncio
 import ssl
 from datetime import datetime, timezone
 from http import HTTPStatus
 from typing import Any, Optional
 
-from ratelimit import limits, sleep_and_retry
+import requests
 from slack_sdk import WebhookClient
-from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 from elementary.messages.formats.block_kit import (
     FormattedBlockKitMessage,
@@ -21,8 +21,15 @@ from elementary.messages.messaging_integrations.empty_message_context import (
 )
 from elementary.messages.messaging_integrations.exceptions import (
     MessagingIntegrationError,
+    MessagingIntegrationRateLimitError,
 )
+from elementary.messages.messaging_integrations.rate_limit import (
+    DestinationRateLimiter,
+    get_retry_after,
+)
+from elementary.messages.packing import BlockKitSizeLimit, MessageSizeLimit
 from elementary.tracking.tracking_interface import Tracking
+from elementary.utils.http_session import PooledWebhookClient, create_http_session
 
 ONE_SECOND = 1
 
@@ -35,6 +42,8 @@ class SlackWebhookMessagingIntegration(
     ) -> None:
         self.client = client
         self.tracking = tracking
+        # Slack allows posting about one message per second to each webhook.
+        self._rate_limiter = DestinationRateLimiter(calls=1, period=ONE_SECOND)
 
     @classmethod
     def from_url(
@@ -42,21 +51,32 @@ class SlackWebhookMessagingIntegration(
         url: str,
         tracking: Optional[Tracking] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
+        session: Optional[requests.Session] = None,
     ) -> "SlackWebhookMessagingIntegration":
-        client = WebhookClient(url, ssl=ssl_context)
-        client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=5))
+        # Rate limited messages are retried by the integration's rate limiter.
+        client = PooledWebhookClient(
+            url, session=session or create_http_session(ssl_context=ssl_context)
+        )
         return cls(client, tracking)
 
     def parse_message_context(self, context: dict[str, Any]) -> EmptyMessageContext:
         return EmptyMessageContext(**context)
 
-    @sleep_and_retry
-    @limits(calls=1, period=ONE_SECOND)
     def _send_message(self, formatted_message: FormattedBlockKitMessage) -> None:
+        self._rate_limiter.call(
+            self.client.url, lambda: self._post_message(formatted_message)
+        )
+
+    def _post_message(self, formatted_message: FormattedBlockKitMessage) -> None:
         response = self.client.send(
             blocks=formatted_message.blocks,
             attachments=formatted_message.attachments,
         )
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            raise MessagingIntegrationRateLimitError(
+                f"Rate limited by slack webhook - {self.client.url}",
+                retry_after=get_retry_after(response.headers),
+            )
         if response.status_code != HTTPStatus.OK:
             raise MessagingIntegrationError(
                 f"Could not post message to slack via webhook - {self.client.url}. Status code: {response.status_code}, Error: {response.body}"
@@ -73,5 +93,22 @@ class SlackWebhookMessagingIntegration(
             message_format="block_kit",
         )
 
+    async def async_send_message(
+        self, destination: None, body: MessageBody
+    ) -> MessageSendResult[EmptyMessageContext]:
+        formatted_message = format_block_kit(body)
+        await self._rate_limiter.async_call(
+            self.client.url,
+            lambda: asyncio.to_thread(self._post_message, formatted_message),
+        )
+        return MessageSendResult(
+            message_context=EmptyMessageContext(),
+            timestamp=datetime.now(tz=timezone.utc),
+            message_format="block_kit",
+        )
+
+    def get_message_size_limit(self, destination: None) -> MessageSizeLimit:
+        return BlockKitSizeLimit()
+
     def supports_reply(self) -> bool:
         return False
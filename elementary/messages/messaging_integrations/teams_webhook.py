@@ -1,10 +1,10 @@
+import asyncio
 import json
 from datetime import datetime, timezone
 from http import HTTPStatus
 from typing import Any, Optional
 
 import requests
-from ratelimit import limits, sleep_and_retry
 from typing_extensions import TypeAlias
 
 from elementary.messages.formats.adaptive_cards import format_adaptive_card
@@ -18,14 +18,21 @@ from elementary.messages.messaging_integrations.empty_message_context import (
 )
 from elementary.messages.messaging_integrations.exceptions import (
     MessagingIntegrationError,
+    MessagingIntegrationRateLimitError,
 )
+from elementary.messages.messaging_integrations.rate_limit import (
+    DestinationRateLimiter,
+    get_retry_after,
+)
+from elementary.messages.packing import AdaptiveCardsSizeLimit, MessageSizeLimit
+from elementary.utils.http_session import create_http_session
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
 
 
 Channel: TypeAlias = Optional[str]
-ONE_SECOND = 1
+THIRTY_SECONDS = 30
 
 
 class TeamsWebhookHttpError(MessagingIntegrationError):
@@ -45,7 +52,9 @@ class TeamsWebhookPayloadTooLargeError(MessagingIntegrationError):
         super().__init__(f"Teams webhook payload size{size_info} exceeds limit")
 
 
-def send_adaptive_card(webhook_url: str, card: dict) -> requests.Response:
+def send_adaptive_card(
+    webhook_url: str, card: dict, session: Optional[requests.Session] = None
+) -> requests.Response:
     payload = {
         "type": "message",
         "attachments": [
@@ -57,7 +66,7 @@ def send_adaptive_card(webhook_url: str, card: dict) -> requests.Response:
         ],
     }
 
-    response = requests.post(
+    response = (session or requests).post(
         webhook_url,
         json=payload,
         headers={"Content-Type": "application/json"},
@@ -73,23 +82,39 @@ def send_adaptive_card(webhook_url: str, card: dict) -> requests.Response:
 class TeamsWebhookMessagingIntegration(
     BaseMessagingIntegration[None, EmptyMessageContext]
 ):
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, session: Optional[requests.Session] = None) -> None:
         self.url = url
+        self.session = session or create_http_session()
+        # Teams webhooks are throttled above 4 requests per second and 60 requests per 30 seconds.
+        self._rate_limiter = DestinationRateLimiter(
+            calls=60, period=THIRTY_SECONDS, burst=4
+        )
 
     def parse_message_context(self, context: dict[str, Any]) -> EmptyMessageContext:
         return EmptyMessageContext(**context)
 
-    @sleep_and_retry
-    @limits(calls=1, period=ONE_SECOND)
     def send_message(
         self,
         destination: None,
         body: MessageBody,
     ) -> MessageSendResult[EmptyMessageContext]:
         card = format_adaptive_card(body)
+        return self._rate_limiter.call(self.url, lambda: self._send_card(card))
+
+    async def async_send_message(
+        self,
+        destination: None,
+        body: MessageBody,
+    ) -> MessageSendResult[EmptyMessageContext]:
+        card = format_adaptive_card(body)
+        return await self._rate_limiter.async_call(
+            self.url, lambda: asyncio.to_thread(self._send_card, card)
+        )
+
+    def _send_card(self, card: dict) -> MessageSendResult[EmptyMessageContext]:
         payload_json = json.dumps(card)
         try:
-            response = send_adaptive_card(self.url, card)
+            response = send_adaptive_card(self.url, card, self.session)
             # For the old teams webhook version of Teams simply returning status code 200
             # is not indicating that it was successful.
             # In that version they return some text if it was NOT successful, otherwise
@@ -113,11 +138,19 @@ class TeamsWebhookMessagingIntegration(
                 message_format="adaptive_cards",
             )
         except requests.HTTPError as e:
+            if e.response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                raise MessagingIntegrationRateLimitError(
+                    "Rate limited by Teams webhook",
+                    retry_after=get_retry_after(e.response.headers),
+                ) from e
             raise TeamsWebhookHttpError(e.response) from e
         except requests.RequestException as e:
             raise MessagingIntegrationError(
                 f"An error occurred while posting message to Teams webhook: {str(e)}"
             ) from e
 
+    def get_message_size_limit(self, destination: None) -> MessageSizeLimit:
+        return AdaptiveCardsSizeLimit()
+
     def supports_reply(self) -> bool:
         return False
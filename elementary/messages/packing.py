@@ -0,0 +1,182 @@
+import json
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, List, Optional, Sequence, Tuple, TypeVar
+
+from elementary.messages.blocks import (
+    DividerBlock,
+    ExpandableBlock,
+    FactListBlock,
+    LineBlock,
+    LinesBlock,
+    TableBlock,
+    TextBlock,
+    TextStyle,
+)
+from elementary.messages.formats.adaptive_cards import format_adaptive_card
+from elementary.messages.formats.block_kit import format_block_kit
+from elementary.messages.message_body import Color, MessageBlock, MessageBody
+
+T = TypeVar("T")
+
+# The most severe color of the packed messages is the color of the digest.
+_COLORS_SEVERITY = [Color.RED, Color.YELLOW, Color.GREEN]
+
+
+class MessageSizeLimit(ABC):
+    """The largest message a messaging platform accepts, measured on the message formatted for it."""
+
+    @abstractmethod
+    def fits(self, body: MessageBody) -> bool:
+        raise NotImplementedError
+
+
+class BlockKitSizeLimit(MessageSizeLimit):
+    # Slack rejects messages with more than 50 blocks, in the message itself or in an attachment.
+    MAX_BLOCKS = 50
+    MAX_PAYLOAD_SIZE = 40_000
+
+    def fits(self, body: MessageBody) -> bool:
+        formatted_message = format_block_kit(body)
+        if len(formatted_message.blocks) > self.MAX_BLOCKS or any(
+            len(attachment["blocks"]) > self.MAX_BLOCKS
+            for attachment in formatted_message.attachments
+        ):
+            return False
+        payload_size = len(json.dumps(formatted_message.blocks)) + len(
+            json.dumps(formatted_message.attachments)
+        )
+        return payload_size <= self.MAX_PAYLOAD_SIZE
+
+
+class AdaptiveCardsSizeLimit(MessageSizeLimit):
+    # Teams webhooks reject messages larger than 28KB, some of which is taken by the message around the card.
+    MAX_PAYLOAD_SIZE = 28 * 1024 - 1024
+
+    def fits(self, body: MessageBody) -> bool:
+        card = format_adaptive_card(body)
+        return len(json.dumps(card).encode("utf-8")) <= self.MAX_PAYLOAD_SIZE
+
+
+def _split_block(block: MessageBlock) -> Optional[List[MessageBlock]]:
+    """Splits a block that is too large by itself into smaller blocks, if it can be split."""
+    if isinstance(block, ExpandableBlock):
+        title = LinesBlock(
+            lines=[
+                LineBlock(inlines=[TextBlock(text=block.title, style=TextStyle.BOLD)])
+            ]
+        )
+        return [title, *block.body]
+    if isinstance(block, LinesBlock) and len(block.lines) > 1:
+        middle = len(block.lines) // 2
+        return [
+            LinesBlock(lines=block.lines[:middle]),
+            LinesBlock(lines=block.lines[middle:]),
+        ]
+    if isinstance(block, FactListBlock) and len(block.facts) > 1:
+        middle = len(block.facts) // 2
+        return [
+            FactListBlock(facts=block.facts[:middle]),
+            FactListBlock(facts=block.facts[middle:]),
+        ]
+    if isinstance(block, TableBlock) and len(block.rows) > 1:
+        middle = len(block.rows) // 2
+        return [
+            TableBlock(headers=block.headers, rows=block.rows[:middle]),
+            TableBlock(headers=block.headers, rows=block.rows[middle:]),
+        ]
+    return None
+
+
+def _strip_dividers(blocks: List[MessageBlock]) -> List[MessageBlock]:
+    start, end = 0, len(blocks)
+    while start < end and isinstance(blocks[start], DividerBlock):
+        start += 1
+    while end > start and isinstance(blocks[end - 1], DividerBlock):
+        end -= 1
+    return blocks[start:end]
+
+
+def split_message(body: MessageBody, size_limit: MessageSizeLimit) -> List[MessageBody]:
+    """Splits a message that is too large into consecutive messages that fit the size limit.
+
+    The blocks are kept in order, blocks that are too large by themselves are split as well when possible (lines,
+    facts and table rows) and otherwise sent in a message of their own. The first message keeps the message's id.
+    """
+    if size_limit.fits(body):
+        return [body]
+
+    def make_part(blocks: List[MessageBlock], is_first: bool) -> MessageBody:
+        return MessageBody(
+            blocks=blocks, color=body.color, id=body.id if is_first else None
+        )
+
+    parts: List[List[MessageBlock]] = []
+    current_part: List[MessageBlock] = []
+    pending_blocks: Deque[MessageBlock] = deque(body.blocks)
+    while pending_blocks:
+        block = pending_blocks.popleft()
+        if size_limit.fits(make_part([*current_part, block], is_first=not parts)):
+            current_part.append(block)
+        elif current_part:
+            parts.append(current_part)
+            current_part = []
+            pending_blocks.appendleft(block)
+        else:
+            split_blocks = _split_block(block)
+            if split_blocks:
+                pending_blocks.extendleft(reversed(split_blocks))
+            else:
+                parts.append([block])
+    if current_part:
+        parts.append(current_part)
+
+    # A divider at the edge of a part would only separate it from nothing.
+    stripped_parts = [_strip_dividers(part) for part in parts]
+    return [
+        make_part(part, is_first=index == 0)
+        for index, part in enumerate(part for part in stripped_parts if part)
+    ]
+
+
+def join_messages(bodies: Sequence[MessageBody]) -> MessageBody:
+    """Joins messages into a single digest message, separated by dividers."""
+    if len(bodies) == 1:
+        return bodies[0]
+    blocks: List[MessageBlock] = []
+    for body in bodies:
+        if blocks:
+            blocks.append(DividerBlock())
+        blocks.extend(body.blocks)
+    colors = {body.color for body in bodies}
+    color = next((color for color in _COLORS_SEVERITY if color in colors), None)
+    return MessageBody(blocks=blocks, color=color)
+
+
+def pack_messages(
+    messages: Sequence[Tuple[T, MessageBody]],
+    size_limit: MessageSizeLimit,
+    join: Callable[[Sequence[MessageBody]], MessageBody] = join_messages,
+) -> List[Tuple[List[T], MessageBody]]:
+    """Packs consecutive messages into as few digest messages as possible, each fitting the size limit.
+
+    Every message is given with the item it was built for, and every digest is returned with the items of the
+    messages it packed. A message that doesn't fit the size limit by itself is returned on its own.
+    """
+    packed_messages: List[Tuple[List[T], MessageBody]] = []
+    items: List[T] = []
+    bodies: List[MessageBody] = []
+    digest: Optional[MessageBody] = None
+    for item, body in messages:
+        if digest is not None:
+            candidate_digest = join([*bodies, body])
+            if size_limit.fits(candidate_digest):
+                items.append(item)
+                bodies.append(body)
+                digest = candidate_digest
+                continue
+            packed_messages.append((items, digest))
+        items, bodies, digest = [item], [body], join([body])
+    if digest is not None:
+        packed_messages.append((items, digest))
+    return packed_messages
@@ -1,8 +1,13 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional
 
 from elementary.monitor.data_monitoring.schema import (
+    ANY_OPERATORS,
+    NEGATIVE_OPERATORS,
     FilterFields,
+    FilterSchema,
     FiltersSchema,
+    FilterType,
     ResourceType,
     Status,
 )
@@ -11,9 +16,20 @@ from elementary.monitor.fetchers.alerts.schema.pending_alerts import (
     PendingAlertSchema,
 )
 from elementary.utils.log import get_logger
+from elementary.utils.pydantic_shim import BaseModel
 
 logger = get_logger(__name__)
 
+# Characters that JSON escapes don't appear as is in the raw alert data (and quotes are kept out of the query).
+_UNMATCHABLE_CHARS = {'"', "\\", "'"}
+
+
+class PendingAlertsQueryFilters(BaseModel):
+    # The alert types to fetch, None for all of them.
+    types: Optional[List[AlertTypes]] = None
+    # Groups of lowercase strings - an alert's data has to contain one of the strings of every group.
+    data_contains: List[List[str]] = []
+
 
 def get_string_ends(input_string: str, splitter: str) -> List[str]:
     parts = input_string.split(splitter)
@@ -87,6 +103,130 @@ def apply_filters_schema_on_alert(
     )
 
 
+class _CompiledFilter:
+    """A FilterSchema with its values normalized once, applied on already normalized values."""
+
+    def __init__(self, filter_schema: FilterSchema):
+        self.type = FilterType(filter_schema.type)
+        self.values: FrozenSet[str] = frozenset(
+            FilterSchema.normalize_values(filter_schema.values)
+        )
+
+    def apply(self, values: FrozenSet[str]) -> bool:
+        if not values:
+            return self.type in NEGATIVE_OPERATORS
+        if self.type == FilterType.IS:
+            return not self.values.isdisjoint(values)
+        if self.type == FilterType.IS_NOT:
+            return self.values.isdisjoint(values)
+        contains = any(
+            filter_value in value for value in values for filter_value in self.values
+        )
+        if self.type == FilterType.CONTAINS:
+            return contains
+        if self.type == FilterType.NOT_CONTAINS:
+            return not contains
+        raise ValueError(f"Unsupported filter type: {self.type}")
+
+
+class _CompiledNameFilter(_CompiledFilter):
+    """A filter on a dot separated name (a model unique id or a node name), that matches all of its suffixes.
+
+    Instead of expanding every name to its suffixes, the filter values are indexed by their last part, so only the
+    values that end like the name are checked.
+    """
+
+    def __init__(self, filter_schema: FilterSchema):
+        super().__init__(filter_schema)
+        self._values_by_last_part: Dict[str, List[str]] = defaultdict(list)
+        for value in self.values:
+            self._values_by_last_part[value.rsplit(".", 1)[-1]].append(value)
+
+    def _is_suffix_in_values(self, name: str) -> bool:
+        return any(
+            name == value or name.endswith(f".{value}")
+            for value in self._values_by_last_part.get(name.rsplit(".", 1)[-1], [])
+        )
+
+    def apply_on_name(self, name: Optional[str]) -> bool:
+        if not name:
+            return self.type in NEGATIVE_OPERATORS
+        name = FilterSchema.normalize_value(name)
+        if self.type == FilterType.IS:
+            return self._is_suffix_in_values(name)
+        if self.type == FilterType.IS_NOT:
+            return not self._is_suffix_in_values(name)
+        # Every suffix is a part of the name, so the name contains a value iff one of its suffixes does.
+        return self.apply(frozenset([name]))
+
+
+class CompiledFiltersSchema:
+    """A FiltersSchema compiled to a predicate on alerts, equivalent to apply_filters_schema_on_alert.
+
+    The filters' values are normalized once when compiling, so applying it on many alerts only normalizes the
+    alerts' own fields.
+    """
+
+    def __init__(self, filters_schema: FiltersSchema):
+        self._tags = [_CompiledFilter(f) for f in filters_schema.tags]
+        self._owners = [_CompiledFilter(f) for f in filters_schema.owners]
+        self._models = [_CompiledNameFilter(f) for f in filters_schema.models]
+        self._statuses = [_CompiledFilter(f) for f in filters_schema.statuses]
+        self._resource_types = [
+            _CompiledFilter(f) for f in filters_schema.resource_types
+        ]
+        self._node_names = (
+            _CompiledNameFilter(FilterSchema(values=filters_schema.node_names))
+            if filters_schema.node_names
+            else None
+        )
+        self._test_ids = [_CompiledFilter(f) for f in filters_schema.test_ids]
+
+    def __call__(self, alert: PendingAlertSchema) -> bool:
+        status = _safe_parse_status(alert.data.status)
+        if status is None:
+            return False
+        if self._statuses:
+            statuses = frozenset([FilterSchema.normalize_value(status)])
+            if not all(f.apply(statuses) for f in self._statuses):
+                return False
+        if self._resource_types:
+            resource_types = frozenset(
+                [FilterSchema.normalize_value(ResourceType(alert.data.resource_type))]
+            )
+            if not all(f.apply(resource_types) for f in self._resource_types):
+                return False
+        if self._tags:
+            tags = frozenset(FilterSchema.normalize_values(alert.data.tags or []))
+            if not all(f.apply(tags) for f in self._tags):
+                return False
+        if self._owners:
+            owners = frozenset(
+                FilterSchema.normalize_values(alert.data.unified_owners or [])
+            )
+            if not all(f.apply(owners) for f in self._owners):
+                return False
+        if not all(f.apply_on_name(alert.data.model_unique_id) for f in self._models):
+            return False
+        if self._node_names and not self._node_names.apply_on_name(
+            _get_alert_node_name(alert)
+        ):
+            return False
+        if self._test_ids:
+            test_unique_id = getattr(alert.data, "test_unique_id", None)
+            test_ids = frozenset(
+                FilterSchema.normalize_values(
+                    [test_unique_id] if test_unique_id else []
+                )
+            )
+            if not all(f.apply(test_ids) for f in self._test_ids):
+                return False
+        return True
+
+    def filter(self, alerts: Iterable[PendingAlertSchema]) -> List[PendingAlertSchema]:
+        return [alert for alert in alerts if self(alert)]
+
+
 def filter_alerts(
     alerts: List[PendingAlertSchema],
     alerts_filter: FiltersSchema = FiltersSchema(),
@@ -100,6 +240,65 @@ def filter_alerts(
         logger.warning("Invalid filter for alerts: %s", alerts_filter.selector)
         return []  # type: ignore[return-value]
 
-    return [
-        alert for alert in alerts if apply_filters_schema_on_alert(alert, alerts_filter)
-    ]
+    return CompiledFiltersSchema(alerts_filter).filter(alerts)
+
+
+def _can_match_raw_json(value: str) -> bool:
+    return (
+        value.isascii()
+        and value.isprintable()
+        and not _UNMATCHABLE_CHARS.intersection(value)
+    )
+
+
+def _get_data_contains_groups(
+    filter_schemas: Iterable[FilterSchema],
+) -> List[List[str]]:
+    data_contains = []
+    for filter_schema in filter_schemas:
+        # Negative filters can't be checked on the raw data, as the value might be in any of its fields.
+        if filter_schema.type not in ANY_OPERATORS:
+            continue
+        values = sorted(FilterSchema.normalize_values(filter_schema.values))
+        if values and all(_can_match_raw_json(value) for value in values):
+            data_contains.append(values)
+    return data_contains
+
+
+def get_pending_alerts_query_filters(
+    alerts_filter: FiltersSchema,
+) -> PendingAlertsQueryFilters:
+    """Translates the alerts filter to filters that the pending alerts query can apply in the warehouse.
+
+    The resource types are translated exactly. The other fields are in the alerts' JSON data, so they are only
+    narrowed down by substring matches on it - filter_alerts still has to apply the exact filter on the results.
+    """
+    types = None
+    for resource_types_filter in alerts_filter.resource_types:
+        matching_types = [
+            alert_type
+            for alert_type in AlertTypes
+            if resource_types_filter.apply_filter_on_value(
+                ResourceType(alert_type.value)
+            )
+        ]
+        types = (
+            matching_types
+            if types is None
+            else [alert_type for alert_type in types if alert_type in matching_types]
+        )
+
+    data_contains = _get_data_contains_groups(
+        [
+            *alerts_filter.tags,
+            *alerts_filter.owners,
+            *alerts_filter.models,
+            *alerts_filter.statuses,
+            *alerts_filter.test_ids,
+        ]
+    )
+    if alerts_filter.node_names:
+        data_contains.extend(
+            _get_data_contains_groups([FilterSchema(values=alerts_filter.node_names)])
+        )
+    return PendingAlertsQueryFilters(types=types, data_contains=data_contains)
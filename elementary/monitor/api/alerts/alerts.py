@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from elementary.clients.api.api_client import APIClient
 from elementary.clients.dbt.base_dbt_runner import BaseDbtRunner
 from elementary.config.config import Config
+from elementary.monitor.api.alerts.alert_filters import get_pending_alerts_query_filters
+from elementary.monitor.data_monitoring.schema import FiltersSchema
 from elementary.monitor.fetchers.alerts.alerts import AlertsFetcher
 from elementary.monitor.fetchers.alerts.schema.pending_alerts import PendingAlertSchema
 from elementary.utils.log import get_logger
@@ -24,8 +26,18 @@ class AlertsAPI(APIClient):
             config=self.config,
         )
 
-    def get_new_alerts(self, days_back: int) -> List[PendingAlertSchema]:
-        pending_alerts = self.alerts_fetcher.query_pending_alerts(days_back=days_back)
+    def get_new_alerts(
+        self, days_back: int, alerts_filter: Optional[FiltersSchema] = None
+    ) -> List[PendingAlertSchema]:
+        # The filter is only used to fetch less alerts, the results should still be filtered with filter_alerts.
+        query_filters = (
+            get_pending_alerts_query_filters(alerts_filter) if alerts_filter else None
+        )
+        pending_alerts = self.alerts_fetcher.query_pending_alerts(
+            days_back=days_back,
+            types=query_filters.types if query_filters else None,
+            data_contains=query_filters.data_contains if query_filters else None,
+        )
         return pending_alerts
 
     def get_alerts_last_sent_times(self, days_back: int) -> Dict[str, datetime]:
@@ -45,5 +57,5 @@ class AlertsAPI(APIClient):
     ) -> None:
         self.alerts_fetcher.skip_alerts(alerts_to_skip=alerts_to_skip)
 
-    def update_sent_alerts(self, alert_ids: List[str]) -> None:
-        self.alerts_fetcher.update_sent_alerts(alert_ids=alert_ids)
+    def update_sent_alerts(self, alert_ids: List[str]) -> bool:
+        return self.alerts_fetcher.update_sent_alerts(alert_ids=alert_ids)
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from elementary.clients.api.api_client import APIClient
 from elementary.clients.dbt.base_dbt_runner import BaseDbtRunner
@@ -65,3 +65,8 @@ class InvocationsAPI(APIClient):
 
     def get_models_latest_invocation(self) -> Dict[str, str]:
         return self.invocations_fetcher.get_models_latest_invocation()
+
+    def get_models_latest_invocations(
+        self,
+    ) -> Tuple[Dict[str, str], List[DbtInvocationSchema]]:
+        return self.invocations_fetcher.get_models_latest_invocations()
@@ -1,4 +1,3 @@
-import json
 import os
 import statistics
 from collections import defaultdict
@@ -20,16 +19,22 @@ from elementary.monitor.api.models.schema import (
 )
 from elementary.monitor.api.totals_schema import TotalsSchema
 from elementary.monitor.fetchers.models.models import ModelsFetcher
-from elementary.monitor.fetchers.models.schema import ArtifactSchemaType, ExposureSchema
+from elementary.monitor.fetchers.models.schema import (
+    ArtifactSchemaType,
+    DbtArtifactsSchema,
+    ExposureSchema,
+)
 from elementary.monitor.fetchers.models.schema import (
     ModelRunSchema as FetcherModelRunSchema,
 )
 from elementary.monitor.fetchers.models.schema import (
     ModelSchema,
+    ModelTestCoverage,
     SeedSchema,
     SnapshotSchema,
     SourceSchema,
 )
+from elementary.utils import json_utils
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -51,7 +56,7 @@ class ModelsAPI(APIClient):
     def get_models_runs(
         self, days_back: Optional[int] = 7, exclude_elementary_models: bool = False
     ) -> ModelRunsWithTotalsSchema:
-        model_runs_results = self.models_fetcher.get_models_runs(
+        model_runs_results = self.models_fetcher.iter_models_runs(
             days_back=days_back, exclude_elementary_models=exclude_elementary_models
         )
 
@@ -126,8 +131,19 @@ class ModelsAPI(APIClient):
         success_runs = len([run for run in runs if run.status == "success"])
         return TotalsModelRunsSchema(errors=error_runs, success=success_runs)
 
-    def get_seeds(self) -> Dict[str, NormalizedSeedSchema]:
-        seed_results = self.models_fetcher.get_seeds()
+    def get_artifacts(
+        self, exclude_elementary_models: bool = False
+    ) -> DbtArtifactsSchema:
+        """The artifacts the other getters normalize, fetched at once. Each getter fetches its own when not given."""
+        return self.models_fetcher.get_artifacts(
+            exclude_elementary_models=exclude_elementary_models
+        )
+
+    def get_seeds(
+        self, seed_results: Optional[List[SeedSchema]] = None
+    ) -> Dict[str, NormalizedSeedSchema]:
+        if seed_results is None:
+            seed_results = self.models_fetcher.get_seeds()
         seeds = dict()
         if seed_results:
             for seed_result in seed_results:
@@ -136,8 +152,11 @@ class ModelsAPI(APIClient):
                 seeds[seed_unique_id] = normalized_seed
         return seeds
 
-    def get_snapshots(self) -> Dict[str, NormalizedSnapshotSchema]:
-        snapshot_results = self.models_fetcher.get_snapshots()
+    def get_snapshots(
+        self, snapshot_results: Optional[List[SnapshotSchema]] = None
+    ) -> Dict[str, NormalizedSnapshotSchema]:
+        if snapshot_results is None:
+            snapshot_results = self.models_fetcher.get_snapshots()
         snapshots = dict()
         if snapshot_results:
             for snapshot_result in snapshot_results:
@@ -147,11 +166,14 @@ class ModelsAPI(APIClient):
         return snapshots
 
     def get_models(
-        self, exclude_elementary_models: bool = False
+        self,
+        exclude_elementary_models: bool = False,
+        models_results: Optional[List[ModelSchema]] = None,
     ) -> Dict[str, NormalizedModelSchema]:
-        models_results = self.models_fetcher.get_models(
-            exclude_elementary_models=exclude_elementary_models
-        )
+        if models_results is None:
+            models_results = self.models_fetcher.get_models(
+                exclude_elementary_models=exclude_elementary_models
+            )
         models = dict()
         if models_results:
             for model_result in models_results:
@@ -160,8 +182,11 @@ class ModelsAPI(APIClient):
                 models[model_unique_id] = normalized_model
         return models
 
-    def get_sources(self) -> Dict[str, NormalizedSourceSchema]:
-        sources_results = self.models_fetcher.get_sources()
+    def get_sources(
+        self, sources_results: Optional[List[SourceSchema]] = None
+    ) -> Dict[str, NormalizedSourceSchema]:
+        if sources_results is None:
+            sources_results = self.models_fetcher.get_sources()
         sources = dict()
         if sources_results:
             for source_result in sources_results:
@@ -178,8 +203,10 @@ class ModelsAPI(APIClient):
     def get_exposures(
         self,
         upstream_node_ids: Optional[List[str]] = None,
+        exposures_results: Optional[List[ExposureSchema]] = None,
     ) -> Dict[str, NormalizedExposureSchema]:
-        exposures_results = self.models_fetcher.get_exposures()
+        if exposures_results is None:
+            exposures_results = self.models_fetcher.get_exposures()
         exposures: Dict[str, NormalizedExposureSchema] = dict()
         if exposures_results:
             for exposure_result in exposures_results:
@@ -201,8 +228,11 @@ class ModelsAPI(APIClient):
             if self._exposure_has_upstream_node(exp, exposures, upstream_node_ids)
         }
 
-    def get_test_coverages(self) -> Dict[str, ModelCoverageSchema]:
-        coverage_results = self.models_fetcher.get_test_coverages()
+    def get_test_coverages(
+        self, coverage_results: Optional[List[ModelTestCoverage]] = None
+    ) -> Dict[str, ModelCoverageSchema]:
+        if coverage_results is None:
+            coverage_results = self.models_fetcher.get_test_coverages()
         coverages = dict()
         if coverage_results:
             for coverage_result in coverage_results:
@@ -296,7 +326,7 @@ class ModelsAPI(APIClient):
             SourceSchema: NormalizedSourceSchema,
         }
         artifact_name = artifact.name
-        normalized_artifact = json.loads(artifact.json())
+        normalized_artifact = json_utils.loads(artifact.json())
         normalized_artifact["model_name"] = artifact_name
 
         fqn = self._fqn(artifact)
@@ -37,7 +37,9 @@ from elementary.monitor.api.tests.schema import (
 from elementary.monitor.api.tests.tests import TestsAPI
 from elementary.monitor.api.totals_schema import TotalsSchema
 from elementary.monitor.data_monitoring.schema import SelectorFilterSchema
+from elementary.monitor.fetchers.models.schema import ExposureSchema
 from elementary.monitor.fetchers.tests.schema import NormalizedTestSchema
+from elementary.utils.task_scheduler import TaskScheduler
 from elementary.utils.time import get_now_utc_iso_format
 
 
@@ -64,9 +66,14 @@ class ReportAPI(APIClient):
         )
 
     def _get_exposures(
-        self, models_api: ModelsAPI, upstream_node_ids: Optional[List[str]] = None
+        self,
+        models_api: ModelsAPI,
+        upstream_node_ids: Optional[List[str]] = None,
+        exposures_results: Optional[List[ExposureSchema]] = None,
     ) -> Dict[str, NormalizedExposureSchema]:
-        return models_api.get_exposures(upstream_node_ids=upstream_node_ids)
+        return models_api.get_exposures(
+            upstream_node_ids=upstream_node_ids, exposures_results=exposures_results
+        )
 
     def get_report_data(
         self,
@@ -77,42 +84,131 @@ class ReportAPI(APIClient):
         project_name: Optional[str] = None,
         disable_samples: bool = False,
         skip_test_result_rows: bool = False,
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
         filter: SelectorFilterSchema = SelectorFilterSchema(),
         env: Optional[str] = None,
         warehouse_type: Optional[str] = None,
     ) -> Tuple[ReportDataSchema, Optional[Exception]]:
         try:
-            tests_api = TestsAPI(
-                dbt_runner=self.dbt_runner,
-                days_back=days_back,
-                invocations_per_test=test_runs_amount,
-                disable_passed_test_metrics=disable_passed_test_metrics,
-                skip_test_result_rows=skip_test_result_rows,
-            )
-            source_freshnesses_api = SourceFreshnessesAPI(
-                dbt_runner=self.dbt_runner,
-                days_back=days_back,
-                invocations_per_test=test_runs_amount,
-            )
             models_api = ModelsAPI(dbt_runner=self.dbt_runner)
             lineage_api = LineageAPI(dbt_runner=self.dbt_runner)
             filters_api = FiltersAPI(dbt_runner=self.dbt_runner)
             invocations_api = InvocationsAPI(dbt_runner=self.dbt_runner)
 
-            lineage_node_ids: List[str] = []
-            seeds = models_api.get_seeds()
-            lineage_node_ids.extend(seeds.keys())
-            snapshots = models_api.get_snapshots()
-            lineage_node_ids.extend(snapshots.keys())
-            models = models_api.get_models(exclude_elementary_models)
-            lineage_node_ids.extend(models.keys())
-            sources = models_api.get_sources()
-            lineage_node_ids.extend(sources.keys())
-            exposures = self._get_exposures(
-                models_api, upstream_node_ids=lineage_node_ids
+            # Independent fetches run concurrently when the dbt runner allows it (only the subprocess runner does,
+            # the API runner runs one command at a time), and a fetch only waits for the fetches it depends on.
+            scheduler = TaskScheduler(
+                max_workers=self.dbt_runner.max_concurrent_commands
+            )
+            scheduler.add_task(
+                "tests_api",
+                lambda: TestsAPI(
+                    dbt_runner=self.dbt_runner,
+                    days_back=days_back,
+                    invocations_per_test=test_runs_amount,
+                    disable_passed_test_metrics=disable_passed_test_metrics,
+                    skip_test_result_rows=skip_test_result_rows,
+                    sample_rows_limit=sample_rows_limit,
+                    sample_columns=sample_columns,
+                    # Results of older invocations are only needed when an invocation is selected.
+                    test_runs_history=not (
+                        filter.invocation_id
+                        or filter.invocation_time
+                        or filter.last_invocation
+                    ),
+                ),
+            )
+            scheduler.add_task(
+                "source_freshnesses_api",
+                lambda: SourceFreshnessesAPI(
+                    dbt_runner=self.dbt_runner,
+                    days_back=days_back,
+                    invocations_per_test=test_runs_amount,
+                ),
+            )
+            # The dbt artifacts are fetched in a single dbt invocation.
+            scheduler.add_task(
+                "artifacts", lambda: models_api.get_artifacts(exclude_elementary_models)
+            )
+            scheduler.add_task(
+                "seeds",
+                lambda artifacts: models_api.get_seeds(artifacts.seeds),
+                depends_on=["artifacts"],
+            )
+            scheduler.add_task(
+                "snapshots",
+                lambda artifacts: models_api.get_snapshots(artifacts.snapshots),
+                depends_on=["artifacts"],
+            )
+            scheduler.add_task(
+                "models",
+                lambda artifacts: models_api.get_models(
+                    exclude_elementary_models, models_results=artifacts.models
+                ),
+                depends_on=["artifacts"],
+            )
+            scheduler.add_task(
+                "sources",
+                lambda artifacts: models_api.get_sources(artifacts.sources),
+                depends_on=["artifacts"],
             )
-            lineage_node_ids.extend(exposures.keys())
-            singular_tests = tests_api.get_singular_tests()
+            scheduler.add_task(
+                "exposures",
+                lambda artifacts, seeds, snapshots, models, sources: self._get_exposures(
+                    models_api,
+                    upstream_node_ids=[*seeds, *snapshots, *models, *sources],
+                    exposures_results=artifacts.exposures,
+                ),
+                depends_on=["artifacts", "seeds", "snapshots", "models", "sources"],
+            )
+            scheduler.add_task(
+                "lineage",
+                lambda seeds, snapshots, models, sources, exposures: lineage_api.get_lineage(
+                    [*seeds, *snapshots, *models, *sources, *exposures],
+                    exclude_elementary_models,
+                ),
+                depends_on=["seeds", "snapshots", "models", "sources", "exposures"],
+            )
+            scheduler.add_task(
+                "tests_and_singular_tests",
+                lambda tests_api: tests_api.get_tests_and_singular_tests(),
+                depends_on=["tests_api"],
+            )
+            scheduler.add_task(
+                "models_runs",
+                lambda: models_api.get_models_runs(
+                    days_back=days_back,
+                    exclude_elementary_models=exclude_elementary_models,
+                ),
+            )
+            scheduler.add_task(
+                "coverages",
+                lambda artifacts: models_api.get_test_coverages(artifacts.coverages),
+                depends_on=["artifacts"],
+            )
+            scheduler.add_task(
+                "test_invocation",
+                lambda: invocations_api.get_test_invocation_from_filter(filter),
+            )
+            scheduler.add_task(
+                "latest_invocations", invocations_api.get_models_latest_invocations
+            )
+            fetched = scheduler.run()
+
+            tests_api = fetched["tests_api"]
+            source_freshnesses_api = fetched["source_freshnesses_api"]
+            seeds = fetched["seeds"]
+            snapshots = fetched["snapshots"]
+            models = fetched["models"]
+            sources = fetched["sources"]
+            exposures = fetched["exposures"]
+            models_runs = fetched["models_runs"]
+            coverages = fetched["coverages"]
+            tests, singular_tests = fetched["tests_and_singular_tests"]
+            test_invocation = fetched["test_invocation"]
+            lineage = fetched["lineage"]
+            models_latest_invocation, invocations = fetched["latest_invocations"]
 
             groups = self._get_groups(
                 models.values(),
@@ -123,14 +219,6 @@ class ReportAPI(APIClient):
                 singular_tests,
             )
 
-            models_runs = models_api.get_models_runs(
-                days_back=days_back, exclude_elementary_models=exclude_elementary_models
-            )
-            coverages = models_api.get_test_coverages()
-
-            tests = tests_api.get_tests()
-            test_invocation = invocations_api.get_test_invocation_from_filter(filter)
-
             test_results = tests_api.get_test_results(
                 invocation_id=test_invocation.invocation_id,
                 disable_samples=disable_samples,
@@ -159,9 +247,6 @@ class ReportAPI(APIClient):
 
             test_runs_totals = get_total_test_runs(union_test_runs)
 
-            lineage = lineage_api.get_lineage(
-                lineage_node_ids, exclude_elementary_models
-            )
             filters = filters_api.get_filters(
                 test_results_totals,
                 test_runs_totals,
@@ -192,9 +277,6 @@ class ReportAPI(APIClient):
             serializable_filters = filters.dict()
             serializable_lineage = lineage.dict()
 
-            models_latest_invocation = invocations_api.get_models_latest_invocation()
-            invocations = invocations_api.get_models_latest_invocations_data()
-
             invocations_job_identification = defaultdict(list)
             for invocation in invocations:
                 invocation_key = invocation.job_name or invocation.job_id
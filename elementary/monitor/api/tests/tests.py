@@ -1,7 +1,7 @@
 import re
 import statistics
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Union, cast
+from typing import DefaultDict, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from dateutil import tz
 
@@ -31,6 +31,7 @@ from elementary.monitor.fetchers.tests.schema import (
     NormalizedTestSchema,
     TestDBRowSchema,
     TestResultDBRowSchema,
+    TestRunHistoryDBRowSchema,
 )
 from elementary.monitor.fetchers.tests.tests import TestsFetcher
 from elementary.utils.log import get_logger
@@ -47,14 +48,30 @@ class TestsAPI(APIClient):
         invocations_per_test: int = 720,
         disable_passed_test_metrics: bool = False,
         skip_test_result_rows: bool = False,
+        test_runs_history: bool = False,
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
     ):
         super().__init__(dbt_runner)
         self.tests_fetcher = TestsFetcher(dbt_runner=self.dbt_runner)
+        # History mode - the test runs history is aggregated in the warehouse and only the latest results are fetched
+        # in full. The results of older invocations are then unavailable, so it's for when no invocation is selected.
+        self.tests_invocations = (
+            self._get_tests_invocations_from_history(
+                days_back=days_back, invocations_per_test=invocations_per_test
+            )
+            if test_runs_history
+            else None
+        )
         self.test_results_db_rows = self._get_test_results_db_rows(
             days_back=days_back,
-            invocations_per_test=invocations_per_test,
+            invocations_per_test=(
+                1 if self.tests_invocations is not None else invocations_per_test
+            ),
             disable_passed_test_metrics=disable_passed_test_metrics,
             skip_test_result_rows=skip_test_result_rows,
+            sample_rows_limit=sample_rows_limit,
+            sample_columns=sample_columns,
         )
 
     def _get_test_results_db_rows(
@@ -63,12 +80,19 @@ class TestsAPI(APIClient):
         invocations_per_test: int = 720,
         disable_passed_test_metrics: bool = False,
         skip_test_result_rows: bool = False,
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
     ) -> List[TestResultDBRowSchema]:
-        return self.tests_fetcher.get_all_test_results_db_rows(
-            days_back=days_back,
-            invocations_per_test=invocations_per_test,
-            disable_passed_test_metrics=disable_passed_test_metrics,
-            skip_test_result_rows=skip_test_result_rows,
+        # Rows are validated one at a time, so the decoded results are never held next to the parsed rows.
+        return list(
+            self.tests_fetcher.iter_all_test_results_db_rows(
+                days_back=days_back,
+                invocations_per_test=invocations_per_test,
+                disable_passed_test_metrics=disable_passed_test_metrics,
+                skip_test_result_rows=skip_test_result_rows,
+                sample_rows_limit=sample_rows_limit,
+                sample_columns=sample_columns,
+            )
         )
 
     def get_test_results_summary(
@@ -153,7 +177,20 @@ class TestsAPI(APIClient):
         return self.tests_fetcher.get_singular_tests()
 
     def get_tests(self) -> Dict[str, TestSchema]:
-        tests_db_rows = self.tests_fetcher.get_tests()
+        return self._get_tests_by_id(self.tests_fetcher.get_tests())
+
+    def get_tests_and_singular_tests(
+        self,
+    ) -> Tuple[Dict[str, TestSchema], List[NormalizedTestSchema]]:
+        (
+            tests_db_rows,
+            singular_tests,
+        ) = self.tests_fetcher.get_tests_and_singular_tests()
+        return self._get_tests_by_id(tests_db_rows), singular_tests
+
+    def _get_tests_by_id(
+        self, tests_db_rows: List[TestDBRowSchema]
+    ) -> Dict[str, TestSchema]:
         return {
             test_db_row.unique_id: self._parse_test_db_row(test_db_row)
             for test_db_row in tests_db_rows
@@ -203,7 +240,11 @@ class TestsAPI(APIClient):
         return tests_results
 
     def get_test_runs(self) -> Dict[str, List[TestRunSchema]]:
-        tests_invocations = self._get_invocations(self.test_results_db_rows)
+        tests_invocations = (
+            self.tests_invocations
+            if self.tests_invocations is not None
+            else self._get_invocations(self.test_results_db_rows)
+        )
         latest_test_results = [
             test_result
             for test_result in self.test_results_db_rows
@@ -297,6 +338,63 @@ class TestsAPI(APIClient):
 
         return test_invocations
 
+    def _get_tests_invocations_from_history(
+        self, days_back: int, invocations_per_test: int
+    ) -> Optional[Dict[str, InvocationsSchema]]:
+        try:
+            return self._get_invocations_from_history(
+                self.tests_fetcher.iter_test_runs_history(
+                    days_back=days_back, invocations_per_test=invocations_per_test
+                )
+            )
+        except Exception:
+            logger.warning(
+                "Could not fetch the test runs history, falling back to fetching all the test results.",
+                exc_info=True,
+            )
+            return None
+
+    def _get_invocations_from_history(
+        self, test_runs_history_rows: Iterable[TestRunHistoryDBRowSchema]
+    ) -> Dict[str, InvocationsSchema]:
+        test_invocations: Dict[str, InvocationsSchema] = dict()
+        for test_run_history_row in test_runs_history_rows:
+            elementary_unique_id = test_run_history_row.elementary_unique_id
+            if elementary_unique_id not in test_invocations:
+                totals = TotalsSchema(
+                    errors=test_run_history_row.errors,
+                    warnings=test_run_history_row.warnings,
+                    passed=test_run_history_row.passed,
+                    failures=test_run_history_row.failures,
+                )
+                invocations_count = test_run_history_row.invocations_count
+                test_invocations[elementary_unique_id] = InvocationsSchema(
+                    fail_rate=(
+                        round((totals.errors + totals.failures) / invocations_count, 2)
+                        if invocations_count
+                        else 0
+                    ),
+                    totals=totals,
+                    invocations=[],
+                    description=self._get_invocations_description(totals),
+                )
+            test_invocations[elementary_unique_id].invocations.append(
+                InvocationSchema(
+                    id=test_run_history_row.invocation_id,
+                    time_utc=test_run_history_row.detected_at,
+                    status=test_run_history_row.status,
+                    execution_time=test_run_history_row.execution_time,
+                    affected_rows=(
+                        self._parse_affected_row(
+                            test_run_history_row.results_description
+                        )
+                        if test_run_history_row.results_description
+                        else None
+                    ),
+                )
+            )
+        return test_invocations
+
     @staticmethod
     def _get_test_invocations_totals(
         invocations: List[InvocationSchema],
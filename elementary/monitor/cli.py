@@ -37,6 +37,19 @@ def common_options(cmd: str):
             default=Config.DEFAULT_TARGET_PATH,
             help="Absolute target path for saving edr files such as logs and reports",
         )(func)
+        func = click.option(
+            "--test-sample-columns",
+            type=str,
+            default=None,
+            help="A comma-separated list of the columns to keep in test result samples. By default all the columns "
+            "are kept.",
+        )(func)
+        func = click.option(
+            "--test-sample-rows-limit",
+            type=int,
+            default=None,
+            help="Maximum number of sample rows fetched per test result. By default all the rows are fetched.",
+        )(func)
         func = click.option(
             "--disable-samples",
             type=bool,
@@ -223,6 +236,13 @@ def get_cli_properties() -> dict:
     default=Config.DEFAULT_GROUP_ALERTS_THRESHOLD,
     help="The threshold for all alerts in a single message.",
 )
+@click.option(
+    "--alerts-send-concurrency",
+    type=int,
+    default=None,
+    help="The maximal number of destinations (channels / webhooks) to send alerts to concurrently "
+    f"(default is {Config.DEFAULT_ALERTS_SEND_CONCURRENCY}).",
+)
 @click.option(
     "--timezone",
     "-tz",
@@ -316,6 +336,7 @@ def monitor(
     slack_token,
     slack_channel_name,
     group_alerts_threshold,
+    alerts_send_concurrency,
     timezone,
     config_dir,
     profiles_dir,
@@ -328,6 +349,8 @@ def monitor(
     dbt_vars,
     test,
     disable_samples,
+    test_sample_rows_limit,
+    test_sample_columns,
     env,
     select,
     group_by,
@@ -368,6 +391,7 @@ def monitor(
         slack_token=slack_token,
         slack_channel_name=slack_channel_name,
         group_alerts_threshold=group_alerts_threshold,
+        alerts_send_concurrency=alerts_send_concurrency,
         timezone=timezone,
         env=env,
         slack_group_alerts_by=group_by,
@@ -375,6 +399,10 @@ def monitor(
         teams_webhook=teams_webhook,
         maximum_columns_in_alert_samples=maximum_columns_in_alert_samples,
         quiet_logs=quiet_logs,
+        test_sample_rows_limit=test_sample_rows_limit,
+        test_sample_columns=(
+            test_sample_columns.split(",") if test_sample_columns else None
+        ),
         ssl_ca_bundle=ssl_ca_bundle,
     )
     anonymous_tracking = AnonymousCommandLineTracking(config)
@@ -466,6 +494,8 @@ def report(
     open_browser,
     exclude_elementary_models,
     disable_samples,
+    test_sample_rows_limit,
+    test_sample_columns,
     project_name,
     env,
     select,
@@ -485,6 +515,10 @@ def report(
         dbt_quoting=dbt_quoting,
         env=env,
         quiet_logs=quiet_logs,
+        test_sample_rows_limit=test_sample_rows_limit,
+        test_sample_columns=(
+            test_sample_columns.split(",") if test_sample_columns else None
+        ),
     )
     anonymous_tracking = AnonymousCommandLineTracking(config)
     anonymous_tracking.set_env("use_select", bool(select))
@@ -696,6 +730,8 @@ def send_report(
     gcs_timeout_limit,
     exclude_elementary_models,
     disable_samples,
+    test_sample_rows_limit,
+    test_sample_columns,
     project_name,
     env,
     select,
@@ -747,6 +783,10 @@ def send_report(
         env=env,
         project_name=project_name,
         quiet_logs=quiet_logs,
+        test_sample_rows_limit=test_sample_rows_limit,
+        test_sample_columns=(
+            test_sample_columns.split(",") if test_sample_columns else None
+        ),
         ssl_ca_bundle=ssl_ca_bundle,
     )
     anonymous_tracking = AnonymousCommandLineTracking(config)
@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import time
+from typing import Iterable, List, Set
+
+from elementary.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+ALERTS_OUTBOX_FILE_NAME = "alerts_outbox.db"
+
+PENDING_STATUS = "pending"
+DELIVERED_STATUS = "delivered"
+
+
+class AlertsOutbox:
+    """The delivery status of the alerts being sent, kept in a SQLite file so a run that dies midway can be resumed.
+
+    Alerts are written to the outbox before they are sent, and each of them is marked as delivered (and committed) as
+    soon as its message is sent. The warehouse is only updated with the sent alerts at the end of a run, so a run that
+    didn't get there leaves its delivered alerts in the outbox - the next run skips them instead of sending them
+    again, and flushes them to the warehouse along with its own.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        # Every status update is committed on its own, the write-ahead log keeps these commits cheap.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS alerts ("
+                "alert_id TEXT PRIMARY KEY, status TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def get_delivered_alert_ids(self) -> Set[str]:
+        rows = self._connection.execute(
+            "SELECT alert_id FROM alerts WHERE status = ?", (DELIVERED_STATUS,)
+        )
+        return {alert_id for (alert_id,) in rows}
+
+    def add_pending(self, alert_ids: Iterable[str]) -> None:
+        self._set_status(alert_ids, PENDING_STATUS)
+
+    def mark_delivered(self, alert_ids: Iterable[str]) -> None:
+        self._set_status(alert_ids, DELIVERED_STATUS)
+
+    def remove(self, alert_ids: List[str]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM alerts WHERE alert_id = ?",
+                [(alert_id,) for alert_id in alert_ids],
+            )
+
+    def clear_pending(self) -> None:
+        """Alerts that weren't delivered are still pending in the warehouse, so they are fetched again by the next run."""
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM alerts WHERE status = ?", (PENDING_STATUS,)
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _set_status(self, alert_ids: Iterable[str], status: str) -> None:
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO alerts (alert_id, status, updated_at) VALUES (?, ?, ?)",
+                [(alert_id, status, now) for alert_id in alert_ids],
+            )
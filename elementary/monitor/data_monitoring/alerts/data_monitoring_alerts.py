@@ -1,7 +1,10 @@
+import asyncio
 import json
+import os
+import sqlite3
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import DefaultDict, Dict, List, Optional, Union
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
 
 from alive_progress import alive_bar
 
@@ -22,6 +25,7 @@ from elementary.messages.messaging_integrations.base_messaging_integration impor
 from elementary.messages.messaging_integrations.exceptions import (
     MessagingIntegrationError,
 )
+from elementary.messages.packing import join_messages, pack_messages, split_message
 from elementary.monitor.alerts.alert import AlertModel
 from elementary.monitor.alerts.alert_messages.builder import (
     AlertMessageBuilder,
@@ -35,6 +39,10 @@ from elementary.monitor.alerts.source_freshness_alert import SourceFreshnessAler
 from elementary.monitor.alerts.test_alert import TestAlertModel
 from elementary.monitor.api.alerts.alert_filters import filter_alerts
 from elementary.monitor.api.alerts.alerts import AlertsAPI
+from elementary.monitor.data_monitoring.alerts.alerts_outbox import (
+    ALERTS_OUTBOX_FILE_NAME,
+    AlertsOutbox,
+)
 from elementary.monitor.data_monitoring.alerts.integrations.base_integration import (
     BaseIntegration,
 )
@@ -51,6 +59,14 @@ from elementary.utils.time import convert_time_to_timezone
 
 logger = get_logger(__name__)
 
+AlertModelType = Union[
+    TestAlertModel,
+    ModelAlertModel,
+    SourceFreshnessAlertModel,
+    GroupedByTableAlerts,
+    AlertsGroup,
+]
+
 
 def get_health_check_message() -> MessageBody:
     return MessageBody(
@@ -67,6 +83,12 @@ def get_health_check_message() -> MessageBody:
     )
 
 
+def _get_alert_ids(alert: AlertModelType) -> List[str]:
+    if isinstance(alert, AlertsGroup):
+        return [inner_alert.id for inner_alert in alert.alerts]
+    return [alert.id]
+
+
 def _add_elementary_attribution(body: MessageBody) -> MessageBody:
     lines = [
         LineBlock(
@@ -152,8 +174,13 @@ class DataMonitoringAlerts(DataMonitoring):
         vars = dbt_vars or dict()
         if days_back:
             vars.update(days_back=days_back)
+        if self.config.test_sample_rows_limit is not None:
+            vars.update(test_sample_rows_limit=self.config.test_sample_rows_limit)
+        if self.config.test_sample_columns:
+            vars.update(test_sample_columns=self.config.test_sample_columns)
+        # The population only scans source rows newer than its watermark, which lives in its own table.
         success = self.internal_dbt_runner.run(
-            select="elementary_cli.alerts.alerts_v2",
+            select="elementary_cli.alerts.alerts_population_watermarks elementary_cli.alerts.alerts_v2",
             full_refresh=dbt_full_refresh,
             vars=vars,
         )
@@ -166,6 +193,7 @@ class DataMonitoringAlerts(DataMonitoring):
     def _fetch_data(self, days_back: int) -> List[PendingAlertSchema]:
         return self.alerts_api.get_new_alerts(
             days_back=days_back,
+            alerts_filter=self.selector_filter,
         )
 
     def _filter_data(self, data: List[PendingAlertSchema]) -> List[PendingAlertSchema]:
@@ -343,6 +371,12 @@ class DataMonitoringAlerts(DataMonitoring):
             integration=self.alerts_integration, body=test_message, metadata={}
         )
 
+    def _build_alert_message(self, alert: AlertModelType) -> MessageBody:
+        alert_message_body = self.alert_message_builder.build(
+            alert=alert,
+        )
+        return _add_elementary_attribution(alert_message_body)
+
     def _send_alert(
         self,
         alert: Union[
@@ -355,10 +389,7 @@ class DataMonitoringAlerts(DataMonitoring):
     ) -> bool:
         if isinstance(self.alerts_integration, BaseIntegration):
             return self.alerts_integration.send_alert(alert)
-        alert_message_body = self.alert_message_builder.build(
-            alert=alert,
-        )
-        alert_message_body = _add_elementary_attribution(alert_message_body)
+        alert_message_body = self._build_alert_message(alert)
         try:
             self._send_message(
                 integration=self.alerts_integration,
@@ -370,54 +401,269 @@ class DataMonitoringAlerts(DataMonitoring):
             logger.error(f"Could not send the alert - {type(alert)}.")
             return False
 
+    async def _async_send_alert(
+        self,
+        integration: BaseMessagingIntegration,
+        alert: AlertModelType,
+        destination: Any,
+    ) -> bool:
+        alert_message_body = self._build_alert_message(alert)
+        sent_successfully = await self._async_send_alert_message(
+            integration, alert_message_body, destination
+        )
+        if not sent_successfully:
+            logger.error(f"Could not send the alert - {type(alert)}.")
+        return sent_successfully
+
+    async def _async_send_alert_message(
+        self,
+        integration: BaseMessagingIntegration,
+        body: MessageBody,
+        destination: Any,
+    ) -> bool:
+        """Sends an alert message, split into a thread of messages if it is too large for the platform.
+
+        When the integration can't reply, the continuations are sent as separate messages after the first one.
+        """
+        size_limit = integration.get_message_size_limit(destination)
+        message_parts = split_message(body, size_limit) if size_limit else [body]
+        try:
+            send_result = await integration.async_send_message(
+                destination=destination, body=message_parts[0]
+            )
+            for message_part in message_parts[1:]:
+                if integration.supports_reply() and send_result.message_context:
+                    await integration.async_reply_to_message(
+                        destination=destination,
+                        message_context=send_result.message_context,
+                        body=message_part,
+                    )
+                else:
+                    await integration.async_send_message(
+                        destination=destination, body=message_part
+                    )
+            return True
+        except MessagingIntegrationError:
+            return False
+
+    def _pack_alert_messages(
+        self,
+        integration: BaseMessagingIntegration,
+        alerts: List[AlertModelType],
+        destination: Any,
+    ) -> List[Tuple[List[AlertModelType], MessageBody]]:
+        size_limit = integration.get_message_size_limit(destination)
+        if size_limit is None:
+            return [([alert], self._build_alert_message(alert)) for alert in alerts]
+        return pack_messages(
+            [
+                (alert, self.alert_message_builder.build(alert=alert))
+                for alert in alerts
+            ],
+            size_limit,
+            join=lambda bodies: _add_elementary_attribution(join_messages(bodies)),
+        )
+
+    def _get_alert_destination(
+        self, integration: BaseMessagingIntegration, alert: AlertModelType
+    ) -> Any:
+        return Integrations.get_destination(
+            integration=integration,
+            config=self.config,
+            metadata=alert.unified_meta,
+            override_config_defaults=self.override_config_defaults,
+        )
+
+    async def _async_dispatch_alerts(
+        self,
+        integration: BaseMessagingIntegration,
+        alerts: List[AlertModelType],
+        on_alert_sent: Callable[[AlertModelType, bool], None],
+    ) -> None:
+        alerts_by_destination: DefaultDict[Any, List[AlertModelType]] = defaultdict(
+            list
+        )
+        for alert in alerts:
+            destination = self._get_alert_destination(integration, alert)
+            alerts_by_destination[destination].append(alert)
+
+        semaphore = asyncio.Semaphore(max(self.config.alerts_send_concurrency, 1))
+
+        async def send_destination_alerts(
+            destination: Any, destination_alerts: List[AlertModelType]
+        ) -> None:
+            async with semaphore:
+                if not self.config.alerts_digest:
+                    for alert in destination_alerts:
+                        sent_successfully = await self._async_send_alert(
+                            integration, alert, destination
+                        )
+                        on_alert_sent(alert, sent_successfully)
+                    return
+
+                for digest_alerts, digest_body in self._pack_alert_messages(
+                    integration, destination_alerts, destination
+                ):
+                    sent_successfully = await self._async_send_alert_message(
+                        integration, digest_body, destination
+                    )
+                    if not sent_successfully:
+                        logger.error(
+                            f"Could not send a digest of {len(digest_alerts)} alerts."
+                        )
+                    for alert in digest_alerts:
+                        on_alert_sent(alert, sent_successfully)
+
+        results = await asyncio.gather(
+            *(
+                send_destination_alerts(destination, destination_alerts)
+                for destination, destination_alerts in alerts_by_destination.items()
+            ),
+            # A destination that fails doesn't cancel the others, so their alerts are still sent and reported.
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _dispatch_alerts(
+        self,
+        alerts: List[AlertModelType],
+        on_alert_sent: Callable[[AlertModelType, bool], None],
+    ) -> None:
+        """Sends the alerts, calling on_alert_sent with each alert and whether it was sent successfully once it was sent.
+
+        The alerts of every destination are sent in order, and the destinations are sent to concurrently from an
+        event loop - the messaging integrations rate limit each destination separately.
+        """
+        if isinstance(self.alerts_integration, BaseIntegration):
+            # The legacy integrations are synchronous.
+            for alert in alerts:
+                on_alert_sent(alert, self._send_alert(alert))
+            return
+        asyncio.run(
+            self._async_dispatch_alerts(self.alerts_integration, alerts, on_alert_sent)
+        )
+
+    def _open_alerts_outbox(self) -> Optional[AlertsOutbox]:
+        outbox_path = os.path.join(self.config.target_dir, ALERTS_OUTBOX_FILE_NAME)
+        try:
+            return AlertsOutbox(outbox_path)
+        except (sqlite3.Error, OSError):
+            logger.warning(
+                f"Could not open the alerts outbox '{outbox_path}', a run that fails midway will send its alerts again.",
+                exc_info=True,
+            )
+            return None
+
     def _send_alerts(
         self,
-        alerts: List[
-            Union[
-                TestAlertModel,
-                ModelAlertModel,
-                SourceFreshnessAlertModel,
-                GroupedByTableAlerts,
-                AlertsGroup,
-            ]
-        ],
+        alerts: List[AlertModelType],
     ):
-        if not alerts:
-            self.execution_properties["sent_alert_count"] = self.sent_alert_count
-            return
+        # The outbox is opened even when there's nothing to send, to flush the alerts a previous run delivered.
+        outbox = self._open_alerts_outbox()
+        try:
+            self._send_alerts_through_outbox(alerts, outbox)
+        finally:
+            if outbox:
+                outbox.close()
+
+        # Now update sent alerts counter:
+        self.execution_properties["sent_alert_count"] = self.sent_alert_count
+
+    def _send_alerts_through_outbox(
+        self, alerts: List[AlertModelType], outbox: Optional[AlertsOutbox]
+    ) -> None:
+        # Alerts that were delivered by a previous run that didn't get to update the warehouse aren't sent again.
+        delivered_alert_ids = outbox.get_delivered_alert_ids() if outbox else set()
+        alerts_to_send = [
+            alert
+            for alert in alerts
+            if not set(_get_alert_ids(alert)).issubset(delivered_alert_ids)
+        ]
+        if len(alerts_to_send) < len(alerts):
+            logger.info(
+                f"Skipping {len(alerts) - len(alerts_to_send)} alerts that were already sent by a previous run."
+            )
+        if outbox:
+            outbox.add_pending(
+                alert_id
+                for alert in alerts_to_send
+                for alert_id in _get_alert_ids(alert)
+            )
 
         sent_successfully_alerts: List[AlertModel] = []
 
-        with alive_bar(len(alerts), title="Sending alerts") as bar:
-            for alert in alerts:
-                sent_successfully = self._send_alert(alert)
-                bar()
-                if sent_successfully:
-                    if isinstance(alert, AlertsGroup):
-                        sent_successfully_alerts.extend(alert.alerts)
+        try:
+            with alive_bar(len(alerts_to_send), title="Sending alerts") as bar:
+
+                def on_alert_sent(
+                    alert: AlertModelType, sent_successfully: bool
+                ) -> None:
+                    bar()
+                    if sent_successfully:
+                        if outbox:
+                            self._mark_alert_delivered(outbox, alert)
+                        if isinstance(alert, AlertsGroup):
+                            sent_successfully_alerts.extend(alert.alerts)
+                        else:
+                            sent_successfully_alerts.append(alert)
                     else:
-                        sent_successfully_alerts.append(alert)
-                else:
-                    if isinstance(alert, AlertsGroup):
-                        for inner_alert in alert.alerts:
+                        if isinstance(alert, AlertsGroup):
+                            for inner_alert in alert.alerts:
+                                logger.error(
+                                    f"Could not send the alert - {inner_alert.id}. Full alert: {json.dumps(inner_alert.data)}"
+                                )
+                        else:
                             logger.error(
-                                f"Could not send the alert - {inner_alert.id}. Full alert: {json.dumps(inner_alert.data)}"
+                                f"Could not send the alert - {alert.id}. Full alert: {json.dumps(alert.data)}"
                             )
-                    else:
-                        logger.error(
-                            f"Could not send the alert - {alert.id}. Full alert: {json.dumps(alert.data)}"
-                        )
-                    self.success = False
+                        self.success = False
+
+                if alerts_to_send:
+                    self._dispatch_alerts(alerts_to_send, on_alert_sent)
+        finally:
+            # The alerts that were sent are updated even if sending the others failed, so they aren't sent again.
+            self._update_sent_alerts_through_outbox(
+                sent_successfully_alerts, delivered_alert_ids, outbox
+            )
 
-        # Now update as sent:
+    def _update_sent_alerts_through_outbox(
+        self,
+        sent_successfully_alerts: List[AlertModel],
+        delivered_alert_ids: Set[str],
+        outbox: Optional[AlertsOutbox],
+    ) -> None:
+        # Now update as sent, along with the alerts that previous runs delivered:
         self.sent_alert_count = len(sent_successfully_alerts)
-        self._update_sent_alerts([alert.id for alert in sent_successfully_alerts])
+        sent_alert_ids = [alert.id for alert in sent_successfully_alerts]
+        sent_alert_ids.extend(sorted(delivered_alert_ids - set(sent_alert_ids)))
+        if sent_alert_ids:
+            updated_successfully = self._update_sent_alerts(sent_alert_ids)
+            if not updated_successfully:
+                logger.warning(
+                    "Could not confirm the sent alerts were updated, they will be updated by the next run."
+                )
+            elif outbox:
+                outbox.remove(sent_alert_ids)
+        if outbox:
+            # The alerts that weren't sent are still pending in the warehouse.
+            outbox.clear_pending()
 
-        # Now update sent alerts counter:
-        self.execution_properties["sent_alert_count"] = self.sent_alert_count
+    @staticmethod
+    def _mark_alert_delivered(outbox: AlertsOutbox, alert: AlertModelType) -> None:
+        alert_ids = _get_alert_ids(alert)
+        try:
+            outbox.mark_delivered(alert_ids)
+        except sqlite3.Error:
+            # Another run might hold the outbox, the alert is still updated as sent at the end of this run.
+            logger.warning(
+                f"Could not record the delivery of alerts {alert_ids} in the alerts outbox.",
+                exc_info=True,
+            )
 
-    def _update_sent_alerts(self, alert_ids: List[str]):
-        self.alerts_api.update_sent_alerts(alert_ids=alert_ids)
+    def _update_sent_alerts(self, alert_ids: List[str]) -> bool:
+        return self.alerts_api.update_sent_alerts(alert_ids=alert_ids)
 
     def _skip_alerts(self, alerts: List[PendingAlertSchema]):
         self.alerts_api.skip_alerts(alerts)
@@ -1,11 +1,16 @@
 from typing import Any, Optional, Union, cast
 
+import requests
+
 from elementary.config.config import Config
 from elementary.exceptions.exceptions import Error
 from elementary.messages.messaging_integrations.base_messaging_integration import (
     BaseMessagingIntegration,
     DestinationType,
 )
+from elementary.messages.messaging_integrations.slack_directory_cache import (
+    SlackDirectoryCache,
+)
 from elementary.messages.messaging_integrations.slack_web import (
     SlackWebMessagingIntegration,
 )
@@ -22,6 +27,7 @@ from elementary.monitor.data_monitoring.alerts.integrations.slack.slack import (
     SlackIntegration,
 )
 from elementary.tracking.tracking_interface import Tracking
+from elementary.utils.http_session import create_http_session
 from elementary.utils.log import get_logger
 from elementary.utils.ssl import create_ssl_context
 
@@ -52,19 +58,47 @@ class Integrations:
                 )
             if config.slack_token:
                 return SlackWebMessagingIntegration.from_token(
-                    config.slack_token, tracking, ssl_context=ssl_context
+                    config.slack_token,
+                    tracking,
+                    ssl_context=ssl_context,
+                    directory_cache=Integrations._create_slack_directory_cache(config),
                 )
             elif config.slack_webhook:
                 return SlackWebhookMessagingIntegration.from_url(
-                    config.slack_webhook, tracking, ssl_context=ssl_context
+                    config.slack_webhook,
+                    tracking,
+                    session=Integrations._create_webhook_session(config),
                 )
             else:
                 raise UnsupportedAlertIntegrationError
         elif config.has_teams:
-            return TeamsWebhookMessagingIntegration(config.teams_webhook)
+            return TeamsWebhookMessagingIntegration(
+                config.teams_webhook,
+                session=Integrations._create_webhook_session(config),
+            )
         else:
             raise UnsupportedAlertIntegrationError
 
+    @staticmethod
+    def _create_webhook_session(config: Config) -> requests.Session:
+        return create_http_session(
+            timeout=config.webhook_timeout,
+            pool_maxsize=config.webhook_pool_maxsize,
+            ssl_context=create_ssl_context(config.ssl_ca_bundle),
+        )
+
+    @staticmethod
+    def _create_slack_directory_cache(
+        config: Config,
+    ) -> Optional[SlackDirectoryCache]:
+        if not config.slack_token or config.slack_directory_cache_ttl <= 0:
+            return None
+        return SlackDirectoryCache.get_shared(
+            config.config_dir,
+            config.slack_token,
+            ttl=config.slack_directory_cache_ttl,
+        )
+
     @staticmethod
     def get_destination(
         integration: BaseMessagingIntegration[DestinationType, Any],
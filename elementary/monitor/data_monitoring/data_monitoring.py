@@ -1,5 +1,5 @@
-import json
-from typing import Any, Dict, Optional, cast
+import os
+from typing import Any, Dict, List, Optional, cast
 
 from packaging import version
 
@@ -7,9 +7,11 @@ from elementary.clients.dbt.factory import create_dbt_runner
 from elementary.config.config import Config
 from elementary.monitor import dbt_project_utils
 from elementary.monitor.data_monitoring.schema import FiltersSchema, WarehouseInfo
+from elementary.monitor.fetchers.bootstrap.bootstrap import BootstrapFetcher
+from elementary.monitor.fetchers.bootstrap.schema import BootstrapSchema
 from elementary.tracking.anonymous_tracking import AnonymousTracking
 from elementary.tracking.tracking_interface import Tracking
-from elementary.utils import package
+from elementary.utils import json_utils, package
 from elementary.utils.hash import hash
 from elementary.utils.log import get_logger
 
@@ -33,6 +35,7 @@ class DataMonitoring:
         self.tracking = tracking
         self.force_update_dbt_package = force_update_dbt_package
         self.internal_dbt_runner = self._init_internal_dbt_runner()
+        self.bootstrap = self._get_bootstrap()
         latest_invocation = self.get_latest_invocation()
         self.project_name = latest_invocation.get("project_name")
         dbt_pkg_version = latest_invocation.get("elementary_version")
@@ -65,6 +68,10 @@ class DataMonitoring:
             env_vars=self.config.env_vars,
             run_deps_if_needed=self.config.run_dbt_deps_if_needed,
             force_dbt_deps=self.force_update_dbt_package,
+            results_dir=self.config.target_dir,
+            cache_dir=self.config.target_dir,
+            reuse_manifest=True,
+            stream_output=True,
         )
         return internal_dbt_runner
 
@@ -74,7 +81,44 @@ class DataMonitoring:
         }
         return data_monitoring_properties
 
+    def _get_bootstrap(self) -> Optional[BootstrapSchema]:
+        bootstrap_fetcher = BootstrapFetcher(
+            self.internal_dbt_runner,
+            cache_dir=self.config.config_dir,
+            cache_key=self._get_bootstrap_cache_key(),
+            cache_ttl=self.config.bootstrap_cache_ttl,
+        )
+        try:
+            return bootstrap_fetcher.get_bootstrap()
+        except Exception:
+            logger.debug(
+                "Could not bootstrap in a single run-operation, fetching the details separately.",
+                exc_info=True,
+            )
+            return None
+
+    def _get_bootstrap_cache_key(self) -> str:
+        # The bootstrap describes the warehouse of the profile's target.
+        return hash(
+            json_utils.dumps(
+                dict(
+                    profiles_dir=os.path.abspath(self.config.profiles_dir)
+                    if self.config.profiles_dir
+                    else None,
+                    profile_target=self.config.profile_target,
+                    env_vars=self.config.env_vars,
+                    version=package.get_package_version(),
+                ),
+                sort_keys=True,
+            )
+        )
+
     def get_elementary_database_and_schema(self):
+        if self.bootstrap and self.bootstrap.elementary_database_and_schema:
+            strip_relation = self.bootstrap.elementary_database_and_schema.strip('"')
+            logger.info(f"Elementary's database and schema: '{strip_relation}'")
+            return strip_relation
+
         try:
             relation = self.internal_dbt_runner.run_operation(
                 "elementary_cli.get_elementary_database_and_schema", quiet=True
@@ -90,11 +134,14 @@ class DataMonitoring:
             return "<elementary_database>.<elementary_schema>"
 
     def get_latest_invocation(self) -> Dict[str, Any]:
+        if self.bootstrap:
+            return self.bootstrap.latest_invocation
+
         try:
             latest_invocation = self.internal_dbt_runner.run_operation(
                 "elementary_cli.get_latest_invocation", quiet=True
             )[0]
-            return json.loads(latest_invocation)[0] if latest_invocation else {}
+            return json_utils.loads(latest_invocation)[0] if latest_invocation else {}
         except Exception as err:
             logger.error(f"Unable to get the latest invocation: {err}")
             if self.tracking:
@@ -138,10 +185,20 @@ class DataMonitoring:
 
     def _get_warehouse_info(self, hash_id: bool = False) -> Optional[WarehouseInfo]:
         try:
-            warehouse_type, warehouse_unique_id = json.loads(
-                self.internal_dbt_runner.run_operation(
-                    "elementary_cli.get_adapter_type_and_unique_id", quiet=True
-                )[0]
+            if self.bootstrap:
+                warehouse_type_and_unique_id = [
+                    self.bootstrap.warehouse_type,
+                    self.bootstrap.warehouse_unique_id,
+                ]
+            else:
+                warehouse_type_and_unique_id = json_utils.loads(
+                    self.internal_dbt_runner.run_operation(
+                        "elementary_cli.get_adapter_type_and_unique_id", quiet=True
+                    )[0]
+                )
+            # Missing values fail the validation of the warehouse info below.
+            warehouse_type, warehouse_unique_id = cast(
+                List[str], warehouse_type_and_unique_id
             )
             return WarehouseInfo(
                 id=warehouse_unique_id if not hash_id else hash(warehouse_unique_id),
@@ -1,5 +1,4 @@
 import base64
-import json
 import os
 import os.path
 import webbrowser
@@ -75,7 +74,9 @@ class DataMonitoringReport(DataMonitoring):
         with open(template_html_path, "r", encoding="utf-8") as template_html_file:
             template_html_code = template_html_file.read()
 
-        dumped_output_data = json.dumps(json_utils.inf_and_nan_to_str(output_data))
+        dumped_output_data = json_utils.dumps(
+            json_utils.inf_and_nan_to_str(output_data)
+        )
         encoded_output_data = base64.b64encode(dumped_output_data.encode("utf-8"))
         compiled_output_html = (
             f"<script>"
@@ -118,6 +119,8 @@ class DataMonitoringReport(DataMonitoring):
             disable_passed_test_metrics=disable_passed_test_metrics,
             exclude_elementary_models=exclude_elementary_models,
             disable_samples=self.disable_samples,
+            sample_rows_limit=self.config.test_sample_rows_limit,
+            sample_columns=self.config.test_sample_columns,
             project_name=project_name or self.project_name,
             filter=self.selector_filter.to_selector_filter_schema(),
             env=self.config.env,
@@ -286,6 +289,8 @@ class DataMonitoringReport(DataMonitoring):
             days_back=days_back,
             invocations_per_test=test_runs_amount,
             disable_passed_test_metrics=disable_passed_test_metrics,
+            sample_rows_limit=self.config.test_sample_rows_limit,
+            sample_columns=self.config.test_sample_columns,
         )
         invocations_api = InvocationsAPI(
             dbt_runner=self.internal_dbt_runner,
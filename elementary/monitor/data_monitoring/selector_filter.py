@@ -30,7 +30,9 @@ class SelectorFilter:
         self.selector = selector
         user_dbt_runner = self._create_user_dbt_runner(config)
         self.selector_fetcher = (
-            SelectorFetcher(user_dbt_runner) if user_dbt_runner else None
+            SelectorFetcher(user_dbt_runner, cache_dir=config.target_dir)
+            if user_dbt_runner
+            else None
         )
         self.filter = self._parse_selector(self.selector)
 
@@ -141,6 +143,7 @@ class SelectorFilter:
                 config.project_profile_target,
                 env_vars=config.env_vars,
                 run_deps_if_needed=config.run_dbt_deps_if_needed,
+                cache_dir=config.target_dir,
             )
         else:
             return None
@@ -1,4 +1,9 @@
-{% macro get_pending_alerts(days_back, type=none) %}
+{#
+    types: the alert types to fetch (none for all of them).
+    data_contains: groups of lowercase strings - the alert data has to contain one of the strings of every group.
+    These are used to narrow the alerts down before they are filtered in the CLI.
+#}
+{% macro get_pending_alerts(days_back, type=none, types=none, data_contains=none) %}
     -- depends_on: {{ ref('alerts_v2') }}
     {% set select_pending_alerts_query %}
         with alerts_in_time_limit as (
@@ -8,6 +13,17 @@
             {% if type %}
                 and lower(type) = {{ elementary.edr_quote(type | lower) }}
             {% endif %}
+            {% if types is not none %}
+                and lower(type) in {{ elementary.strings_list_to_tuple(types | map('lower') | list) if types else "(null)" }}
+            {% endif %}
+            {% for data_strings in data_contains or [] %}
+                and (
+                {% for data_string in data_strings %}
+                    lower(data) like {{ elementary.edr_quote('%' ~ data_string ~ '%') }}
+                    {% if not loop.last %} or {% endif %}
+                {% endfor %}
+                )
+            {% endfor %}
         )
 
         select 
@@ -0,0 +1,82 @@
+{#
+    Updates the status of all the given pending alerts with a single set-based statement.
+    The ids are staged in a temp relation first (with as few inserts as the query size allows), instead of running an
+    update per small chunk of ids.
+#}
+{% macro update_alerts_status(alert_ids, status, sent_at=none) %}
+    -- depends_on: {{ ref('alerts_v2') }}
+    {% if alert_ids %}
+        {% do adapter.dispatch("update_alerts_status", "elementary_cli")(alert_ids, status, sent_at) %}
+    {% endif %}
+    {# Only returned once the update was committed, so the CLI knows it can forget about these alerts. #}
+    {% do return(true) %}
+{% endmacro %}
+
+{% macro default__update_alerts_status(alert_ids, status, sent_at) %}
+    {% set alert_ids_relation = elementary_cli.stage_alert_ids(alert_ids) %}
+    {% set alert_ids_filter %}
+        (select alert_id from {{ alert_ids_relation }})
+    {% endset %}
+    {% do elementary.run_query(elementary_cli.get_update_alerts_status_query(alert_ids_filter, status, sent_at)) %}
+    {% if not elementary.has_temp_table_support() %}
+        {% do elementary.fully_drop_relation(alert_ids_relation) %}
+    {% endif %}
+    {# run-operation doesn't commit by itself, the update would be rolled back on transactional adapters. #}
+    {% do adapter.commit() %}
+{% endmacro %}
+
+{% macro clickhouse__update_alerts_status(alert_ids, status, sent_at) %}
+    {# Mutations run in the background and can't read session temp tables, so the ids are inlined. #}
+    {% do elementary.run_query(elementary_cli.get_update_alerts_status_query(elementary.strings_list_to_tuple(alert_ids), status, sent_at)) %}
+{% endmacro %}
+
+{% macro stage_alert_ids(alert_ids, ids_per_insert=5000) %}
+    {% set alert_ids_batches = alert_ids | batch(ids_per_insert) | list %}
+    {% set elementary_database, elementary_schema = elementary.get_package_database_and_schema() %}
+    {# Adapters without temp tables create a regular table, so concurrent runs must not share its name. #}
+    {% set alert_ids_table_name = 'alert_ids_to_update_' ~ invocation_id | replace('-', '') %}
+    {% set alert_ids_relation = elementary.create_temp_table(elementary_database, elementary_schema, alert_ids_table_name, elementary_cli.get_alert_ids_select_query(alert_ids_batches[0])) %}
+    {% for alert_ids_batch in alert_ids_batches[1:] %}
+        {% set insert_alert_ids_query %}
+            insert into {{ alert_ids_relation }} (alert_id)
+            {{ elementary_cli.get_alert_ids_select_query(alert_ids_batch) }}
+        {% endset %}
+        {% do elementary.run_query(insert_alert_ids_query) %}
+    {% endfor %}
+    {% do return(alert_ids_relation) %}
+{% endmacro %}
+
+{% macro get_alert_ids_select_query(alert_ids) %}
+    {% for alert_id in alert_ids %}
+        select {{ elementary.edr_quote(alert_id) }} as alert_id
+        {% if not loop.last %} union all {% endif %}
+    {% endfor %}
+{% endmacro %}
+
+{% macro get_update_alerts_status_query(alert_ids_filter, status, sent_at=none) %}
+    {% do return(adapter.dispatch("get_update_alerts_status_query", "elementary_cli")(alert_ids_filter, status, sent_at)) %}
+{% endmacro %}
+
+{% macro default__get_update_alerts_status_query(alert_ids_filter, status, sent_at) %}
+    update {{ ref('elementary_cli', 'alerts_v2') }}
+    set status = {{ elementary.edr_quote(status) }},
+        {% if sent_at %}
+        sent_at = {{ elementary.edr_cast_as_timestamp(elementary.edr_quote(sent_at)) }},
+        {% endif %}
+        updated_at = {{ elementary.edr_current_timestamp() }}
+    where alert_id in {{ alert_ids_filter }}
+        and status = 'pending'
+        and {{ elementary.edr_cast_as_timestamp('detected_at') }} >= {{ elementary_cli.get_alerts_time_limit() }}
+{% endmacro %}
+
+{% macro clickhouse__get_update_alerts_status_query(alert_ids_filter, status, sent_at) %}
+    ALTER TABLE {{ ref('elementary_cli', 'alerts_v2') }}
+    UPDATE status = {{ elementary.edr_quote(status) }},
+        {% if sent_at %}
+        sent_at = {{ elementary.edr_cast_as_timestamp(elementary.edr_quote(sent_at)) }},
+        {% endif %}
+        updated_at = {{ elementary.edr_current_timestamp() }}
+    WHERE alert_id in {{ alert_ids_filter }}
+        and status = 'pending'
+        and {{ elementary.edr_cast_as_timestamp('detected_at') }} >= {{ elementary_cli.get_alerts_time_limit() }}
+{% endmacro %}
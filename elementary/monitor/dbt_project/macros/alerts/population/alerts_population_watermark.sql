@@ -0,0 +1,125 @@
+{#
+    The alerts population keeps a high-water mark for every source it populates alerts from (test results, model runs
+    and source freshness results) - the latest detection time of the source rows it already processed - so it only
+    scans the newer source rows instead of the whole days_back window every time.
+    Source rows can be written long after they were detected (for example by the on-run-end of a long dbt job), so the
+    scan starts `overlap_hours` before the mark. Alerts that were already populated are skipped by their id anyway.
+    A mark is only used if the populations before it already covered the whole days_back window.
+#}
+{% macro get_alerts_population_sources() %}
+    {% do return(['test_results', 'model_runs', 'source_freshness']) %}
+{% endmacro %}
+
+
+{% macro get_alerts_population_since(days_back=1, overlap_hours=24) %}
+    {% set days_back_since = elementary.edr_timeadd('day', -1 * days_back, elementary.edr_current_timestamp()) %}
+    {% set watermarks_relation = elementary.get_elementary_relation('alerts_population_watermarks') %}
+
+    {% set since_by_source = {} %}
+    {% for source_name in elementary_cli.get_alerts_population_sources() %}
+        {% if watermarks_relation %}
+            {% set since %}
+                coalesce(
+                    (
+                        select {{ elementary.edr_timeadd('hour', -1 * overlap_hours, 'max(high_water_mark)') }}
+                        from {{ watermarks_relation }}
+                        where source_name = '{{ source_name }}'
+                        and scanned_from <= {{ days_back_since }}
+                    ),
+                    {{ days_back_since }}
+                )
+            {% endset %}
+            {% do since_by_source.update({source_name: since}) %}
+        {% else %}
+            {% do since_by_source.update({source_name: days_back_since}) %}
+        {% endif %}
+    {% endfor %}
+    {% do return(since_by_source) %}
+{% endmacro %}
+
+
+{#
+    Has to run before the population scans the sources, so every row that counts for a mark was already there when
+    they were scanned.
+#}
+{% macro get_alerts_population_high_water_marks(since_by_source) %}
+    {% set seed_run_results_relation = elementary.get_elementary_relation('seed_run_results') %}
+    {% set high_water_marks_query %}
+        with run_results as (
+            select generated_at from {{ ref('model_run_results') }}
+            union all
+            select generated_at from {{ ref('snapshot_run_results') }}
+            {% if seed_run_results_relation %}
+            union all
+            select generated_at from {{ seed_run_results_relation }}
+            {% endif %}
+        )
+
+        select 'test_results' as source_name, max({{ elementary.edr_cast_as_timestamp('detected_at') }}) as high_water_mark
+        from {{ ref('elementary_test_results') }}
+        where {{ elementary.edr_cast_as_timestamp('detected_at') }} > {{ since_by_source['test_results'] }}
+        union all
+        select 'model_runs' as source_name, max({{ elementary.edr_cast_as_timestamp('generated_at') }}) as high_water_mark
+        from run_results
+        where {{ elementary.edr_cast_as_timestamp('generated_at') }} > {{ since_by_source['model_runs'] }}
+        union all
+        select 'source_freshness' as source_name, max({{ elementary.edr_cast_as_timestamp('generated_at') }}) as high_water_mark
+        from {{ ref('elementary', 'dbt_source_freshness_results') }}
+        where {{ elementary.edr_cast_as_timestamp('generated_at') }} > {{ since_by_source['source_freshness'] }}
+    {% endset %}
+
+    {% set high_water_marks = {} %}
+    {% for row in elementary.agate_to_dicts(elementary.run_query(high_water_marks_query)) %}
+        {% do high_water_marks.update({row['source_name']: row['high_water_mark']}) %}
+    {% endfor %}
+    {% do return(high_water_marks) %}
+{% endmacro %}
+
+
+{% macro update_alerts_population_watermark(high_water_marks, days_back=1) %}
+    {% set watermarks_relation = elementary.get_elementary_relation('alerts_population_watermarks') %}
+    {% if not watermarks_relation %}
+        {% do return(none) %}
+    {% endif %}
+
+    {% set days_back_since = elementary.edr_timeadd('day', -1 * days_back, elementary.edr_current_timestamp()) %}
+    {% set insert_watermarks_query %}
+        insert into {{ watermarks_relation }} (source_name, high_water_mark, scanned_from, populated_at)
+        {% for source_name in elementary_cli.get_alerts_population_sources() %}
+        {% set high_water_mark = high_water_marks.get(source_name) %}
+        select
+            '{{ source_name }}',
+            {# No new source rows, the previous marks still hold. #}
+            {{ elementary.edr_cast_as_timestamp("'" ~ high_water_mark ~ "'") if high_water_mark is not none else elementary.edr_cast_as_timestamp('null') }},
+            coalesce(
+                (
+                    select max(scanned_from)
+                    from {{ watermarks_relation }}
+                    where source_name = '{{ source_name }}'
+                    and scanned_from <= {{ days_back_since }}
+                ),
+                {{ days_back_since }}
+            ),
+            {{ elementary.edr_current_timestamp() }}
+        {% if not loop.last %}union all{% endif %}
+        {% endfor %}
+    {% endset %}
+    {% do elementary.run_query(insert_watermarks_query) %}
+    {# Marks from before the days_back window can't narrow the scan anymore. #}
+    {% do elementary.run_query(elementary_cli.get_delete_expired_watermarks_query(watermarks_relation, days_back_since)) %}
+{% endmacro %}
+
+
+{% macro get_delete_expired_watermarks_query(watermarks_relation, days_back_since) %}
+    {% do return(adapter.dispatch("get_delete_expired_watermarks_query", "elementary_cli")(watermarks_relation, days_back_since)) %}
+{% endmacro %}
+
+{% macro default__get_delete_expired_watermarks_query(watermarks_relation, days_back_since) %}
+    delete from {{ watermarks_relation }}
+    where populated_at < {{ days_back_since }}
+{% endmacro %}
+
+{% macro clickhouse__get_delete_expired_watermarks_query(watermarks_relation, days_back_since) %}
+    ALTER TABLE {{ watermarks_relation }}
+    DELETE WHERE populated_at < {{ days_back_since }}
+{% endmacro %}
@@ -1,6 +1,6 @@
-{% macro populate_model_alerts(days_back=1) %}
+{% macro populate_model_alerts(days_back=1, since=none) %}
     {% set model_alerts = [] %}
-    {% set raw_model_alerts_agate = run_query(elementary_cli.populate_model_alerts_query(days_back)) %}
+    {% set raw_model_alerts_agate = run_query(elementary_cli.populate_model_alerts_query(days_back, since)) %}
     {% set raw_model_alerts = elementary.agate_to_dicts(raw_model_alerts_agate) %}
     {% for raw_model_alert in raw_model_alerts %}
         {% set status = elementary.insensitive_get_dict_value(raw_model_alert, 'status') | lower %}
@@ -44,7 +44,7 @@
 {% endmacro %}
 
 
-{% macro populate_model_alerts_query(days_back=1) %}
+{% macro populate_model_alerts_query(days_back=1, since=none) %}
     {# This macro is invoked as part of alerts_v2 post-hook, so "this" references to alerts_v2 -#}
     {% set seed_run_results_relation = elementary.get_elementary_relation('seed_run_results') -%}
 
@@ -122,6 +122,9 @@
         from all_run_results
         where lower(all_run_results.status) != 'success'
         and {{ elementary.edr_cast_as_timestamp('all_run_results.generated_at') }} > {{ elementary.edr_timeadd('day', -1 * days_back, elementary.edr_current_timestamp()) }}
+        {% if since %}
+        and {{ elementary.edr_cast_as_timestamp('all_run_results.generated_at') }} > {{ since }}
+        {% endif %}
     )
 
     select 
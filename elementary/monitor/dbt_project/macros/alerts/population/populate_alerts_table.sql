@@ -1,10 +1,12 @@
-{% macro populate_alerts_table(days_back=1, disable_samples=false) %}
+{% macro populate_alerts_table(days_back=1, disable_samples=false, sample_rows_limit=none, sample_columns=none, overlap_hours=24) %}
     {% if execute %}
         {% set alerts_v2_relation = elementary.get_elementary_relation('alerts_v2') %}
+        {% set since_by_source = elementary_cli.get_alerts_population_since(days_back=days_back, overlap_hours=overlap_hours) %}
+        {% set high_water_marks = elementary_cli.get_alerts_population_high_water_marks(since_by_source) %}
 
-        {% set test_alerts = elementary_cli.populate_test_alerts(days_back=days_back, disable_samples=disable_samples) %}
-        {% set model_alerts = elementary_cli.populate_model_alerts(days_back=days_back) %}
-        {% set source_freshness_alerts = elementary_cli.populate_source_freshness_alerts(days_back=days_back) %}
+        {% set test_alerts = elementary_cli.populate_test_alerts(days_back=days_back, disable_samples=disable_samples, sample_rows_limit=sample_rows_limit, sample_columns=sample_columns, since=since_by_source['test_results']) %}
+        {% set model_alerts = elementary_cli.populate_model_alerts(days_back=days_back, since=since_by_source['model_runs']) %}
+        {% set source_freshness_alerts = elementary_cli.populate_source_freshness_alerts(days_back=days_back, since=since_by_source['source_freshness']) %}
         
         {% set all_alerts = test_alerts + model_alerts + source_freshness_alerts %}
         {% set backward_already_handled_alert_ids = backward_already_handled_alerts(days_back=days_back) %}
@@ -17,6 +19,7 @@
             {% endif %}
         {% endfor %}
         {% do elementary.insert_rows(alerts_v2_relation, unhandled_alerts, on_query_exceed=elementary_cli.handle_exceeding_limit_alert_data) %}
+        {% do elementary_cli.update_alerts_population_watermark(high_water_marks, days_back=days_back) %}
     {% endif %}
     {% do return('') %}
 {% endmacro %}
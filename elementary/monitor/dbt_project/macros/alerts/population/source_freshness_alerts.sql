@@ -1,6 +1,6 @@
-{% macro populate_source_freshness_alerts(days_back=1) %}
+{% macro populate_source_freshness_alerts(days_back=1, since=none) %}
     {% set source_freshness_alerts = [] %}
-    {% set raw_source_freshness_alerts_agate = run_query(elementary_cli.populate_source_freshness_alerts_query(days_back)) %}
+    {% set raw_source_freshness_alerts_agate = run_query(elementary_cli.populate_source_freshness_alerts_query(days_back, since)) %}
     {% set raw_source_freshness_alerts = elementary.agate_to_dicts(raw_source_freshness_alerts_agate) %}
     {% for raw_source_freshness_alert in raw_source_freshness_alerts %}
         {% set error_after = raw_source_freshness_alert.get('error_after') %}
@@ -56,7 +56,7 @@
 {% endmacro %}
 
 
-{% macro populate_source_freshness_alerts_query(days_back=1) %}
+{% macro populate_source_freshness_alerts_query(days_back=1, since=none) %}
   {% set source_freshness_results_relation = ref('elementary', 'dbt_source_freshness_results') %}
   {% set error_after_column_exists = elementary.column_exists_in_relation(source_freshness_results_relation, 'error_after') %}
 
@@ -131,6 +131,9 @@
     left join dbt_invocations as invocations on dbt_run_results.invocation_id = invocations.invocation_id
     where lower(results.status) != 'pass'
     and {{ elementary.edr_cast_as_timestamp('results.generated_at') }} > {{ elementary.edr_timeadd('day', -1 * days_back, elementary.edr_current_timestamp()) }}
+    {% if since %}
+    and {{ elementary.edr_cast_as_timestamp('results.generated_at') }} > {{ since }}
+    {% endif %}
   )
 
   select *
@@ -1,9 +1,22 @@
-{% macro populate_test_alerts(days_back=1, disable_samples=false) %}
-    {% set test_result_rows_agate = not disable_samples and elementary_cli.get_result_rows_agate(days_back) %}
-
+{% macro populate_test_alerts(days_back=1, disable_samples=false, sample_rows_limit=none, sample_columns=none, since=none) %}
     {% set test_alerts = [] %}
-    {% set raw_test_alerts_agate = run_query(elementary_cli.populate_test_alerts_query(days_back)) %}
+    {% set raw_test_alerts_agate = run_query(elementary_cli.populate_test_alerts_query(days_back, since)) %}
     {% set raw_test_alerts = elementary.agate_to_dicts(raw_test_alerts_agate) %}
+    {% if not raw_test_alerts %}
+        {% do return(test_alerts) %}
+    {% endif %}
+
+    {# Only the sample rows of the newly failed tests are needed. #}
+    {% set new_failed_tests_query = none %}
+    {% if since %}
+        {% set new_failed_tests_query %}
+            select id
+            from {{ ref('elementary_test_results') }}
+            where lower(status) != 'pass'
+            and {{ elementary.edr_cast_as_timestamp('detected_at') }} > {{ since }}
+        {% endset %}
+    {% endif %}
+    {% set test_result_rows_agate = not disable_samples and elementary_cli.get_result_rows_agate(days_back, new_failed_tests_query, sample_rows_limit) %}
     
     {% for raw_test_alert in raw_test_alerts %}
         {% set test_type = raw_test_alert.alert_type %}
@@ -11,7 +24,7 @@
 
         {% set test_rows_sample = none %}
         {%- if not disable_samples and ((test_type == 'dbt_test' and status in ['fail', 'warn']) or (test_type != 'dbt_test' and status != 'error')) -%}
-            {% set test_rows_sample = elementary_cli.get_test_rows_sample(raw_test_alert.result_rows, test_result_rows_agate.get(raw_test_alert.alert_id)) %}
+            {% set test_rows_sample = elementary_cli.get_test_rows_sample(raw_test_alert.result_rows, test_result_rows_agate.get(raw_test_alert.alert_id), sample_rows_limit, sample_columns) %}
         {%- endif -%}
 
         {% set test_alert_data = {
@@ -64,7 +77,7 @@
 {% endmacro %}
 
 
-{% macro populate_test_alerts_query(days_back=1) %}
+{% macro populate_test_alerts_query(days_back=1, since=none) %}
     with elementary_test_results as (
         select * from {{ ref('elementary_test_results') }}
     ),
@@ -123,6 +136,9 @@
         from elementary_test_results
         where lower(elementary_test_results.status) != 'pass'
         and {{ elementary.edr_cast_as_timestamp('detected_at') }} > {{ elementary.edr_timeadd('day', -1 * days_back, elementary.edr_current_timestamp()) }}
+        {% if since %}
+        and {{ elementary.edr_cast_as_timestamp('detected_at') }} > {{ since }}
+        {% endif %}
     )
 
     select distinct
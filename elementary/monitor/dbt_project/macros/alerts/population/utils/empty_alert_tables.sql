@@ -61,4 +61,13 @@
 		('data', 'long_string'),
 		('sent_at', 'timestamp')
     ]) }}
-{% endmacro %}
\ No newline at end of file
+{% endmacro %}
+
+{% macro empty_alerts_population_watermarks() %}
+    {{ elementary.empty_table([
+		('source_name', 'string'),
+		('high_water_mark', 'timestamp'),
+		('scanned_from', 'timestamp'),
+		('populated_at', 'timestamp')
+    ]) }}
+{% endmacro %}
@@ -0,0 +1,13 @@
+{#
+    Everything the CLI needs to know about the environment when it starts, fetched in a single run-operation.
+#}
+{% macro bootstrap() %}
+    {% set latest_invocations = elementary_cli.get_latest_invocation() %}
+    {% set warehouse_type, warehouse_unique_id = elementary_cli.get_adapter_type_and_unique_id() %}
+    {% do return({
+        "latest_invocation": latest_invocations[0] if latest_invocations else {},
+        "warehouse_type": warehouse_type,
+        "warehouse_unique_id": warehouse_unique_id,
+        "elementary_database_and_schema": elementary_cli.get_elementary_database_and_schema()
+    }) %}
+{% endmacro %}
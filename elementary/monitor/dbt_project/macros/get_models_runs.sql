@@ -1,4 +1,4 @@
-{%- macro get_models_runs(days_back = 7, exclude_elementary=false) -%}
+{%- macro get_models_runs(days_back = 7, exclude_elementary=false, results_path=none) -%}
     {% set models_runs_query %}
         with model_runs as (
             select
@@ -29,5 +29,5 @@
         order by generated_at
     {% endset %}
     {% set models_runs_agate = run_query(models_runs_query) %}
-    {% do return(elementary.agate_to_dicts(models_runs_agate)) %}
+    {% do return(elementary_cli.return_result_set(models_runs_agate, results_path)) %}
 {%- endmacro -%}
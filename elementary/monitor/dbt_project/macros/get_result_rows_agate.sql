@@ -1,39 +1,67 @@
-{% macro get_result_rows_agate(days_back, valid_ids_query = none) %}
-  {% do return(adapter.dispatch('get_result_rows_agate', 'elementary_cli')(days_back, valid_ids_query)) %}
+{% macro get_result_rows_agate(days_back, valid_ids_query = none, sample_rows_limit = none) %}
+  {% do return(adapter.dispatch('get_result_rows_agate', 'elementary_cli')(days_back, valid_ids_query, sample_rows_limit)) %}
 {% endmacro %}
 
-{% macro default__get_result_rows_agate(days_back, valid_ids_query = none) %}
+{% macro default__get_result_rows_agate(days_back, valid_ids_query = none, sample_rows_limit = none) %}
   {% set query %}
   select
     elementary_test_results_id,
-    result_row
+    result_row,
+    created_at
   from {{ ref("test_result_rows", package="elementary") }}
   where {{ elementary.edr_datediff(elementary.edr_cast_as_timestamp('detected_at'), elementary.edr_current_timestamp(), 'day') }} < {{ days_back }}
   {% if valid_ids_query %}
     and elementary_test_results_id in ({{ valid_ids_query }})
   {% endif %}
   {% endset %}
-  {% set res = elementary.run_query(query) %}
-  {% if not res %}
-    {% do return({}) %}
-  {% endif %}
-  {% do return(res.group_by("elementary_test_results_id")) %}
+  {% do return(elementary_cli.run_result_rows_query(query, sample_rows_limit)) %}
 {% endmacro %}
 
-{% macro bigquery__get_result_rows_agate(days_back, valid_ids_query = none) %}
+{% macro bigquery__get_result_rows_agate(days_back, valid_ids_query = none, sample_rows_limit = none) %}
   {% set query %}
   select
     elementary_test_results_id,
-    result_row
+    result_row,
+    created_at
   from {{ ref("test_result_rows", package="elementary") }}
   where detected_at > {{ elementary.edr_timeadd('day', -1 * days_back, elementary.edr_current_timestamp()) }}
   {% if valid_ids_query %}
     and elementary_test_results_id in ({{ valid_ids_query }})
   {% endif %}
   {% endset %}
+  {% do return(elementary_cli.run_result_rows_query(query, sample_rows_limit)) %}
+{% endmacro %}
+
+{#
+    Runs a result rows query and groups the rows by their test result.
+    With `sample_rows_limit`, only that many rows are fetched per test result,
+    so a test with a huge amount of failed rows doesn't bloat the samples.
+    The rows are ordered by their creation time and then by their content, so the same rows are sampled every time.
+#}
+{% macro run_result_rows_query(result_rows_query, sample_rows_limit = none) %}
+  {% if sample_rows_limit is not none %}
+    {% set query %}
+    select
+      elementary_test_results_id,
+      result_row
+    from (
+      select
+        elementary_test_results_id,
+        result_row,
+        row_number() over (
+          partition by elementary_test_results_id
+          order by created_at, {{ elementary.edr_cast_as_string('result_row') }}
+        ) as sample_row_number
+      from ({{ result_rows_query }}) result_rows
+    ) numbered_result_rows
+    where sample_row_number <= {{ sample_rows_limit }}
+    {% endset %}
+  {% else %}
+    {% set query = result_rows_query %}
+  {% endif %}
   {% set res = elementary.run_query(query) %}
   {% if not res %}
     {% do return({}) %}
   {% endif %}
   {% do return(res.group_by("elementary_test_results_id")) %}
-{% endmacro %}
\ No newline at end of file
+{% endmacro %}
@@ -1,16 +1,98 @@
-{%- macro get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false) -%}
-    {{ return(adapter.dispatch('get_test_results', 'elementary_cli')(days_back, invocations_per_test, disable_passed_test_metrics, skip_test_result_rows)) }}
+{%- macro get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false, raw = false, sample_rows_limit = none, static_columns = none) -%}
+    {{ return(adapter.dispatch('get_test_results', 'elementary_cli')(days_back, invocations_per_test, disable_passed_test_metrics, skip_test_result_rows, raw, sample_rows_limit, static_columns)) }}
+{%- endmacro -%}
+
+{#
+    The columns of the test results. The test metadata (`static_columns`) is the same for all the invocations of a
+    test, and the test results query and sample rows are only used for the latest one, so these columns are only
+    selected for the latest invocation. The older invocations (used for the test runs) get the metadata from there
+    when the results are processed.
+    The test results relation is expected to be aliased as `test_results`.
+#}
+{%- macro get_test_results_columns(static_columns = none) -%}
+    {% set latest_invocation_columns = (static_columns or []) + ["test_results_query", "result_rows"] %}
+    {% set columns = [
+        "id",
+        "invocation_id",
+        "test_execution_id",
+        "model_unique_id",
+        "test_unique_id",
+        "elementary_unique_id",
+        "detected_at",
+        "database_name",
+        "schema_name",
+        "table_name",
+        "column_name",
+        "test_type",
+        "test_sub_type",
+        "test_results_description",
+        "test_description",
+        "original_path",
+        "package_name",
+        "owners",
+        "model_owner",
+        "tags",
+        "test_tags",
+        "model_tags",
+        "meta",
+        "model_meta",
+        "test_params",
+        "test_results_query",
+        "other",
+        "test_name",
+        "severity",
+        "status",
+        "execution_time",
+        "days_diff",
+        "invocations_rank_index",
+        "failures",
+        "result_rows"
+    ] %}
+    {% for column in columns %}
+        {% if column == "detected_at" %}
+            {{ elementary.edr_cast_as_timestamp("test_results.detected_at") }} as detected_at
+        {%- elif column in latest_invocation_columns %}
+            case when test_results.invocations_rank_index = 1 then test_results.{{ column }} else NULL end as {{ column }}
+        {%- else %}
+            test_results.{{ column }}
+        {%- endif %}{% if not loop.last %},{% endif %}
+    {% endfor %}
 {%- endmacro -%}
 
 {#
     Shared post-processing helper: filters tests by meta, attaches sample data.
     Called by both default__ and fabric__ dispatches to avoid duplicating the
     Jinja processing loop.
+    With `raw`, the test results are returned as they are, with the sample rows of
+    the latest invocations under `test_result_rows`, and the post-processing is
+    left to the caller (the CLI does it in Python, one test at a time).
 #}
-{%- macro _process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows = false) -%}
+{%- macro _process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows = false, raw = false, sample_rows_limit = none, static_columns = none) -%}
+    {% if raw %}
+        {% set tests = elementary.agate_to_dicts(test_results_agate) %}
+        {% if test_result_rows_agate %}
+            {% for test in tests if test.invocations_rank_index == 1 %}
+                {% set test_result_rows = test_result_rows_agate.get(test.id) %}
+                {% if test_result_rows %}
+                    {% do test.update({"test_result_rows": test_result_rows.columns["result_row"].values() | list}) %}
+                {% endif %}
+            {% endfor %}
+        {% endif %}
+        {% do return(tests) %}
+    {% endif %}
     {% set test_results = [] %}
     {% set tests = elementary.agate_to_dicts(test_results_agate) %}
 
+    {% set latest_tests = {} %}
+    {% for test in tests if test.invocations_rank_index == 1 %}
+        {% do latest_tests.update({test.elementary_unique_id: test}) %}
+    {% endfor %}
+    {% for test in tests if test.invocations_rank_index != 1 and test.elementary_unique_id in latest_tests %}
+        {% for column in static_columns or [] if test[column] is none %}
+            {% do test.update({column: latest_tests[test.elementary_unique_id][column]}) %}
+        {% endfor %}
+    {% endfor %}
+
     {% set filtered_tests = [] %}
     {% for test in tests %}
         {% set test_meta = fromjson(test.meta) %}
@@ -27,7 +109,7 @@
             {% set status = test.status | lower %}
 
             {%- if not skip_test_result_rows and ((test_type == 'dbt_test' and status in ['fail', 'warn']) or (test_type != 'dbt_test' and status in elementary_tests_allowlist_status)) -%}
-                {% set test_rows_sample = elementary_cli.get_test_rows_sample(test.result_rows, test_result_rows_agate.get(test.id)) %}
+                {% set test_rows_sample = elementary_cli.get_test_rows_sample(test.result_rows, test_result_rows_agate.get(test.id), sample_rows_limit) %}
             {%- endif -%}
         {% else %}
             {# Null out test_results_query for non-latest invocations to save memory #}
@@ -40,7 +122,7 @@
     {% do return(test_results) %}
 {%- endmacro -%}
 
-{%- macro default__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false) -%}
+{%- macro default__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false, raw = false, sample_rows_limit = none, static_columns = none) -%}
     {% set elementary_tests_allowlist_status = ['fail', 'warn'] if disable_passed_test_metrics else ['fail', 'warn', 'pass']  %}
     {% set select_test_results %}
         with test_results as (
@@ -56,42 +138,7 @@
             from test_results
         )
 
-        select
-            test_results.id,
-            test_results.invocation_id,
-            test_results.test_execution_id,
-            test_results.model_unique_id,
-            test_results.test_unique_id,
-            test_results.elementary_unique_id,
-            {{elementary.edr_cast_as_timestamp('test_results.detected_at')}} as detected_at,
-            test_results.database_name,
-            test_results.schema_name,
-            test_results.table_name,
-            test_results.column_name,
-            test_results.test_type,
-            test_results.test_sub_type,
-            test_results.test_results_description,
-            test_results.test_description,
-            test_results.original_path,
-            test_results.package_name,
-            test_results.owners,
-            test_results.model_owner,
-            test_results.tags,
-            test_results.test_tags,
-            test_results.model_tags,
-            test_results.meta,
-            test_results.model_meta,
-            case when test_results.invocations_rank_index = 1 then test_results.test_results_query else NULL end as test_results_query,
-            test_results.other,
-            test_results.test_name,
-            test_results.test_params,
-            test_results.severity,
-            test_results.status,
-            test_results.execution_time,
-            test_results.days_diff,
-            test_results.invocations_rank_index,
-            test_results.failures,
-            test_results.result_rows
+        select {{ elementary_cli.get_test_results_columns(static_columns) }}
         from ordered_test_results as test_results
         where test_results.invocations_rank_index <= {{ invocations_per_test }}
         order by test_results.elementary_unique_id, test_results.invocations_rank_index desc
@@ -112,7 +159,7 @@
 
     {% set test_results_agate = elementary.run_query(test_results_agate_sql) %}
     {% if not skip_test_result_rows %}
-        {% set test_result_rows_agate = elementary_cli.get_result_rows_agate(days_back, valid_ids_query) %}
+        {% set test_result_rows_agate = elementary_cli.get_result_rows_agate(days_back, valid_ids_query, sample_rows_limit) %}
     {% else %}
         {% set test_result_rows_agate = {} %}
     {% endif %}
@@ -120,10 +167,10 @@
         {% do elementary.fully_drop_relation(ordered_test_results_relation) %}
     {% endif %}
 
-    {% do return(elementary_cli._process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows)) %}
+    {% do return(elementary_cli._process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows, raw, sample_rows_limit, static_columns)) %}
 {%- endmacro -%}
 
-{%- macro fabric__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false) -%}
+{%- macro fabric__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false, raw = false, sample_rows_limit = none, static_columns = none) -%}
     {#
         T-SQL does not allow nested CTEs (WITH inside WITH).
         current_tests_run_results_query already starts with WITH, so we
@@ -154,8 +201,8 @@
     {# Step 3 – final query: filter by invocations_per_test #}
     {# ORDER BY must be here, not inside create_temp_table — T-SQL forbids ORDER BY in views/subqueries without TOP #}
     {% set test_results_agate_sql %}
-        select *
-        from {{ ordered_relation }}
+        select {{ elementary_cli.get_test_results_columns(static_columns) }}
+        from {{ ordered_relation }} as test_results
         where invocations_rank_index <= {{ invocations_per_test }}
         order by elementary_unique_id, invocations_rank_index desc
     {% endset %}
@@ -168,7 +215,7 @@
 
     {% set test_results_agate = elementary.run_query(test_results_agate_sql) %}
     {% if not skip_test_result_rows %}
-        {% set test_result_rows_agate = elementary_cli.get_result_rows_agate(days_back, valid_ids_query) %}
+        {% set test_result_rows_agate = elementary_cli.get_result_rows_agate(days_back, valid_ids_query, sample_rows_limit) %}
     {% else %}
         {% set test_result_rows_agate = {} %}
     {% endif %}
@@ -177,14 +224,14 @@
     {% do elementary.fully_drop_relation(base_relation) %}
     {% do elementary.fully_drop_relation(ordered_relation) %}
 
-    {% do return(elementary_cli._process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows)) %}
+    {% do return(elementary_cli._process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows, raw, sample_rows_limit, static_columns)) %}
 {%- endmacro -%}
 
-{%- macro sqlserver__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false) -%}
-    {% do return(elementary_cli.fabric__get_test_results(days_back, invocations_per_test, disable_passed_test_metrics, skip_test_result_rows)) %}
+{%- macro sqlserver__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false, raw = false, sample_rows_limit = none, static_columns = none) -%}
+    {% do return(elementary_cli.fabric__get_test_results(days_back, invocations_per_test, disable_passed_test_metrics, skip_test_result_rows, raw, sample_rows_limit, static_columns)) %}
 {%- endmacro -%}
 
-{%- macro clickhouse__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false) -%}
+{%- macro clickhouse__get_test_results(days_back = 7, invocations_per_test = 720, disable_passed_test_metrics = false, skip_test_result_rows = false, raw = false, sample_rows_limit = none, static_columns = none) -%}
     {% set elementary_tests_allowlist_status = ['fail', 'warn'] if disable_passed_test_metrics else ['fail', 'warn', 'pass']  %}
     {% do elementary.run_query('drop table if exists ordered_test_results') %}
     {% set create_table_query %}
@@ -303,7 +350,9 @@
     {% set test_results = [] %}
 
     {% set test_results_agate_sql %}
-        select * from {{ ordered_test_results_relation }}
+        select {{ elementary_cli.get_test_results_columns(static_columns) }}
+        from {{ ordered_test_results_relation }} as test_results
+        order by elementary_unique_id, invocations_rank_index desc
     {% endset %}
 
     {% set valid_ids_query %}
@@ -314,7 +363,7 @@
 
     {% set test_results_agate = elementary.run_query(test_results_agate_sql) %}
     {% if not skip_test_result_rows %}
-        {% set test_result_rows_agate = elementary_cli.get_result_rows_agate(days_back, valid_ids_query) %}
+        {% set test_result_rows_agate = elementary_cli.get_result_rows_agate(days_back, valid_ids_query, sample_rows_limit) %}
     {% else %}
         {% set test_result_rows_agate = {} %}
     {% endif %}
@@ -322,5 +371,5 @@
         {% do elementary.fully_drop_relation(ordered_test_results_relation) %}
     {% endif %}
 
-    {% do return(elementary_cli._process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows)) %}
+    {% do return(elementary_cli._process_raw_test_results(test_results_agate, test_result_rows_agate, elementary_tests_allowlist_status, skip_test_result_rows, raw, sample_rows_limit, static_columns)) %}
 {%- endmacro -%}
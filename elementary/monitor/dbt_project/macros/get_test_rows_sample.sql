@@ -2,8 +2,10 @@
   Sources of parameters:
   legacy_result_rows: elementary_test_results.result_rows
   result_rows_agate: test_result_rows
+  sample_rows_limit: maximum number of rows to keep (none to keep all of them)
+  sample_columns: the columns to keep in each row (none to keep all of them)
 #}
-{%- macro get_test_rows_sample(legacy_result_rows, result_rows_agate) -%}
+{%- macro get_test_rows_sample(legacy_result_rows, result_rows_agate, sample_rows_limit = none, sample_columns = none) -%}
 
     {% set result_rows = [] %}
     {% if legacy_result_rows is defined and legacy_result_rows is not none %}
@@ -15,5 +17,23 @@
         {% endfor %}
     {% endif %}
 
+    {% if result_rows is not sequence or result_rows is mapping %}
+        {% do return(result_rows) %}
+    {% endif %}
+    {% if sample_rows_limit is not none %}
+        {% set result_rows = result_rows[:sample_rows_limit] %}
+    {% endif %}
+    {% if sample_columns %}
+        {% set projected_result_rows = [] %}
+        {% for result_row in result_rows %}
+            {% set projected_result_row = {} %}
+            {% for column in sample_columns if result_row is mapping and column in result_row %}
+                {% do projected_result_row.update({column: result_row[column]}) %}
+            {% endfor %}
+            {% do projected_result_rows.append(projected_result_row if result_row is mapping else result_row) %}
+        {% endfor %}
+        {% set result_rows = projected_result_rows %}
+    {% endif %}
+
     {% do return(result_rows) %}
 {%- endmacro -%}
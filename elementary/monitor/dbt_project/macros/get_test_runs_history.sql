@@ -0,0 +1,101 @@
+{#
+    The runs history of every test, in a slim form - a row per test invocation (the last `invocations_per_test` of
+    them) with only what is shown for it, along with the test's totals which are aggregated in the warehouse.
+    Rows of the same invocation are deduplicated here, as a test invocation may have several test results.
+#}
+{%- macro get_test_runs_history(days_back = 7, invocations_per_test = 720, results_path = none) -%}
+    {{ return(adapter.dispatch('get_test_runs_history', 'elementary_cli')(days_back, invocations_per_test, results_path)) }}
+{%- endmacro -%}
+
+{%- macro default__get_test_runs_history(days_back = 7, invocations_per_test = 720, results_path = none) -%}
+    {% set test_runs_history_query %}
+        with test_results as (
+            {{ elementary_cli.current_tests_run_results_query(days_back=days_back, skip_test_result_rows=true) }}
+        ),
+
+        {{ elementary_cli.test_runs_history_query('test_results', invocations_per_test) }}
+    {% endset %}
+    {% set test_runs_history_agate = elementary.run_query(test_runs_history_query) %}
+    {% do return(elementary_cli.return_result_set(test_runs_history_agate, results_path)) %}
+{%- endmacro -%}
+
+{%- macro fabric__get_test_runs_history(days_back = 7, invocations_per_test = 720, results_path = none) -%}
+    {# T-SQL does not allow nested CTEs, so the base test-results query is materialised into a temp table first. #}
+    {% set base_query %}
+        {{ elementary_cli.current_tests_run_results_query(days_back=days_back, skip_test_result_rows=true) }}
+    {% endset %}
+
+    {% set elementary_database, elementary_schema = elementary.get_package_database_and_schema() %}
+    {% set base_relation = elementary.create_temp_table(elementary_database, elementary_schema, 'test_runs_history_base', base_query) %}
+
+    {% set test_runs_history_query %}
+        with {{ elementary_cli.test_runs_history_query(base_relation, invocations_per_test) }}
+    {% endset %}
+    {% set test_runs_history_agate = elementary.run_query(test_runs_history_query) %}
+    {% do elementary.fully_drop_relation(base_relation) %}
+    {% do return(elementary_cli.return_result_set(test_runs_history_agate, results_path)) %}
+{%- endmacro -%}
+
+{%- macro sqlserver__get_test_runs_history(days_back = 7, invocations_per_test = 720, results_path = none) -%}
+    {% do return(elementary_cli.fabric__get_test_runs_history(days_back, invocations_per_test, results_path)) %}
+{%- endmacro -%}
+
+{#
+    The CTEs (without the leading "with") and final select of the history query, on top of the given test results.
+#}
+{%- macro test_runs_history_query(test_results_relation, invocations_per_test) -%}
+    test_invocations as (
+        select
+            elementary_unique_id,
+            coalesce(invocation_id, test_execution_id) as invocation_id,
+            detected_at,
+            status,
+            execution_time,
+            {# Only these descriptions contain the affected rows, the rest aren't needed. #}
+            case when test_results_description like 'Got %' then test_results_description else null end as results_description,
+            row_number() over (partition by elementary_unique_id, coalesce(invocation_id, test_execution_id) order by {{ elementary.edr_cast_as_timestamp('detected_at') }}) as invocation_row_index
+        from {{ test_results_relation }}
+    ),
+
+    ranked_test_invocations as (
+        select
+            *,
+            row_number() over (partition by elementary_unique_id order by {{ elementary.edr_cast_as_timestamp('detected_at') }} desc) as invocations_rank_index
+        from test_invocations
+        where invocation_row_index = 1 and invocation_id is not null
+    ),
+
+    test_invocations_history as (
+        select *
+        from ranked_test_invocations
+        where invocations_rank_index <= {{ invocations_per_test }}
+    ),
+
+    test_invocations_totals as (
+        select
+            elementary_unique_id,
+            count(*) as invocations_count,
+            sum(case when lower(status) = 'fail' then 1 else 0 end) as failures,
+            sum(case when lower(status) = 'error' then 1 else 0 end) as errors,
+            sum(case when lower(status) = 'warn' then 1 else 0 end) as warnings,
+            sum(case when lower(status) = 'pass' then 1 else 0 end) as passed
+        from test_invocations_history
+        group by elementary_unique_id
+    )
+
+    select
+        test_invocations_history.elementary_unique_id,
+        test_invocations_history.invocation_id,
+        {{ elementary.edr_cast_as_timestamp('test_invocations_history.detected_at') }} as detected_at,
+        test_invocations_history.status,
+        test_invocations_history.execution_time,
+        test_invocations_history.results_description,
+        test_invocations_totals.invocations_count,
+        test_invocations_totals.failures,
+        test_invocations_totals.errors,
+        test_invocations_totals.warnings,
+        test_invocations_totals.passed
+    from test_invocations_history
+    join test_invocations_totals on test_invocations_history.elementary_unique_id = test_invocations_totals.elementary_unique_id
+    order by test_invocations_history.elementary_unique_id, test_invocations_history.invocations_rank_index desc
+{%- endmacro -%}
@@ -0,0 +1,25 @@
+{#
+    Batched counterpart of elementary.log_macro_results.
+    Runs every macro in `macros` (a list of {call_id, macro_name, macro_args}) within a single run-operation,
+    and logs each macro's results tagged with its call id so the CLI can route them back to the caller.
+#}
+{% macro log_macros_results(macros) %}
+    {% for macro_call in macros %}
+        {% set macro = elementary_cli.get_macro_by_name(macro_call.macro_name) %}
+        {% set results = macro(**(macro_call.get('macro_args') or {})) %}
+        {% if results is not none %}
+            {% do elementary.edr_log('--ELEMENTARY-BATCH-MACRO-OUTPUT-START--' ~ macro_call.call_id ~ '--' ~ tojson(results) ~ '--ELEMENTARY-MACRO-OUTPUT-END--') %}
+        {% endif %}
+    {% endfor %}
+{% endmacro %}
+
+{% macro get_macro_by_name(macro_name) %}
+    {% set package_and_macro_name = macro_name.split('.') %}
+    {% if package_and_macro_name | length == 1 %}
+        {% do return(context[macro_name]) %}
+    {% elif package_and_macro_name | length == 2 %}
+        {% set package_name, package_macro_name = package_and_macro_name %}
+        {% do return(context[package_name][package_macro_name]) %}
+    {% endif %}
+    {% do exceptions.raise_compiler_error("Received invalid macro name: {}".format(macro_name)) %}
+{% endmacro %}
@@ -0,0 +1,14 @@
+{#
+    Returns a query's result set from a macro.
+    When `results_path` is given, the rows are written to that file as newline-delimited JSON and nothing is returned,
+    so they don't need to be passed (and encoded twice) through the dbt logs.
+    The file is written in the platform's default encoding, so non-ASCII characters are escaped to keep it readable as
+    UTF-8.
+#}
+{% macro return_result_set(agate_table, results_path=none) %}
+    {% if results_path %}
+        {% do agate_table.to_json(results_path, newline=true, ensure_ascii=true) %}
+        {% do return(none) %}
+    {% endif %}
+    {% do return(elementary.agate_to_dicts(agate_table)) %}
+{% endmacro %}
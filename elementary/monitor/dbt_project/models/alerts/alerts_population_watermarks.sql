@@ -0,0 +1,11 @@
+{{
+  config(
+    materialized = 'incremental',
+    on_schema_change = 'sync_all_columns',
+    table_type=elementary.get_default_table_type(),
+    incremental_strategy=elementary.get_default_incremental_strategy()
+  )
+}}
+
+{# Populated by the alerts_v2 post-hook, see get_alerts_population_since. #}
+{{ elementary_cli.empty_alerts_population_watermarks() }}
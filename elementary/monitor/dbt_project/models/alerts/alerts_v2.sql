@@ -6,10 +6,11 @@
     on_schema_change = 'sync_all_columns',
     table_type=elementary.get_default_table_type(),
     incremental_strategy=elementary.get_default_incremental_strategy(),
-    post_hook = "{{ elementary_cli.populate_alerts_table(days_back=var('days_back', 1)) }}"
+    post_hook = "{{ elementary_cli.populate_alerts_table(days_back=var('days_back', 1), sample_rows_limit=var('test_sample_rows_limit', none), sample_columns=var('test_sample_columns', none), overlap_hours=var('alerts_population_overlap_hours', 24)) }}"
   )
 }}
 
+-- depends_on: {{ ref('alerts_population_watermarks') }}
 -- depends_on: {{ ref('dbt_tests') }}
 -- depends_on: {{ ref('elementary_test_results') }}
 -- depends_on: {{ ref('test_result_rows', package='elementary') }}
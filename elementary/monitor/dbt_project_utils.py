@@ -13,7 +13,7 @@ CLI_DBT_PROJECT_PATH = os.path.join(_MONITOR_DIR, "dbt_project")
 
 
 def is_dbt_package_up_to_date(project_dir: str) -> bool:
-    installed_version = _get_installed_dbt_package_version(project_dir)
+    installed_version = get_installed_dbt_package_version(project_dir)
     if installed_version is None:
         return False
 
@@ -33,7 +33,7 @@ def _get_elementary_package_path(project_dir: str) -> Optional[str]:
     return None
 
 
-def _get_installed_dbt_package_version(project_dir: str) -> Optional[str]:
+def get_installed_dbt_package_version(project_dir: str) -> Optional[str]:
     package_path = _get_elementary_package_path(project_dir)
     if package_path is None:
         return None
@@ -1,5 +1,4 @@
-import json
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import click
 
@@ -10,6 +9,8 @@ from elementary.monitor.fetchers.alerts.schema.pending_alerts import (
     AlertTypes,
     PendingAlertSchema,
 )
+from elementary.utils import json_utils
+from elementary.utils.json_utils import iter_json_array
 from elementary.utils.log import get_logger
 from elementary.utils.time import get_now_utc_str
 
@@ -30,26 +31,49 @@ class AlertsFetcher(FetcherClient):
         alerts_to_skip: List[PendingAlertSchema],
     ):
         alert_ids = [alert.id for alert in alerts_to_skip]
-        alert_ids_chunks = self._split_list_to_chunks(alert_ids)
         click.echo(f"Update skipped alerts ({len(alerts_to_skip)})")
-        for alert_ids_chunk in alert_ids_chunks:
-            self.dbt_runner.run(
-                select="elementary_cli.update_alerts.update_skipped_alerts",
-                vars={"alert_ids": alert_ids_chunk},
-                quiet=True,
-            )
+        self._update_alerts_status(alert_ids, status="skipped")
 
     def query_pending_alerts(
-        self, days_back: int, type: Optional[AlertTypes] = None
+        self,
+        days_back: int,
+        type: Optional[AlertTypes] = None,
+        types: Optional[List[AlertTypes]] = None,
+        data_contains: Optional[List[List[str]]] = None,
     ) -> List[PendingAlertSchema]:
+        return list(
+            self.iter_pending_alerts(
+                days_back=days_back,
+                type=type,
+                types=types,
+                data_contains=data_contains,
+            )
+        )
+
+    def iter_pending_alerts(
+        self,
+        days_back: int,
+        type: Optional[AlertTypes] = None,
+        types: Optional[List[AlertTypes]] = None,
+        data_contains: Optional[List[List[str]]] = None,
+    ) -> Iterator[PendingAlertSchema]:
+        if types is not None and not types:
+            return
         pending_alerts_results = self.dbt_runner.run_operation(
             macro_name="elementary_cli.get_pending_alerts",
-            macro_args={"days_back": days_back, "type": type.value if type else None},
+            macro_args={
+                "days_back": days_back,
+                "type": type.value if type else None,
+                "types": (
+                    [alert_type.value for alert_type in types]
+                    if types is not None
+                    else None
+                ),
+                "data_contains": data_contains or None,
+            },
         )
-        return [
-            PendingAlertSchema(**result)
-            for result in json.loads(pending_alerts_results[0])
-        ]
+        for result in iter_json_array(pending_alerts_results[0]):
+            yield PendingAlertSchema(**result)
 
     def query_last_alert_times(
         self, days_back: int, type: Optional[AlertTypes] = None
@@ -58,20 +82,44 @@ class AlertsFetcher(FetcherClient):
             macro_name="elementary_cli.get_last_alert_sent_times",
             macro_args={"days_back": days_back, "type": type.value if type else None},
         )
-        return json.loads(response[0])
+        return json_utils.loads(response[0])
 
-    def update_sent_alerts(self, alert_ids: List[str]) -> None:
-        alert_ids_chunks = self._split_list_to_chunks(alert_ids)
+    def update_sent_alerts(self, alert_ids: List[str]) -> bool:
         click.echo(f"Update sent alerts ({len(alert_ids)})")
-        for alert_ids_chunk in alert_ids_chunks:
-            self.dbt_runner.run(
-                select="elementary_cli.update_alerts.update_sent_alerts",
-                vars={
+        return self._update_alerts_status(
+            alert_ids, status="sent", sent_at=get_now_utc_str()
+        )
+
+    def _update_alerts_status(
+        self, alert_ids: List[str], status: str, sent_at: Optional[str] = None
+    ) -> bool:
+        """Returns whether the macro confirmed that the update of every chunk of ids was committed."""
+        updated_successfully = True
+        # All the ids are updated by a single statement, the chunks are only needed when the ids are passed through
+        # a command line that can't fit all of them.
+        for alert_ids_chunk in self._split_list_to_chunks(
+            alert_ids, chunk_size=self._get_alert_ids_chunk_size(alert_ids)
+        ):
+            response = self.dbt_runner.run_operation(
+                macro_name="elementary_cli.update_alerts_status",
+                macro_args={
                     "alert_ids": alert_ids_chunk,
-                    "sent_at": get_now_utc_str(),
+                    "status": status,
+                    "sent_at": sent_at,
                 },
                 quiet=True,
             )
+            if not response or json_utils.loads(response[0]) is not True:
+                updated_successfully = False
+        return updated_successfully
+
+    def _get_alert_ids_chunk_size(self, alert_ids: List[str]) -> int:
+        max_command_arg_length = self.dbt_runner.max_command_arg_length
+        if not alert_ids or max_command_arg_length is None:
+            return max(len(alert_ids), 1)
+        # Leaves room for the rest of the macro args, each id is also quoted and separated.
+        max_alert_id_length = max(len(alert_id) for alert_id in alert_ids) + 4
+        return max((max_command_arg_length - 1000) // max_alert_id_length, 1)
 
     @staticmethod
     def _split_list_to_chunks(items: list, chunk_size: int = 50) -> List[List]:
@@ -0,0 +1,63 @@
+import os
+import time
+from typing import Optional
+
+from elementary.clients.dbt.base_dbt_runner import BaseDbtRunner
+from elementary.clients.fetcher.fetcher import FetcherClient
+from elementary.monitor.fetchers.bootstrap.schema import BootstrapSchema
+from elementary.utils import json_utils
+from elementary.utils.json_file_cache import JsonFileCache
+from elementary.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+BOOTSTRAP_CACHE_FILE_NAME = "bootstrap_cache.json"
+
+
+class BootstrapFetcher(FetcherClient):
+    def __init__(
+        self,
+        dbt_runner: BaseDbtRunner,
+        cache_dir: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        cache_ttl: int = 0,
+    ):
+        super().__init__(dbt_runner)
+        self.cache_key = cache_key
+        self.cache_ttl = cache_ttl
+        # The bootstrap is only cached when there's a place, a key and a TTL to cache it by.
+        self.cache = (
+            JsonFileCache(os.path.join(cache_dir, BOOTSTRAP_CACHE_FILE_NAME))
+            if cache_dir and cache_key and cache_ttl > 0
+            else None
+        )
+
+    def get_bootstrap(self) -> BootstrapSchema:
+        cached_bootstrap = self._get_cached_bootstrap()
+        if cached_bootstrap is not None:
+            logger.debug("Using the cached bootstrap of '%s'.", self.cache_key)
+            return cached_bootstrap
+
+        response = self.dbt_runner.run_operation("elementary_cli.bootstrap", quiet=True)
+        bootstrap = BootstrapSchema(**json_utils.loads(response[0]))
+        self._cache_bootstrap(bootstrap)
+        return bootstrap
+
+    def _get_cached_bootstrap(self) -> Optional[BootstrapSchema]:
+        if self.cache is None:
+            return None
+        cache_entry = self.cache.load().get(self.cache_key)
+        if not cache_entry or time.time() - cache_entry["cached_at"] > self.cache_ttl:
+            return None
+        return BootstrapSchema(**cache_entry["bootstrap"])
+
+    def _cache_bootstrap(self, bootstrap: BootstrapSchema) -> None:
+        if self.cache is None:
+            return
+        cache = {
+            cache_key: cache_entry
+            for cache_key, cache_entry in self.cache.load().items()
+            if time.time() - cache_entry.get("cached_at", 0) <= self.cache_ttl
+        }
+        cache[self.cache_key] = dict(cached_at=time.time(), bootstrap=bootstrap.dict())
+        self.cache.save(cache)
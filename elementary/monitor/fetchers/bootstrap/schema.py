@@ -0,0 +1,10 @@
+from typing import Any, Dict, Optional
+
+from elementary.utils.pydantic_shim import BaseModel
+
+
+class BootstrapSchema(BaseModel):
+    latest_invocation: Dict[str, Any] = {}
+    warehouse_type: Optional[str] = None
+    warehouse_unique_id: Optional[str] = None
+    elementary_database_and_schema: Optional[str] = None
@@ -1,12 +1,17 @@
-import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from elementary.clients.fetcher.fetcher import FetcherClient
 from elementary.monitor.fetchers.invocations.schema import DbtInvocationSchema
+from elementary.utils import json_utils
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+_MODELS_LATEST_INVOCATION_MACRO = "elementary_cli.get_models_latest_invocation"
+_MODELS_LATEST_INVOCATIONS_DATA_MACRO = (
+    "elementary_cli.get_models_latest_invocations_data"
+)
+
 
 class InvocationsFetcher(FetcherClient):
     def get_test_last_invocation(
@@ -15,7 +20,9 @@ class InvocationsFetcher(FetcherClient):
         invocation_response = self.dbt_runner.run_operation(
             macro_name="elementary_cli.get_test_last_invocation", macro_args=macro_args
         )
-        invocation = json.loads(invocation_response[0]) if invocation_response else None
+        invocation = (
+            json_utils.loads(invocation_response[0]) if invocation_response else None
+        )
         if invocation:
             return DbtInvocationSchema(**invocation[0])
         else:
@@ -24,10 +31,41 @@ class InvocationsFetcher(FetcherClient):
 
     def get_models_latest_invocations_data(self) -> List[DbtInvocationSchema]:
         invocations_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_models_latest_invocations_data"
+            macro_name=_MODELS_LATEST_INVOCATIONS_DATA_MACRO
+        )
+        return self._parse_models_latest_invocations_data(invocations_response)
+
+    def get_models_latest_invocation(self) -> Dict[str, str]:
+        response = self.dbt_runner.run_operation(
+            macro_name=_MODELS_LATEST_INVOCATION_MACRO
         )
+        return self._parse_models_latest_invocation(response)
+
+    def get_models_latest_invocations(
+        self,
+    ) -> Tuple[Dict[str, str], List[DbtInvocationSchema]]:
+        """Fetches both the models latest invocation map and the invocations data in a single dbt invocation."""
+        responses = self.dbt_runner.run_operations_batch(
+            [
+                (_MODELS_LATEST_INVOCATION_MACRO, None),
+                (_MODELS_LATEST_INVOCATIONS_DATA_MACRO, None),
+            ]
+        )
+        return (
+            self._parse_models_latest_invocation(
+                responses[_MODELS_LATEST_INVOCATION_MACRO]
+            ),
+            self._parse_models_latest_invocations_data(
+                responses[_MODELS_LATEST_INVOCATIONS_DATA_MACRO]
+            ),
+        )
+
+    @staticmethod
+    def _parse_models_latest_invocations_data(
+        invocations_response: list,
+    ) -> List[DbtInvocationSchema]:
         invocation_results = (
-            json.loads(invocations_response[0]) if invocations_response else []
+            json_utils.loads(invocations_response[0]) if invocations_response else []
         )
         invocation_results = [
             DbtInvocationSchema(**invocation_result)
@@ -35,11 +73,11 @@ class InvocationsFetcher(FetcherClient):
         ]
         return invocation_results
 
-    def get_models_latest_invocation(self) -> Dict[str, str]:
-        response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_models_latest_invocation"
+    @staticmethod
+    def _parse_models_latest_invocation(response: list) -> Dict[str, str]:
+        models_latest_invocation_results = (
+            json_utils.loads(response[0]) if response else []
         )
-        models_latest_invocation_results = json.loads(response[0]) if response else []
 
         models_latest_invocation_map = {
             result["unique_id"]: result["invocation_id"]
@@ -1,8 +1,8 @@
-import json
 from typing import Dict, List, Optional, Set
 
 from elementary.clients.fetcher.fetcher import FetcherClient
 from elementary.monitor.api.lineage.schema import NodeDependsOnNodesSchema
+from elementary.utils import json_utils
 
 _MATERIALIZATION_TO_SUB_TYPE = {
     "view": "view",
@@ -20,7 +20,7 @@ class LineageFetcher(FetcherClient):
             macro_args={"exclude_elementary": exclude_elementary_models},
         )
 
-        nodes = json.loads(results[0]) if results else []
+        nodes = json_utils.loads(results[0]) if results else []
         nodes = [self._normalize_result_dict(result) for result in nodes]
         id_to_node_map = {node["unique_id"]: node for node in nodes}
         return [
@@ -46,7 +46,7 @@ class LineageFetcher(FetcherClient):
         return {
             **result_dict,
             "depends_on_nodes": (
-                json.loads(result_dict["depends_on_nodes"])
+                json_utils.loads(result_dict["depends_on_nodes"])
                 if result_dict["depends_on_nodes"]
                 else []
             ),
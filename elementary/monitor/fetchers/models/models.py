@@ -1,8 +1,8 @@
-import json
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from elementary.clients.fetcher.fetcher import FetcherClient
 from elementary.monitor.fetchers.models.schema import (
+    DbtArtifactsSchema,
     ExposureSchema,
     ModelRunSchema,
     ModelSchema,
@@ -11,6 +11,7 @@ from elementary.monitor.fetchers.models.schema import (
     SnapshotSchema,
     SourceSchema,
 )
+from elementary.utils import json_utils
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -18,73 +19,144 @@ logger = get_logger(__name__)
 YAML_FILE_EXTENSION = ".yml"
 SQL_FILE_EXTENSION = ".sql"
 
+_SEEDS_MACRO = "elementary_cli.get_seeds"
+_SNAPSHOTS_MACRO = "elementary_cli.get_snapshots"
+_MODELS_MACRO = "elementary_cli.get_models"
+_SOURCES_MACRO = "elementary_cli.get_sources"
+_EXPOSURES_MACRO = "elementary_cli.get_exposures"
+_TEST_COVERAGES_MACRO = "elementary_cli.get_dbt_models_test_coverage"
+
 
 class ModelsFetcher(FetcherClient):
     def get_models_runs(
         self, days_back: Optional[int] = 7, exclude_elementary_models: bool = False
     ) -> List[ModelRunSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
+        return list(
+            self.iter_models_runs(
+                days_back=days_back,
+                exclude_elementary_models=exclude_elementary_models,
+            )
+        )
+
+    def iter_models_runs(
+        self, days_back: Optional[int] = 7, exclude_elementary_models: bool = False
+    ) -> Iterator[ModelRunSchema]:
+        model_run_dicts = self.dbt_runner.run_operation_rows(
             macro_name="elementary_cli.get_models_runs",
             macro_args={
                 "days_back": days_back,
                 "exclude_elementary": exclude_elementary_models,
             },
         )
-        model_run_dicts = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
-        )
-        model_runs = [ModelRunSchema(**model_run) for model_run in model_run_dicts]
-        return model_runs
+        for model_run in model_run_dicts:
+            yield ModelRunSchema(**model_run)
 
     def get_seeds(self) -> List[SeedSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_seeds",
+        return self._parse_seeds(self.dbt_runner.run_operation(macro_name=_SEEDS_MACRO))
+
+    def get_snapshots(self) -> List[SnapshotSchema]:
+        return self._parse_snapshots(
+            self.dbt_runner.run_operation(macro_name=_SNAPSHOTS_MACRO)
+        )
+
+    def get_models(self, exclude_elementary_models: bool = False) -> List[ModelSchema]:
+        return self._parse_models(
+            self.dbt_runner.run_operation(
+                macro_name=_MODELS_MACRO,
+                macro_args={"exclude_elementary": exclude_elementary_models},
+            )
+        )
+
+    def get_sources(self) -> List[SourceSchema]:
+        return self._parse_sources(
+            self.dbt_runner.run_operation(macro_name=_SOURCES_MACRO)
+        )
+
+    def get_exposures(self) -> List[ExposureSchema]:
+        return self._parse_exposures(
+            self.dbt_runner.run_operation(macro_name=_EXPOSURES_MACRO)
+        )
+
+    def get_test_coverages(self) -> List[ModelTestCoverage]:
+        return self._parse_test_coverages(
+            self.dbt_runner.run_operation(macro_name=_TEST_COVERAGES_MACRO)
+        )
+
+    def get_artifacts(
+        self, exclude_elementary_models: bool = False
+    ) -> DbtArtifactsSchema:
+        """Fetches the seeds, snapshots, models, sources, exposures and test coverages in a single dbt invocation."""
+        responses = self.dbt_runner.run_operations_batch(
+            [
+                (_SEEDS_MACRO, None),
+                (_SNAPSHOTS_MACRO, None),
+                (_MODELS_MACRO, {"exclude_elementary": exclude_elementary_models}),
+                (_SOURCES_MACRO, None),
+                (_EXPOSURES_MACRO, None),
+                (_TEST_COVERAGES_MACRO, None),
+            ]
+        )
+        return DbtArtifactsSchema(
+            seeds=self._parse_seeds(responses[_SEEDS_MACRO]),
+            snapshots=self._parse_snapshots(responses[_SNAPSHOTS_MACRO]),
+            models=self._parse_models(responses[_MODELS_MACRO]),
+            sources=self._parse_sources(responses[_SOURCES_MACRO]),
+            exposures=self._parse_exposures(responses[_EXPOSURES_MACRO]),
+            coverages=self._parse_test_coverages(responses[_TEST_COVERAGES_MACRO]),
+        )
+
+    @staticmethod
+    def _parse_seeds(run_operation_response: list) -> List[SeedSchema]:
+        seeds = (
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
-        seeds = json.loads(run_operation_response[0]) if run_operation_response else []
         seeds = [SeedSchema(**seed) for seed in seeds]
         return seeds
 
-    def get_snapshots(self) -> List[SnapshotSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_snapshots"
-        )
+    @staticmethod
+    def _parse_snapshots(run_operation_response: list) -> List[SnapshotSchema]:
         snapshots = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
         snapshots = [SnapshotSchema(**snapshot) for snapshot in snapshots]
         return snapshots
 
-    def get_models(self, exclude_elementary_models: bool = False) -> List[ModelSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_models",
-            macro_args={"exclude_elementary": exclude_elementary_models},
+    @staticmethod
+    def _parse_models(run_operation_response: list) -> List[ModelSchema]:
+        models = (
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
-        models = json.loads(run_operation_response[0]) if run_operation_response else []
         models = [ModelSchema(**model) for model in models]
         return models
 
-    def get_sources(self) -> List[SourceSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_sources"
-        )
+    @staticmethod
+    def _parse_sources(run_operation_response: list) -> List[SourceSchema]:
         sources = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
         sources = [SourceSchema(**source) for source in sources]
         return sources
 
-    def get_exposures(self) -> List[ExposureSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_exposures"
-        )
+    @staticmethod
+    def _parse_exposures(run_operation_response: list) -> List[ExposureSchema]:
         exposures = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
         exposures = [
             {
                 **exposure,
                 "raw_queries": (
-                    json.loads(exposure["raw_queries"])
+                    json_utils.loads(exposure["raw_queries"])
                     if exposure.get("raw_queries")
                     else None
                 ),
@@ -94,12 +166,12 @@ class ModelsFetcher(FetcherClient):
         exposures = [ExposureSchema(**exposure) for exposure in exposures]
         return exposures
 
-    def get_test_coverages(self) -> List[ModelTestCoverage]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_dbt_models_test_coverage"
-        )
+    @staticmethod
+    def _parse_test_coverages(run_operation_response: list) -> List[ModelTestCoverage]:
         coverages = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
         coverages = [ModelTestCoverage(**coverage) for coverage in coverages]
         return coverages
@@ -123,3 +123,12 @@ class ModelTestCoverage(ExtendedBaseModel):
     model_unique_id: Optional[str] = None
     column_tests: int = 0
     table_tests: int = 0
+
+
+class DbtArtifactsSchema(ExtendedBaseModel):
+    seeds: List[SeedSchema] = Field(default_factory=list)
+    snapshots: List[SnapshotSchema] = Field(default_factory=list)
+    models: List[ModelSchema] = Field(default_factory=list)
+    sources: List[SourceSchema] = Field(default_factory=list)
+    exposures: List[ExposureSchema] = Field(default_factory=list)
+    coverages: List[ModelTestCoverage] = Field(default_factory=list)
@@ -1,11 +1,64 @@
-from typing import List
+import hashlib
+import os
+from typing import List, Optional
 
+from elementary.clients.dbt.base_dbt_runner import BaseDbtRunner
 from elementary.clients.fetcher.fetcher import FetcherClient
+from elementary.utils.json_file_cache import JsonFileCache
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+SELECTOR_CACHE_FILE_NAME = "selector_cache.json"
+# Artifacts dbt rewrites whenever it parses the project, so they change whenever the selected nodes might.
+_PROJECT_FINGERPRINT_ARTIFACTS = ["manifest.json", "partial_parse.msgpack"]
+
 
 class SelectorFetcher(FetcherClient):
+    def __init__(self, dbt_runner: BaseDbtRunner, cache_dir: Optional[str] = None):
+        super().__init__(dbt_runner)
+        self.cache = (
+            JsonFileCache(os.path.join(cache_dir, SELECTOR_CACHE_FILE_NAME))
+            if cache_dir
+            else None
+        )
+
     def get_selector_results(self, selector: str) -> List[str]:
-        return self.dbt_runner.ls(select=selector)
+        project_fingerprint = self._get_project_fingerprint()
+        if self.cache is None or project_fingerprint is None:
+            return self.dbt_runner.ls(select=selector)
+
+        cache = self.cache.load()
+        cache_key = self._get_cache_key(selector)
+        cache_entry = cache.get(cache_key)
+        if cache_entry and cache_entry.get("fingerprint") == project_fingerprint:
+            logger.debug(f"Using the cached nodes of the selector '{selector}'.")
+            return cache_entry["node_names"]
+
+        node_names = self.dbt_runner.ls(select=selector)
+        # dbt ls parses the project itself and might rewrite the artifacts, so the fingerprint is taken again.
+        cache[cache_key] = dict(
+            fingerprint=self._get_project_fingerprint(), node_names=node_names
+        )
+        self.cache.save(cache)
+        return node_names
+
+    def _get_cache_key(self, selector: str) -> str:
+        return f"{os.path.abspath(self.dbt_runner.project_dir)}:{selector}"
+
+    def _get_project_fingerprint(self) -> Optional[str]:
+        target_dir = os.path.join(
+            self.dbt_runner.project_dir, os.environ.get("DBT_TARGET_PATH", "target")
+        )
+        fingerprint = hashlib.sha256()
+        found_artifact = False
+        for artifact_name in _PROJECT_FINGERPRINT_ARTIFACTS:
+            artifact_path = os.path.join(target_dir, artifact_name)
+            if not os.path.exists(artifact_path):
+                continue
+            found_artifact = True
+            fingerprint.update(artifact_name.encode())
+            with open(artifact_path, "rb") as artifact_file:
+                for chunk in iter(lambda: artifact_file.read(1024 * 1024), b""):
+                    fingerprint.update(chunk)
+        return fingerprint.hexdigest() if found_artifact else None
@@ -1,4 +1,3 @@
-import json
 from typing import List, Optional
 
 from elementary.clients.dbt.base_dbt_runner import BaseDbtRunner
@@ -6,6 +5,7 @@ from elementary.clients.fetcher.fetcher import FetcherClient
 from elementary.monitor.fetchers.source_freshnesses.schema import (
     SourceFreshnessResultDBRowSchema,
 )
+from elementary.utils import json_utils
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -28,7 +28,9 @@ class SourceFreshnessesFetcher(FetcherClient):
             ),
         )
         source_freshness_results = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
         source_freshness_results = [
             SourceFreshnessResultDBRowSchema(**source_freshness_result)
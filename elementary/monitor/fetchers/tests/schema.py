@@ -102,6 +102,27 @@ class TestResultDBRowSchema(ExtendedBaseModel):
         return failures or None if test_type == "dbt_test" else None
 
 
+class TestRunHistoryDBRowSchema(ExtendedBaseModel):
+    __test__ = False  # Mark for pytest - The class name starts with "Test" which throws warnings on pytest runs
+
+    elementary_unique_id: str
+    invocation_id: str
+    detected_at: str
+    status: str
+    execution_time: Optional[float] = None
+    results_description: Optional[str] = None
+    # The test's totals over its whole history, the same on all of its rows.
+    invocations_count: int
+    failures: int
+    errors: int
+    warnings: int
+    passed: int
+
+    @validator("detected_at", pre=True)
+    def format_detected_at(cls, detected_at):
+        return convert_partial_iso_format_to_full_iso_format(detected_at)
+
+
 class TestDBRowSchema(ExtendedBaseModel):
     unique_id: str
     model_unique_id: Optional[str] = None
@@ -1,5 +1,5 @@
-import json
-from typing import List, Optional
+from itertools import groupby
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from elementary.clients.dbt.base_dbt_runner import BaseDbtRunner
 from elementary.clients.fetcher.fetcher import FetcherClient
@@ -7,11 +7,32 @@ from elementary.monitor.fetchers.tests.schema import (
     NormalizedTestSchema,
     TestDBRowSchema,
     TestResultDBRowSchema,
+    TestRunHistoryDBRowSchema,
 )
+from elementary.utils import json_utils
+from elementary.utils.json_utils import try_load_json
 from elementary.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+_TESTS_MACRO = "elementary_cli.get_tests"
+_SINGULAR_TESTS_MACRO = "elementary_cli.get_singular_tests"
+
+# Test metadata that get_test_results selects only for the latest invocation of each test.
+TEST_RESULTS_STATIC_COLUMNS = [
+    "test_description",
+    "original_path",
+    "package_name",
+    "owners",
+    "model_owner",
+    "tags",
+    "test_tags",
+    "model_tags",
+    "meta",
+    "model_meta",
+    "test_params",
+]
+
 
 class TestsFetcher(FetcherClient):
     def __init__(self, dbt_runner: BaseDbtRunner):
@@ -23,7 +44,29 @@ class TestsFetcher(FetcherClient):
         invocations_per_test: int = 720,
         disable_passed_test_metrics: bool = False,
         skip_test_result_rows: bool = False,
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
     ) -> List[TestResultDBRowSchema]:
+        return list(
+            self.iter_all_test_results_db_rows(
+                days_back=days_back,
+                invocations_per_test=invocations_per_test,
+                disable_passed_test_metrics=disable_passed_test_metrics,
+                skip_test_result_rows=skip_test_result_rows,
+                sample_rows_limit=sample_rows_limit,
+                sample_columns=sample_columns,
+            )
+        )
+
+    def iter_all_test_results_db_rows(
+        self,
+        days_back: Optional[int] = 7,
+        invocations_per_test: int = 720,
+        disable_passed_test_metrics: bool = False,
+        skip_test_result_rows: bool = False,
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
+    ) -> Iterator[TestResultDBRowSchema]:
         run_operation_response = self.dbt_runner.run_operation(
             macro_name="elementary_cli.get_test_results",
             macro_args=dict(
@@ -31,22 +74,168 @@ class TestsFetcher(FetcherClient):
                 invocations_per_test=invocations_per_test,
                 disable_passed_test_metrics=disable_passed_test_metrics,
                 skip_test_result_rows=skip_test_result_rows,
+                # The post-processing is done here, it's much slower in Jinja.
+                raw=True,
+                # The rows are capped per test result in the query, so a test with many failed rows stays cheap.
+                sample_rows_limit=sample_rows_limit,
+                static_columns=TEST_RESULTS_STATIC_COLUMNS,
             ),
         )
-        test_results = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+        if not run_operation_response:
+            return
+        # The test results are decoded one by one, so only the invocations of a single test are held at a time.
+        yield from self._process_raw_test_results(
+            test_results=json_utils.iter_json_array(run_operation_response[0]),
+            disable_passed_test_metrics=disable_passed_test_metrics,
+            skip_test_result_rows=skip_test_result_rows,
+            sample_rows_limit=sample_rows_limit,
+            sample_columns=sample_columns,
         )
-        test_results = [
-            TestResultDBRowSchema(**test_result) for test_result in test_results
-        ]
-        return test_results
+
+    @classmethod
+    def _process_raw_test_results(
+        cls,
+        test_results: Iterable[dict],
+        disable_passed_test_metrics: bool = False,
+        skip_test_result_rows: bool = False,
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
+    ) -> Iterator[TestResultDBRowSchema]:
+        """Filters out tests excluded by their meta, fills in the test metadata of older invocations from the latest
+        one and attaches the sample rows to the latest test results.
+
+        The invocations of each test are expected to be next to each other (get_test_results orders them by test), so
+        the test results are processed one test at a time."""
+        elementary_tests_allowlist_status = (
+            ["fail", "warn"]
+            if disable_passed_test_metrics
+            else ["fail", "warn", "pass"]
+        )
+        for _, test_invocations_group in groupby(
+            test_results, key=lambda test_result: test_result["elementary_unique_id"]
+        ):
+            test_invocations = list(test_invocations_group)
+            latest_test_result = next(
+                (
+                    test_result
+                    for test_result in test_invocations
+                    if test_result["invocations_rank_index"] == 1
+                ),
+                None,
+            )
+            for test_result in test_invocations:
+                # The sample rows of the latest invocation, attached by get_test_results.
+                result_rows = test_result.pop("test_result_rows", None)
+                if (
+                    latest_test_result is not None
+                    and latest_test_result is not test_result
+                ):
+                    for column in TEST_RESULTS_STATIC_COLUMNS:
+                        if test_result.get(column) is None:
+                            test_result[column] = latest_test_result.get(column)
+
+                test_meta = try_load_json(test_result.get("meta")) or {}
+                if not test_meta.get("elementary", {}).get("include", True):
+                    continue
+
+                test_rows_sample = None
+                if test_result["invocations_rank_index"] == 1:
+                    test_type = test_result["test_type"]
+                    status = (test_result["status"] or "").lower()
+                    if not skip_test_result_rows and (
+                        (test_type == "dbt_test" and status in ["fail", "warn"])
+                        or (
+                            test_type != "dbt_test"
+                            and status in elementary_tests_allowlist_status
+                        )
+                    ):
+                        test_rows_sample = cls._get_test_rows_sample(
+                            test_result.get("result_rows"),
+                            result_rows,
+                            sample_rows_limit=sample_rows_limit,
+                            sample_columns=sample_columns,
+                        )
+                else:
+                    # Null out test_results_query for non-latest invocations to save memory
+                    test_result["test_results_query"] = None
+                test_result["sample_data"] = test_rows_sample
+                yield TestResultDBRowSchema(**test_result)
+
+    @staticmethod
+    def _get_test_rows_sample(
+        legacy_result_rows: Optional[str],
+        result_rows: Optional[List[str]],
+        sample_rows_limit: Optional[int] = None,
+        sample_columns: Optional[List[str]] = None,
+    ) -> Optional[Union[dict, list]]:
+        # Old versions of elementary kept the sample in elementary_test_results.result_rows,
+        # newer ones keep it in test_result_rows.
+        if legacy_result_rows is not None:
+            test_rows_sample = try_load_json(legacy_result_rows)
+            if not isinstance(test_rows_sample, list):
+                return test_rows_sample
+        else:
+            test_rows_sample = [
+                try_load_json(result_row) for result_row in result_rows or []
+            ]
+
+        if sample_rows_limit is not None:
+            test_rows_sample = test_rows_sample[:sample_rows_limit]
+        if sample_columns:
+            # Extracting JSON fields isn't portable across warehouses, so the columns are projected here.
+            test_rows_sample = [
+                (
+                    {column: row[column] for column in sample_columns if column in row}
+                    if isinstance(row, dict)
+                    else row
+                )
+                for row in test_rows_sample
+            ]
+        return test_rows_sample
+
+    def iter_test_runs_history(
+        self,
+        days_back: Optional[int] = 7,
+        invocations_per_test: int = 720,
+    ) -> Iterator[TestRunHistoryDBRowSchema]:
+        test_runs_history_rows = self.dbt_runner.run_operation_rows(
+            macro_name="elementary_cli.get_test_runs_history",
+            macro_args=dict(
+                days_back=days_back,
+                invocations_per_test=invocations_per_test,
+            ),
+        )
+        for test_run_history_row in test_runs_history_rows:
+            yield TestRunHistoryDBRowSchema(**test_run_history_row)
 
     def get_singular_tests(self) -> List[NormalizedTestSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_singular_tests"
+        return self._parse_singular_tests(
+            self.dbt_runner.run_operation(macro_name=_SINGULAR_TESTS_MACRO)
+        )
+
+    def get_tests(self) -> List[TestDBRowSchema]:
+        return self._parse_tests(self.dbt_runner.run_operation(macro_name=_TESTS_MACRO))
+
+    def get_tests_and_singular_tests(
+        self,
+    ) -> Tuple[List[TestDBRowSchema], List[NormalizedTestSchema]]:
+        """Fetches both the tests and the singular tests in a single dbt invocation."""
+        responses = self.dbt_runner.run_operations_batch(
+            [(_TESTS_MACRO, None), (_SINGULAR_TESTS_MACRO, None)]
+        )
+        return (
+            self._parse_tests(responses[_TESTS_MACRO]),
+            self._parse_singular_tests(responses[_SINGULAR_TESTS_MACRO]),
         )
+
+    @staticmethod
+    def _parse_singular_tests(
+        run_operation_response: list,
+    ) -> List[NormalizedTestSchema]:
         test_results = (
-            json.loads(run_operation_response[0]) if run_operation_response else []
+            json_utils.loads(run_operation_response[0])
+            if run_operation_response
+            else []
         )
         test_results = [
             NormalizedTestSchema(
@@ -59,10 +248,9 @@ class TestsFetcher(FetcherClient):
         ]
         return test_results
 
-    def get_tests(self) -> List[TestDBRowSchema]:
-        run_operation_response = self.dbt_runner.run_operation(
-            macro_name="elementary_cli.get_tests"
-        )
+    @staticmethod
+    def _parse_tests(run_operation_response: list) -> List[TestDBRowSchema]:
         return [
-            TestDBRowSchema(**test) for test in json.loads(run_operation_response[0])
+            TestDBRowSchema(**test)
+            for test in json_utils.loads(run_operation_response[0])
         ]
@@ -0,0 +1,92 @@
+import ssl
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from slack_sdk import WebhookClient
+from slack_sdk.webhook import WebhookResponse
+from urllib3.util.retry import Retry
+
+DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_MAXSIZE = 10
+# Only failures to connect are retried - a request that was sent might have been handled already.
+_CONNECT_RETRIES = 3
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    def __init__(
+        self,
+        timeout: float,
+        pool_maxsize: int,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        super().__init__(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=None,
+                connect=_CONNECT_RETRIES,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=0.5,
+            ),
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self.ssl_context is not None:
+            kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, *args, **kwargs)
+
+
+def create_http_session(
+    timeout: float = DEFAULT_HTTP_TIMEOUT,
+    pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> requests.Session:
+    """A session that keeps its connections alive and reuses them across requests, with a default timeout.
+
+    Meant to be created once per integration, so that consecutive messages don't pay for a new TCP and TLS
+    handshake each.
+    """
+    session = requests.Session()
+    adapter = _PooledHTTPAdapter(timeout, pool_maxsize, ssl_context)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class PooledWebhookClient(WebhookClient):
+    """A Slack WebhookClient that sends its requests through a pooled requests session.
+
+    WebhookClient opens a new connection for every message. Rate limited responses are returned as is, instead of
+    being retried by the client's retry handlers.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        super().__init__(url, default_headers=default_headers)
+        self.session = session or create_http_session()
+
+    def _perform_http_request(
+        self, *, body: Dict[str, Any], headers: Dict[str, str]
+    ) -> WebhookResponse:
+        headers["Content-Type"] = "application/json;charset=utf-8"
+        response = self.session.post(self.url, json=body, headers=headers)
+        return WebhookResponse(
+            url=self.url,
+            status_code=response.status_code,
+            body=response.text,
+            headers=dict(response.headers),
+        )
@@ -0,0 +1,37 @@
+import os
+import uuid
+
+from elementary.utils import json_utils
+from elementary.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class JsonFileCache:
+    """A dict that is kept in a JSON file between runs. Failing to read or write it is never fatal."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                return json_utils.loads(cache_file.read())
+        except Exception:
+            logger.debug(f"Could not read the cache file '{self.path}'.", exc_info=True)
+            return {}
+
+    def save(self, cache: dict) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Written to a temporary file first so concurrent runs never read a partially written cache.
+            temp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                cache_file.write(json_utils.dumps(cache))
+            os.replace(temp_path, self.path)
+        except OSError:
+            logger.debug(
+                f"Could not write the cache file '{self.path}'.", exc_info=True
+            )
@@ -1,6 +1,89 @@
 import json
 import math
-from typing import Any, List, Optional, Union
+import re
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# The JSON library used by dumps / loads, orjson when it is installed (pip install 'elementary-data[fast-json]').
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_json_whitespace(json_str: str, index: int) -> int:
+    return _JSON_WHITESPACE.match(json_str, index).end()  # type: ignore[union-attr]
+
+
+def dumps(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+) -> str:
+    """
+    Serializes to compact JSON with the fastest available backend.
+    Falls back to the standard library for what orjson doesn't support (e.g. integers above 64 bits).
+    NaN and Infinity aren't valid JSON, so both backends write them as null.
+    To keep them as strings, replace them beforehand (see inf_and_nan_to_str).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except TypeError:
+            pass
+    try:
+        return _stdlib_dumps(obj, default, sort_keys)
+    except ValueError:
+        # Raised for NaN and Infinity, which orjson writes as null.
+        return _stdlib_dumps(
+            _non_finite_floats_to_none(obj),
+            (lambda value: _non_finite_floats_to_none(default(value)))
+            if default is not None
+            else None,
+            sort_keys,
+        )
+
+
+def _stdlib_dumps(
+    obj: Any, default: Optional[Callable[[Any], Any]], sort_keys: bool
+) -> str:
+    return json.dumps(
+        obj,
+        default=default,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+    )
+
+
+def _non_finite_floats_to_none(obj: Any) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _non_finite_floats_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_non_finite_floats_to_none(item) for item in obj]
+    return obj
+
+
+def loads(value: Union[str, bytes]) -> Any:
+    """
+    Deserializes JSON with the fastest available backend.
+    Falls back to the standard library for what orjson rejects (e.g. NaN and Infinity literals).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
 
 
 def try_load_json(value: Optional[Union[str, dict, list]]):
@@ -11,11 +94,37 @@ def try_load_json(value: Optional[Union[str, dict, list]]):
         return value
 
     try:
-        return json.loads(value)
+        return loads(value)
     except Exception:
         return None
 
 
+def iter_json_array(json_array: str) -> Iterator[Any]:
+    """
+    Decodes the items of a JSON array one at a time, so the whole decoded array is never held in memory at once.
+    A JSON null is treated as an empty array.
+    """
+    decoder = json.JSONDecoder()
+    index = _skip_json_whitespace(json_array, 0)
+    if json_array.startswith("null", index):
+        return
+    if not json_array.startswith("[", index):
+        raise json.JSONDecodeError("Expecting '['", json_array, index)
+
+    index = _skip_json_whitespace(json_array, index + 1)
+    if json_array.startswith("]", index):
+        return
+    while True:
+        item, index = decoder.raw_decode(json_array, index)
+        yield item
+        index = _skip_json_whitespace(json_array, index)
+        if json_array.startswith("]", index):
+            return
+        if not json_array.startswith(",", index):
+            raise json.JSONDecodeError("Expecting ',' delimiter", json_array, index)
+        index = _skip_json_whitespace(json_array, index + 1)
+
+
 def unpack_and_flatten_str_to_list(list_as_str: str) -> List[str]:
     """
     if given a simple token like "marketing" -> return ["marketing"]
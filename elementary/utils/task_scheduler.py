@@ -0,0 +1,96 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+from elementary.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Task:
+    name: str
+    func: Callable[..., Any]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class TaskScheduler:
+    """Runs a set of tasks, each as soon as the tasks it depends on are done.
+
+    A task's function is called with the results of its dependencies as keyword arguments (named after the
+    dependencies). With max_workers=1 the tasks run one after the other in the calling thread.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        self.max_workers = max(max_workers, 1)
+        self._tasks: Dict[str, _Task] = {}
+
+    def add_task(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Sequence[str] = (),
+    ) -> None:
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' was already added.")
+        self._tasks[name] = _Task(name=name, func=func, depends_on=list(depends_on))
+
+    def run(self) -> Dict[str, Any]:
+        for task in self._tasks.values():
+            missing_dependencies = set(task.depends_on) - set(self._tasks)
+            if missing_dependencies:
+                raise ValueError(
+                    f"Task '{task.name}' depends on unknown tasks: {', '.join(sorted(missing_dependencies))}"
+                )
+
+        if self.max_workers == 1:
+            return self._run_sequentially()
+        return self._run_concurrently()
+
+    def _get_ready_tasks(self, done: Dict[str, Any], started: set) -> List[_Task]:
+        return [
+            task
+            for task in self._tasks.values()
+            if task.name not in started
+            and all(dependency in done for dependency in task.depends_on)
+        ]
+
+    def _run_task(self, task: _Task, results: Dict[str, Any]) -> Any:
+        return task.func(
+            **{dependency: results[dependency] for dependency in task.depends_on}
+        )
+
+    def _run_sequentially(self) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        while len(results) < len(self._tasks):
+            ready_tasks = self._get_ready_tasks(results, set(results))
+            if not ready_tasks:
+                raise ValueError("Tasks have circular dependencies.")
+            for task in ready_tasks:
+                results[task.name] = self._run_task(task, results)
+        return results
+
+    def _run_concurrently(self) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        started: set = set()
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while len(results) < len(self._tasks):
+                for task in self._get_ready_tasks(results, started):
+                    started.add(task.name)
+                    future = executor.submit(self._run_task, task, dict(results))
+                    running[future] = task.name
+                if not running:
+                    raise ValueError("Tasks have circular dependencies.")
+
+                done_futures, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    task_name = running.pop(future)
+                    try:
+                        results[task_name] = future.result()
+                    except Exception:
+                        for pending_future in running:
+                            pending_future.cancel()
+                        raise
+                    logger.debug("Task '%s' is done.", task_name)
+        return results
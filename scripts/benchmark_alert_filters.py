@@ -0,0 +1,153 @@
+"""
+Compares filtering pending alerts with apply_filters_schema_on_alert and with a compiled filters schema.
+
+Usage: python scripts/benchmark_alert_filters.py [number of alerts] [number of filters]
+"""
+import random
+import sys
+import timeit
+from datetime import datetime
+
+from elementary.monitor.api.alerts.alert_filters import (
+    CompiledFiltersSchema,
+    apply_filters_schema_on_alert,
+)
+from elementary.monitor.data_monitoring.schema import (
+    ANY_OPERATORS,
+    FilterSchema,
+    FiltersSchema,
+    FilterType,
+    ResourceType,
+)
+from elementary.monitor.fetchers.alerts.schema.alert_data import (
+    ModelAlertDataSchema,
+    TestAlertDataSchema,
+)
+from elementary.monitor.fetchers.alerts.schema.pending_alerts import (
+    AlertStatus,
+    AlertTypes,
+    PendingAlertSchema,
+)
+
+MODELS_COUNT = 500
+TAGS = [f"tag_{tag_index}" for tag_index in range(30)]
+OWNERS = [f"owner_{owner_index}" for owner_index in range(20)]
+STATUSES = ["fail", "warn", "error", "runtime error"]
+
+
+def generate_alerts(alerts_count: int):
+    random.seed(0)
+    detected_at = datetime(2024, 1, 1)
+    alerts = []
+    for alert_index in range(alerts_count):
+        model_unique_id = f"model.my_project.model_{alert_index % MODELS_COUNT}"
+        common_data = dict(
+            id=str(alert_index),
+            alert_class_id=f"alert_class_{alert_index}",
+            model_unique_id=model_unique_id,
+            detected_at=detected_at,
+            schema_name="analytics",
+            tags=random.sample(TAGS, 3),
+            model_meta=dict(owner=random.sample(OWNERS, 2)),
+            status=random.choice(STATUSES),
+        )
+        if alert_index % 2:
+            alert_type = AlertTypes.MODEL
+            data = ModelAlertDataSchema(
+                **common_data,
+                alias=f"model_{alert_index % MODELS_COUNT}",
+                path="models/model.sql",
+                original_path="models/model.sql",
+                materialization="table",
+                full_refresh=False,
+                resource_type=ResourceType.MODEL,
+            )
+        else:
+            alert_type = AlertTypes.TEST
+            test_unique_id = f"test.my_project.not_null_{alert_index}"
+            data = TestAlertDataSchema(
+                **common_data,
+                test_unique_id=test_unique_id,
+                test_name=f"not_null_{alert_index}",
+                elementary_unique_id=test_unique_id,
+                test_type="dbt_test",
+                test_sub_type="generic",
+                test_short_name="not_null",
+                severity="ERROR",
+                resource_type=ResourceType.TEST,
+            )
+        alerts.append(
+            PendingAlertSchema(
+                id=f"alert_{alert_index}",
+                alert_class_id=data.alert_class_id,
+                type=alert_type,
+                detected_at=detected_at,
+                created_at=detected_at,
+                updated_at=detected_at,
+                status=AlertStatus.PENDING,
+                data=data,
+            )
+        )
+    return alerts
+
+
+def generate_filters_schema(filters_count: int) -> FiltersSchema:
+    random.seed(1)
+    filter_fields = {"tags": [], "owners": [], "models": []}
+    filter_types = list(FilterType)
+    for filter_index in range(filters_count):
+        field = list(filter_fields)[filter_index % len(filter_fields)]
+        filter_type = filter_types[filter_index % len(filter_types)]
+        if field == "models":
+            filter_type = FilterType.IS if filter_index % 2 else FilterType.IS_NOT
+            all_values = [f"model_{model_index}" for model_index in range(MODELS_COUNT)]
+        else:
+            all_values = TAGS if field == "tags" else OWNERS
+        # Keep most of the alerts matching every filter, so the filters don't short circuit on the first ones.
+        values_count = (
+            len(all_values) - 2
+            if filter_type in ANY_OPERATORS
+            else len(all_values) // 20
+        )
+        filter_fields[field].append(
+            FilterSchema(
+                values=random.sample(all_values, values_count), type=filter_type
+            )
+        )
+    return FiltersSchema(**filter_fields)
+
+
+def main():
+    alerts_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    filters_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    alerts = generate_alerts(alerts_count)
+    filters_schema = generate_filters_schema(filters_count)
+
+    def apply_filters_schema():
+        return [
+            alert
+            for alert in alerts
+            if apply_filters_schema_on_alert(alert, filters_schema)
+        ]
+
+    def apply_compiled_filters_schema():
+        return CompiledFiltersSchema(filters_schema).filter(alerts)
+
+    matching_alerts = apply_compiled_filters_schema()
+    assert matching_alerts == apply_filters_schema()
+    print(
+        f"Alerts: {alerts_count}, filters: {filters_count}, matching: {len(matching_alerts)}"
+    )
+
+    filters_time = min(timeit.repeat(apply_filters_schema, number=1, repeat=3))
+    compiled_time = min(
+        timeit.repeat(apply_compiled_filters_schema, number=1, repeat=3)
+    )
+    print(
+        f"FiltersSchema {filters_time * 1000:.0f}ms, CompiledFiltersSchema {compiled_time * 1000:.0f}ms "
+        f"({filters_time / compiled_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the JSON codec in elementary.utils.json_utils with the standard library on a synthetic report payload.
+
+Usage: python scripts/benchmark_json_codec.py [number of tests] [runs per test]
+"""
+import json
+import random
+import sys
+import timeit
+
+from elementary.utils import json_utils
+
+
+def generate_report_payload(tests_count: int, runs_per_test: int) -> dict:
+    random.seed(0)
+    test_results = {}
+    test_runs = {}
+    for test_index in range(tests_count):
+        test_unique_id = f"test.my_project.test_{test_index}"
+        test_results[test_unique_id] = [
+            {
+                "metadata": {
+                    "test_unique_id": test_unique_id,
+                    "table_name": f"table_{test_index % 50}",
+                    "column_name": f"column_{test_index % 7}",
+                    "test_query": "select * from my_table where value is null",
+                    "test_params": {"sensitivity": 3, "timestamp_column": "updated_at"},
+                    "latest_run_status": random.choice(["pass", "fail", "error"]),
+                },
+                "test_results": {
+                    "result_rows": [
+                        {"id": row_index, "value": random.random(), "ratio": None}
+                        for row_index in range(5)
+                    ],
+                    "metrics": [
+                        {"value": random.random() * 100, "average": float("nan")}
+                        for _ in range(10)
+                    ],
+                },
+            }
+        ]
+        test_runs[test_unique_id] = [
+            {
+                "id": f"invocation_{run_index}",
+                "time_utc": "2024-01-01T00:00:00",
+                "status": random.choice(["pass", "fail"]),
+                "execution_time": random.random() * 10,
+                "affected_rows": random.randint(0, 1000),
+            }
+            for run_index in range(runs_per_test)
+        ]
+    return {"test_results": test_results, "test_runs": test_runs}
+
+
+def main():
+    tests_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    runs_per_test = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    payload = json_utils.inf_and_nan_to_str(
+        generate_report_payload(tests_count, runs_per_test)
+    )
+    dumped_payload = json.dumps(payload)
+    print(
+        f"Payload: {len(dumped_payload) / 1024 / 1024:.1f} MB, backend: {json_utils.JSON_BACKEND}"
+    )
+
+    benchmarks = [
+        ("dumps", lambda: json.dumps(payload), lambda: json_utils.dumps(payload)),
+        (
+            "loads",
+            lambda: json.loads(dumped_payload),
+            lambda: json_utils.loads(dumped_payload),
+        ),
+    ]
+    for name, stdlib_func, codec_func in benchmarks:
+        stdlib_time = min(timeit.repeat(stdlib_func, number=1, repeat=5))
+        codec_time = min(timeit.repeat(codec_func, number=1, repeat=5))
+        print(
+            f"{name}: json {stdlib_time * 1000:.0f}ms, json_utils {codec_time * 1000:.0f}ms "
+            f"({stdlib_time / codec_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
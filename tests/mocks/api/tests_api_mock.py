@@ -10,6 +10,7 @@ class MockTestsAPI(TestsAPI):
     def __init__(self, *args, **kwargs):
         self.dbt_runner = MockDbtRunner
         self.tests_fetcher = MockTestsFetcher()
+        self.tests_invocations = None
         self.test_results_db_rows = self._get_test_results_db_rows()
 
     def _get_test_results_db_rows(self, *args, **kwargs) -> List[TestResultDBRowSchema]:
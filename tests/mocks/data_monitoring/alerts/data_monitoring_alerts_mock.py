@@ -37,6 +37,9 @@ class DataMonitoringAlertsMock(DataMonitoringAlerts):
     def _download_dbt_package_if_needed(self, *args, **kwargs):
         pass
 
+    def _get_bootstrap(self):
+        return None
+
     def get_latest_invocation(self):
         return dict()
 
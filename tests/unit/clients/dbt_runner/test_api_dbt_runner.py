@@ -0,0 +1,100 @@
+from unittest import mock
+
+from dbt.contracts.graph.manifest import Manifest
+
+from elementary.clients.dbt.api_dbt_runner import APIDbtRunner
+
+
+def _make_api_runner(**kwargs):
+    defaults = dict(
+        project_dir="fake_project",
+        profiles_dir="fake_profiles",
+        raise_on_failure=False,
+        run_deps_if_needed=False,
+    )
+    defaults.update(kwargs)
+    return APIDbtRunner(**defaults)
+
+
+def _mock_invoke(manifest: Manifest):
+    def invoke(args):
+        result = mock.MagicMock()
+        result.success = True
+        result.exception = None
+        result.result = manifest if args[0] == "parse" else None
+        return result
+
+    return invoke
+
+
+@mock.patch("elementary.clients.dbt.api_dbt_runner.with_chdir", mock.MagicMock())
+@mock.patch("elementary.clients.dbt.api_dbt_runner.dbtRunner")
+def test_reuse_manifest_parses_once(mock_dbt_runner_cls):
+    manifest = Manifest()
+    mock_dbt_runner_cls.return_value.invoke.side_effect = _mock_invoke(manifest)
+
+    runner = _make_api_runner(reuse_manifest=True)
+    runner.run_operation("elementary_cli.get_models")
+    runner.run_operation("elementary_cli.get_sources")
+    runner.seed()
+
+    invoked_commands = [
+        call.args[0][0] if call.args[0][0] == "parse" else "other"
+        for call in mock_dbt_runner_cls.return_value.invoke.call_args_list
+    ]
+    assert invoked_commands.count("parse") == 1
+    # Every command after the parse gets the preloaded manifest.
+    manifests = [
+        call.kwargs.get("manifest") for call in mock_dbt_runner_cls.call_args_list
+    ]
+    assert manifests.count(manifest) == 3
+
+
+@mock.patch("elementary.clients.dbt.api_dbt_runner.with_chdir", mock.MagicMock())
+@mock.patch("elementary.clients.dbt.api_dbt_runner.dbtRunner")
+def test_reuse_manifest_per_vars(mock_dbt_runner_cls):
+    mock_dbt_runner_cls.return_value.invoke.side_effect = _mock_invoke(Manifest())
+
+    runner = _make_api_runner(reuse_manifest=True)
+    runner.run(vars={"days_back": 1})
+    runner.run(vars={"days_back": 1})
+    runner.run(vars={"days_back": 2})
+
+    parse_calls = [
+        call
+        for call in mock_dbt_runner_cls.return_value.invoke.call_args_list
+        if call.args[0][0] == "parse"
+    ]
+    assert len(parse_calls) == 2
+
+
+@mock.patch("elementary.clients.dbt.api_dbt_runner.with_chdir", mock.MagicMock())
+@mock.patch("elementary.clients.dbt.api_dbt_runner.dbtRunner")
+def test_deps_clears_manifests(mock_dbt_runner_cls):
+    mock_dbt_runner_cls.return_value.invoke.side_effect = _mock_invoke(Manifest())
+
+    runner = _make_api_runner(reuse_manifest=True)
+    runner.seed()
+    runner.deps()
+    runner.seed()
+
+    parse_calls = [
+        call
+        for call in mock_dbt_runner_cls.return_value.invoke.call_args_list
+        if call.args[0][0] == "parse"
+    ]
+    assert len(parse_calls) == 2
+
+
+@mock.patch("elementary.clients.dbt.api_dbt_runner.with_chdir", mock.MagicMock())
+@mock.patch("elementary.clients.dbt.api_dbt_runner.dbtRunner")
+def test_manifest_not_reused_by_default(mock_dbt_runner_cls):
+    mock_dbt_runner_cls.return_value.invoke.side_effect = _mock_invoke(Manifest())
+
+    runner = _make_api_runner()
+    runner.seed()
+    runner.seed()
+
+    assert mock_dbt_runner_cls.return_value.invoke.call_count == 2
+    for call in mock_dbt_runner_cls.call_args_list:
+        assert call.kwargs.get("manifest") is None
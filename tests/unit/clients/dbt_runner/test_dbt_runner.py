@@ -1,9 +1,19 @@
 import json
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
+import agate
 import pytest
 
+from elementary.clients.dbt.command_line_dbt_runner import (
+    MACRO_RESULT_PATTERN,
+    MACRO_RESULTS_DIR_NAME,
+)
 from elementary.clients.dbt.subprocess_dbt_runner import SubprocessDbtRunner
+from elementary.exceptions.exceptions import DbtCommandError
 
 
 @pytest.mark.parametrize(
@@ -62,3 +72,293 @@ def test_dbt_runner_run(mock_subprocess_run, model, full_refresh, dbt_vars):
     if dbt_vars is not None:
         assert "--vars" in mock_subprocess_run.call_args[0][0]
         assert expanded_dbt_vars in mock_subprocess_run.call_args[0][0]
+
+
+def _dbt_log_line(msg: str) -> str:
+    return json.dumps({"info": {"msg": msg, "level": "info"}})
+
+
+@mock.patch("subprocess.run")
+def test_dbt_runner_run_operations_batch(mock_subprocess_run):
+    output = "\n".join(
+        [
+            _dbt_log_line(
+                'Elementary: --ELEMENTARY-BATCH-MACRO-OUTPUT-START--1--["b"]--ELEMENTARY-MACRO-OUTPUT-END--'
+            ),
+            _dbt_log_line("Elementary: unrelated log"),
+            _dbt_log_line(
+                'Elementary: --ELEMENTARY-BATCH-MACRO-OUTPUT-START--0--["a"]--ELEMENTARY-MACRO-OUTPUT-END--'
+            ),
+        ]
+    )
+    mock_subprocess_run.return_value = mock.MagicMock(
+        returncode=0, stdout=output.encode(), stderr=None
+    )
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir", profiles_dir="prof_dir", run_deps_if_needed=False
+    )
+    results = dbt_runner.run_operations_batch(
+        [
+            ("elementary_cli.macro_a", None),
+            ("elementary_cli.macro_b", {"days_back": 7}),
+            ("elementary_cli.macro_c", None),
+        ]
+    )
+
+    assert mock_subprocess_run.call_count == 1
+    command_args = mock_subprocess_run.call_args[0][0]
+    assert "elementary_cli.log_macros_results" in command_args
+    macro_calls = json.loads(command_args[command_args.index("--args") + 1])
+    assert macro_calls["macros"][1] == dict(
+        call_id=1, macro_name="elementary_cli.macro_b", macro_args={"days_back": 7}
+    )
+    assert results == {
+        "elementary_cli.macro_a": ['["a"]'],
+        "elementary_cli.macro_b": ['["b"]'],
+        "elementary_cli.macro_c": [],
+    }
+
+
+def test_dbt_runner_run_operations_batch_duplicate_macros():
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir", profiles_dir="prof_dir", run_deps_if_needed=False
+    )
+    with pytest.raises(ValueError):
+        dbt_runner.run_operations_batch(
+            [("elementary_cli.macro_a", None), ("elementary_cli.macro_a", None)]
+        )
+
+
+def _mock_popen(mock_subprocess_popen, output_lines, returncode=0):
+    process = mock_subprocess_popen.return_value.__enter__.return_value
+    process.stdout = [f"{line}\n".encode() for line in output_lines]
+    process.wait.return_value = returncode
+
+
+@mock.patch("subprocess.Popen")
+def test_dbt_runner_stream_output_run_operation(mock_subprocess_popen):
+    _mock_popen(
+        mock_subprocess_popen,
+        [
+            _dbt_log_line(
+                'Elementary: --ELEMENTARY-MACRO-OUTPUT-START--["a"]--ELEMENTARY-MACRO-OUTPUT-END--'
+            ),
+            _dbt_log_line("Elementary: unrelated log"),
+            _dbt_log_line(
+                'Elementary: --ELEMENTARY-MACRO-OUTPUT-START--["b"]--ELEMENTARY-MACRO-OUTPUT-END--'
+            ),
+        ],
+    )
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir",
+        profiles_dir="prof_dir",
+        run_deps_if_needed=False,
+        stream_output=True,
+    )
+    result = dbt_runner._run_operation_command(
+        "elementary_cli.macro_a",
+        {},
+        log_pattern=MACRO_RESULT_PATTERN,
+    )
+
+    assert result.success
+    assert [match.group(1) for match in result.log_matches] == ['["a"]', '["b"]']
+    # Matched payloads are handed over as is and not kept in the output.
+    assert result.output == _dbt_log_line("Elementary: unrelated log")
+    assert dbt_runner.run_operation("elementary_cli.macro_a") == ['["a"]', '["b"]']
+
+
+@mock.patch("subprocess.Popen")
+def test_dbt_runner_stream_output_failure(mock_subprocess_popen):
+    _mock_popen(
+        mock_subprocess_popen,
+        [json.dumps({"info": {"msg": "Database Error", "level": "error"}})],
+        returncode=1,
+    )
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir",
+        profiles_dir="prof_dir",
+        run_deps_if_needed=False,
+        stream_output=True,
+    )
+    with pytest.raises(DbtCommandError) as exc_info:
+        dbt_runner.run()
+    assert [log.msg for log in exc_info.value.logs] == ["Database Error"]
+
+
+@mock.patch("subprocess.run")
+def test_dbt_runner_run_operation_rows_from_file(mock_subprocess_run, tmp_path):
+    def write_results_file(command_args, **kwargs):
+        macro_args = json.loads(command_args[command_args.index("--args") + 1])
+        with open(macro_args["macro_args"]["results_path"], "w") as results_file:
+            results_file.write('{"UNIQUE_ID": "model.a", "status": "success"}\n')
+            results_file.write('{"UNIQUE_ID": "model.b", "status": "error"}\n')
+        return mock.MagicMock(returncode=0, stdout=None, stderr=None)
+
+    mock_subprocess_run.side_effect = write_results_file
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir",
+        profiles_dir="prof_dir",
+        run_deps_if_needed=False,
+        results_dir=str(tmp_path),
+    )
+    rows = dbt_runner.run_operation_rows("elementary_cli.get_models_runs")
+    # The results file is removed even before its rows are read.
+    assert os.listdir(tmp_path / MACRO_RESULTS_DIR_NAME) == []
+
+    assert list(rows) == [
+        {"unique_id": "model.a", "status": "success"},
+        {"unique_id": "model.b", "status": "error"},
+    ]
+
+
+@mock.patch("subprocess.run")
+def test_dbt_runner_run_operation_rows_failure_removes_file(
+    mock_subprocess_run, tmp_path
+):
+    def write_results_file_and_fail(command_args, **kwargs):
+        macro_args = json.loads(command_args[command_args.index("--args") + 1])
+        with open(macro_args["macro_args"]["results_path"], "w") as results_file:
+            results_file.write('{"unique_id": "model.a"}\n')
+        raise subprocess.CalledProcessError(1, command_args, output=b"", stderr=b"")
+
+    mock_subprocess_run.side_effect = write_results_file_and_fail
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir",
+        profiles_dir="prof_dir",
+        run_deps_if_needed=False,
+        results_dir=str(tmp_path),
+    )
+    with pytest.raises(DbtCommandError):
+        dbt_runner.run_operation_rows("elementary_cli.get_models_runs")
+
+    assert os.listdir(tmp_path / MACRO_RESULTS_DIR_NAME) == []
+
+
+@mock.patch("subprocess.run")
+def test_dbt_runner_run_operation_rows_from_agate_file(mock_subprocess_run, tmp_path):
+    table = agate.Table(
+        [[1, 1.5, "caf\u00e9"], [None, 2, "\u05e9\u05dc\u05d5\u05dd"]],
+        ["ROWS_COUNT", "ratio", "name"],
+        [agate.Number(), agate.Number(), agate.Text()],
+    )
+
+    def write_results_file(command_args, **kwargs):
+        macro_args = json.loads(command_args[command_args.index("--args") + 1])
+        # As elementary_cli.return_result_set writes it.
+        table.to_json(
+            macro_args["macro_args"]["results_path"], newline=True, ensure_ascii=True
+        )
+        return mock.MagicMock(returncode=0, stdout=None, stderr=None)
+
+    mock_subprocess_run.side_effect = write_results_file
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir",
+        profiles_dir="prof_dir",
+        run_deps_if_needed=False,
+        results_dir=str(tmp_path),
+    )
+    rows = list(dbt_runner.run_operation_rows("elementary_cli.get_models_runs"))
+
+    assert rows == [
+        {"rows_count": 1, "ratio": 1.5, "name": "caf\u00e9"},
+        {"rows_count": None, "ratio": 2, "name": "\u05e9\u05dc\u05d5\u05dd"},
+    ]
+    assert isinstance(rows[0]["rows_count"], int)
+
+
+@mock.patch("subprocess.run")
+def test_dbt_runner_run_operation_rows_from_logs(mock_subprocess_run):
+    output = _dbt_log_line(
+        'Elementary: --ELEMENTARY-MACRO-OUTPUT-START--[{"unique_id": "model.a"}]--ELEMENTARY-MACRO-OUTPUT-END--'
+    )
+    mock_subprocess_run.return_value = mock.MagicMock(
+        returncode=0, stdout=output.encode(), stderr=None
+    )
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir", profiles_dir="prof_dir", run_deps_if_needed=False
+    )
+    rows = list(dbt_runner.run_operation_rows("elementary_cli.get_models_runs"))
+
+    assert rows == [{"unique_id": "model.a"}]
+    macro_args = json.loads(
+        mock_subprocess_run.call_args[0][0][
+            mock_subprocess_run.call_args[0][0].index("--args") + 1
+        ]
+    )
+    assert "results_path" not in macro_args["macro_args"]
+
+
+@mock.patch("subprocess.run")
+def test_dbt_runner_concurrent_commands_use_their_own_dirs(mock_subprocess_run):
+    dbt_runner = SubprocessDbtRunner(
+        project_dir="proj_dir",
+        profiles_dir="prof_dir",
+        run_deps_if_needed=False,
+        env_vars={"DBT_LOG_PATH": "logs_dir"},
+    )
+    commands_args = []
+    # Every command waits for the others, so they all run at the same time.
+    all_commands_started = threading.Barrier(dbt_runner.max_concurrent_commands)
+
+    def run_command(command_args, **kwargs):
+        commands_args.append(command_args)
+        all_commands_started.wait(timeout=5)
+        return mock.MagicMock(returncode=0, stdout=None, stderr=None)
+
+    mock_subprocess_run.side_effect = run_command
+    with ThreadPoolExecutor(dbt_runner.max_concurrent_commands) as executor:
+        for _ in range(dbt_runner.max_concurrent_commands):
+            executor.submit(dbt_runner.seed)
+
+    def get_arg(command_args, name):
+        return (
+            command_args[command_args.index(name) + 1] if name in command_args else None
+        )
+
+    assert sorted(
+        (get_arg(args, "--target-path") or "", get_arg(args, "--log-path") or "")
+        for args in commands_args
+    ) == [("", "")] + [
+        (
+            os.path.join("proj_dir", "target", f"command_slot_{slot}"),
+            os.path.join("logs_dir", f"command_slot_{slot}"),
+        )
+        for slot in range(1, dbt_runner.max_concurrent_commands)
+    ]
+
+    # Commands that run one at a time keep the project's own dirs.
+    mock_subprocess_run.side_effect = None
+    dbt_runner.seed()
+    assert "--target-path" not in mock_subprocess_run.call_args[0][0]
+
+
+def test_dbt_runner_command_slot_args(tmp_path):
+    dbt_runner = SubprocessDbtRunner(
+        project_dir=str(tmp_path), profiles_dir="prof_dir", run_deps_if_needed=False
+    )
+    slot_target_path = str(tmp_path / "target" / "command_slot_1")
+    slot_log_path = str(tmp_path / "logs" / "command_slot_1")
+
+    # No partial parsing state to copy yet.
+    assert dbt_runner._get_command_slot_args(1, ["--log-format", "json", "seed"]) == [
+        "--target-path",
+        slot_target_path,
+        "--log-path",
+        slot_log_path,
+    ]
+    assert not os.path.exists(slot_target_path)
+
+    os.makedirs(tmp_path / "target")
+    (tmp_path / "target" / "partial_parse.msgpack").write_bytes(b"state")
+    dbt_runner._get_command_slot_args(1, ["--log-format", "json", "seed"])
+    assert os.listdir(slot_target_path) == ["partial_parse.msgpack"]
+    assert (
+        tmp_path / "target" / "command_slot_1" / "partial_parse.msgpack"
+    ).read_bytes() == b"state"
+
+    # deps and debug don't take a target path.
+    for command in ["deps", "debug"]:
+        assert dbt_runner._get_command_slot_args(
+            1, ["--log-format", "json", command]
+        ) == ["--log-path", slot_log_path]
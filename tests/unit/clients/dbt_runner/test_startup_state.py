@@ -0,0 +1,71 @@
+import os
+from unittest import mock
+
+import pytest
+
+from elementary.clients.dbt.command_line_dbt_runner import STARTUP_STATE_CACHE_FILE_NAME
+from elementary.clients.dbt.subprocess_dbt_runner import SubprocessDbtRunner
+
+
+@pytest.fixture
+def dbt_project(tmp_path):
+    project_dir = tmp_path / "project"
+    profiles_dir = tmp_path / "profiles"
+    installed_package_dir = project_dir / "dbt_packages" / "elementary"
+    os.makedirs(installed_package_dir)
+    os.makedirs(profiles_dir)
+    (project_dir / "dbt_project.yml").write_text("name: proj\nprofile: my_profile\n")
+    (project_dir / "packages.yml").write_text(
+        "packages:\n  - package: elementary-data/elementary\n    version: 0.1.0\n"
+    )
+    (installed_package_dir / "dbt_project.yml").write_text(
+        "name: elementary\nversion: 0.1.0\n"
+    )
+    (profiles_dir / "profiles.yml").write_text(
+        "my_profile:\n  target: dev\n  outputs:\n    dev:\n      type: postgres\n"
+    )
+    return project_dir, profiles_dir
+
+
+def _create_runner(dbt_project, cache_dir):
+    project_dir, profiles_dir = dbt_project
+    return SubprocessDbtRunner(
+        project_dir=str(project_dir),
+        profiles_dir=str(profiles_dir),
+        cache_dir=str(cache_dir),
+    )
+
+
+@mock.patch.object(SubprocessDbtRunner, "deps")
+def test_startup_state_is_cached(mock_deps, dbt_project, tmp_path):
+    runner = _create_runner(dbt_project, tmp_path)
+    assert runner.adapter_type == "postgres"
+    assert runner.startup_state.deps_satisfied
+    assert os.path.exists(tmp_path / STARTUP_STATE_CACHE_FILE_NAME)
+    mock_deps.assert_not_called()
+
+    with mock.patch.object(
+        SubprocessDbtRunner, "_get_adapter_type"
+    ) as mock_get_adapter_type, mock.patch.object(
+        SubprocessDbtRunner, "_get_deps_update_reason"
+    ) as mock_get_deps_update_reason:
+        cached_runner = _create_runner(dbt_project, tmp_path)
+        mock_get_adapter_type.assert_not_called()
+        mock_get_deps_update_reason.assert_not_called()
+    assert cached_runner.startup_state == runner.startup_state
+
+
+@mock.patch.object(SubprocessDbtRunner, "deps")
+def test_startup_state_invalidated_on_file_change(mock_deps, dbt_project, tmp_path):
+    project_dir, _ = dbt_project
+    _create_runner(dbt_project, tmp_path)
+
+    installed_project_path = (
+        project_dir / "dbt_packages" / "elementary" / "dbt_project.yml"
+    )
+    installed_project_path.write_text("name: elementary\nversion: 0.0.9\n")
+    os.utime(installed_project_path, ns=(0, 0))
+    runner = _create_runner(dbt_project, tmp_path)
+
+    assert not runner.startup_state.deps_satisfied
+    mock_deps.assert_called_once()
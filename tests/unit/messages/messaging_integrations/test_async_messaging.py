@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+import pytest
+from slack_sdk import WebClient, WebhookClient
+
+from elementary.messages.blocks import HeaderBlock
+from elementary.messages.message_body import MessageBody
+from elementary.messages.messaging_integrations.mapped import MappedMessagingIntegration
+from elementary.messages.messaging_integrations.slack_web import (
+    SlackWebMessageContext,
+    SlackWebMessagingIntegration,
+)
+from elementary.messages.messaging_integrations.slack_webhook import (
+    SlackWebhookMessagingIntegration,
+)
+from elementary.messages.messaging_integrations.teams_webhook import (
+    TeamsWebhookMessagingIntegration,
+)
+
+# Status code, headers and body.
+Response = Tuple[int, Dict[str, str], str]
+
+
+class LocalHttpServer:
+    """A local stand-in for the messaging platforms, that records the requests it gets."""
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, bytes]] = []
+        # Responses to return by path, the last one is kept for the following requests.
+        self.responses: Dict[str, List[Response]] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                server.requests.append((self.path, body))
+                responses = server.responses.get(self.path) or [(200, {}, "1")]
+                status_code, headers, response_body = (
+                    responses.pop(0) if len(responses) > 1 else responses[0]
+                )
+                self.send_response(status_code)
+                for header_name, value in headers.items():
+                    self.send_header(header_name, value)
+                self.end_headers()
+                self.wfile.write(response_body.encode())
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def http_server():
+    server = LocalHttpServer()
+    yield server
+    server.close()
+
+
+def _message_body(text: str) -> MessageBody:
+    return MessageBody(blocks=[HeaderBlock(text=text)])
+
+
+def test_teams_webhook_async_send_message(http_server: LocalHttpServer):
+    http_server.responses["/first"] = [
+        (429, {"Retry-After": "0"}, "Too many requests"),
+        (200, {}, "1"),
+    ]
+    mapped_integration = MappedMessagingIntegration(
+        {
+            "first": TeamsWebhookMessagingIntegration(f"{http_server.url}/first"),
+            "second": TeamsWebhookMessagingIntegration(f"{http_server.url}/second"),
+        }
+    )
+
+    async def send_messages():
+        return await asyncio.gather(
+            mapped_integration.async_send_message("first", _message_body("first")),
+            mapped_integration.async_send_message("second", _message_body("second")),
+        )
+
+    results = asyncio.run(send_messages())
+
+    assert [result.message_format for result in results] == ["adaptive_cards"] * 2
+    # The rate limited message was sent again.
+    assert sorted(path for path, _ in http_server.requests) == [
+        "/first",
+        "/first",
+        "/second",
+    ]
+
+
+def test_slack_webhook_async_send_message(http_server: LocalHttpServer):
+    http_server.responses["/webhook"] = [(200, {}, "ok")]
+    integration = SlackWebhookMessagingIntegration(
+        WebhookClient(f"{http_server.url}/webhook")
+    )
+
+    result = asyncio.run(integration.async_send_message(None, _message_body("alert")))
+
+    assert result.message_format == "block_kit"
+    [(path, body)] = http_server.requests
+    assert path == "/webhook"
+    assert "alert" in body.decode()
+
+
+def test_slack_web_async_send_and_reply(http_server: LocalHttpServer):
+    http_server.responses["/api/chat.postMessage"] = [
+        (429, {"Retry-After": "0"}, json.dumps({"ok": False, "error": "ratelimited"})),
+        (200, {}, json.dumps({"ok": True, "ts": "1700000000.000100", "channel": "C1"})),
+    ]
+    integration = SlackWebMessagingIntegration(
+        WebClient(token="token", base_url=f"{http_server.url}/api/")
+    )
+
+    async def send_and_reply():
+        result = await integration.async_send_message("alerts", _message_body("alert"))
+        await integration.async_reply_to_message(
+            "alerts", result.message_context, _message_body("reply")
+        )
+        return result
+
+    result = asyncio.run(send_and_reply())
+
+    assert result.message_context == SlackWebMessageContext(
+        id="1700000000.000100", channel="C1"
+    )
+    assert [path for path, _ in http_server.requests] == ["/api/chat.postMessage"] * 3
+    assert "1700000000.000100" in http_server.requests[-1][1].decode()
@@ -0,0 +1,129 @@
+from email.utils import formatdate
+from unittest import mock
+
+import pytest
+import requests
+
+from elementary.messages.blocks import HeaderBlock
+from elementary.messages.message_body import MessageBody
+from elementary.messages.messaging_integrations.exceptions import (
+    MessagingIntegrationRateLimitError,
+)
+from elementary.messages.messaging_integrations.rate_limit import (
+    DEFAULT_RETRY_AFTER,
+    DestinationRateLimiter,
+    TokenBucket,
+    get_retry_after,
+)
+from elementary.messages.messaging_integrations.teams_webhook import (
+    TeamsWebhookMessagingIntegration,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(calls=2, period=1, burst=3, clock=clock, sleep=clock.sleep)
+    call_times = []
+    for _ in range(5):
+        bucket.acquire()
+        call_times.append(clock.now)
+
+    assert call_times == [0, 0, 0, 0.5, 1.0]
+
+
+def test_token_bucket_pause():
+    clock = FakeClock()
+    bucket = TokenBucket(calls=1, period=1, burst=5, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.pause(10)
+    call_times = []
+    for _ in range(2):
+        bucket.acquire()
+        call_times.append(clock.now)
+
+    # A single call is allowed once the pause is over, the burst isn't kept.
+    assert call_times == [10, 11]
+
+
+def test_destination_rate_limiter_limits_each_destination_separately():
+    clock = FakeClock()
+    rate_limiter = DestinationRateLimiter(
+        calls=1, period=1, clock=clock, sleep=clock.sleep
+    )
+    for destination in ["a", "b", "c"]:
+        rate_limiter.call(destination, lambda: None)
+    assert clock.now == 0
+
+    rate_limiter.call("a", lambda: None)
+    assert clock.now == 1
+
+
+def test_destination_rate_limiter_honours_retry_after():
+    clock = FakeClock()
+    rate_limiter = DestinationRateLimiter(
+        calls=1, period=1, max_retries=2, clock=clock, sleep=clock.sleep
+    )
+    send = mock.Mock(
+        side_effect=[
+            MessagingIntegrationRateLimitError("limited", retry_after=30),
+            MessagingIntegrationRateLimitError("limited"),
+            "sent",
+        ]
+    )
+
+    assert rate_limiter.call("a", send) == "sent"
+    assert clock.now == 30 + DEFAULT_RETRY_AFTER
+
+    send = mock.Mock(side_effect=MessagingIntegrationRateLimitError("limited"))
+    with pytest.raises(MessagingIntegrationRateLimitError):
+        rate_limiter.call("a", send)
+    assert send.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "headers,expected_retry_after",
+    [
+        ({}, None),
+        ({"Retry-After": "12"}, 12),
+        ({"retry-after": ["3"]}, 3),
+        ({"Retry-After": "not a date"}, None),
+    ],
+)
+def test_get_retry_after(headers, expected_retry_after):
+    assert get_retry_after(headers) == expected_retry_after
+
+
+def test_get_retry_after_http_date():
+    with mock.patch("time.time", return_value=1_000_000):
+        retry_after = get_retry_after(
+            {"Retry-After": formatdate(1_000_060, usegmt=True)}
+        )
+    assert retry_after == 60
+
+
+@mock.patch("requests.Session.post")
+def test_teams_webhook_retries_rate_limited_messages(mock_post):
+    rate_limited_response = requests.Response()
+    rate_limited_response.status_code = 429
+    rate_limited_response.headers["Retry-After"] = "0"
+    sent_response = requests.Response()
+    sent_response.status_code = 202
+    mock_post.side_effect = [rate_limited_response, sent_response]
+
+    integration = TeamsWebhookMessagingIntegration(url="https://teams.webhook")
+    integration.send_message(None, MessageBody(blocks=[HeaderBlock(text="alert")]))
+
+    assert mock_post.call_count == 2
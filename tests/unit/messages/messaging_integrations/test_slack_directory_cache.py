@@ -0,0 +1,157 @@
+from unittest import mock
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
+
+from elementary.messages.messaging_integrations.slack_directory_cache import (
+    SlackDirectoryCache,
+)
+from elementary.messages.messaging_integrations.slack_web import (
+    SlackWebMessagingIntegration,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _slack_api_error(error: str) -> SlackApiError:
+    response = SlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://slack.com/api/",
+        req_args={},
+        data={"ok": False, "error": error},
+        headers={},
+        status_code=200,
+    )
+    return SlackApiError(error, response)
+
+
+def _integration(cache: SlackDirectoryCache) -> SlackWebMessagingIntegration:
+    return SlackWebMessagingIntegration(
+        mock.MagicMock(spec=WebClient), directory_cache=cache
+    )
+
+
+def test_directory_cache_is_kept_between_runs(tmp_path):
+    clock = FakeClock()
+    cache = SlackDirectoryCache(str(tmp_path), "token", ttl=100, clock=clock)
+    cache.set_channel_ids({"alerts": "C1", "data": "C2"})
+    cache.set_user_id("user@elementary-data.com", "U1")
+    cache.set_user_id("missing@elementary-data.com", None)
+    cache.flush()
+
+    cache = SlackDirectoryCache(str(tmp_path), "token", ttl=100, clock=clock)
+    assert cache.get_channel_id("alerts") == "C1"
+    assert cache.get_user_id("user@elementary-data.com") == (True, "U1")
+    assert cache.get_user_id("missing@elementary-data.com") == (True, None)
+    assert cache.get_user_id("other@elementary-data.com") == (False, None)
+
+    # Other workspaces don't share the directory.
+    other_cache = SlackDirectoryCache(str(tmp_path), "other", ttl=100, clock=clock)
+    assert other_cache.get_channel_id("alerts") is None
+
+
+def test_directory_cache_expiration(tmp_path):
+    clock = FakeClock()
+    cache = SlackDirectoryCache(
+        str(tmp_path), "token", ttl=100, not_found_ttl=10, clock=clock
+    )
+    cache.set_user_id("user@elementary-data.com", "U1")
+    cache.set_user_id("missing@elementary-data.com", None)
+    cache.flush()
+
+    clock.now += 50
+    cache = SlackDirectoryCache(
+        str(tmp_path), "token", ttl=100, not_found_ttl=10, clock=clock
+    )
+    assert cache.get_user_id("user@elementary-data.com") == (True, "U1")
+    assert cache.get_user_id("missing@elementary-data.com") == (False, None)
+
+    clock.now += 100
+    cache = SlackDirectoryCache(str(tmp_path), "token", ttl=100, clock=clock)
+    assert cache.get_user_id("user@elementary-data.com") == (False, None)
+
+
+def test_cached_users_are_not_looked_up(tmp_path):
+    cache = SlackDirectoryCache(str(tmp_path), "token")
+    integration = _integration(cache)
+    integration.client.users_lookupByEmail.side_effect = [
+        {"user": {"id": "U1"}},
+        _slack_api_error("users_not_found"),
+    ]
+    assert integration.get_user_id_from_email("user@elementary-data.com") == "U1"
+    assert integration.get_user_id_from_email("missing@elementary-data.com") is None
+    cache.flush()
+
+    # A new run starts with the users it already looked up.
+    integration = _integration(SlackDirectoryCache(str(tmp_path), "token"))
+    assert integration.get_user_id_from_email("user@elementary-data.com") == "U1"
+    assert integration.get_user_id_from_email("missing@elementary-data.com") is None
+    integration.client.users_lookupByEmail.assert_not_called()
+
+
+def test_user_updates_are_written_on_flush(tmp_path):
+    cache = SlackDirectoryCache(str(tmp_path), "token")
+    cache.set_user_id("user@elementary-data.com", "U1")
+    # Another run writes to the cache file in the meantime.
+    other_run_cache = SlackDirectoryCache(str(tmp_path), "token")
+    other_run_cache.set_channel_ids({"alerts": "C1"})
+
+    assert SlackDirectoryCache(str(tmp_path), "token").get_user_id(
+        "user@elementary-data.com"
+    ) == (False, None)
+    cache.flush()
+
+    cache = SlackDirectoryCache(str(tmp_path), "token")
+    assert cache.get_user_id("user@elementary-data.com") == (True, "U1")
+    assert cache.get_channel_id("alerts") == "C1"
+
+
+def test_shared_cache(tmp_path):
+    cache = SlackDirectoryCache.get_shared(str(tmp_path), "token")
+
+    assert SlackDirectoryCache.get_shared(str(tmp_path), "token") is cache
+    assert SlackDirectoryCache.get_shared(str(tmp_path), "other") is not cache
+
+
+def test_cached_channels_are_not_listed(tmp_path):
+    integration = _integration(SlackDirectoryCache(str(tmp_path), "token"))
+    integration.client.conversations_list.return_value = {
+        "channels": [{"name": "data", "id": "C2"}, {"name": "alerts", "id": "C1"}]
+    }
+    assert integration._get_channel_id("alerts") == "C1"
+
+    integration = _integration(SlackDirectoryCache(str(tmp_path), "token"))
+    assert integration._get_channel_id("alerts") == "C1"
+    assert integration._get_channel_id("data") == "C2"
+    integration.client.conversations_list.assert_not_called()
+
+
+def test_stale_cached_channel_is_looked_up_again(tmp_path):
+    cache = SlackDirectoryCache(str(tmp_path), "token")
+    cache.set_channel_ids({"alerts": "C_OLD"})
+    integration = _integration(cache)
+    integration.client.conversations_join.side_effect = [
+        _slack_api_error("channel_not_found"),
+        {"ok": True},
+    ]
+    integration.client.conversations_list.return_value = {
+        "channels": [{"name": "alerts", "id": "C_NEW"}]
+    }
+
+    integration._join_channel_by_name("alerts")
+
+    assert [
+        call.kwargs["channel"]
+        for call in integration.client.conversations_join.call_args_list
+    ] == ["C_OLD", "C_NEW"]
+    assert SlackDirectoryCache(str(tmp_path), "token").get_channel_id("alerts") == (
+        "C_NEW"
+    )
@@ -0,0 +1,127 @@
+from typing import List
+
+import pytest
+
+from elementary.messages.blocks import (
+    DividerBlock,
+    ExpandableBlock,
+    HeaderBlock,
+    LineBlock,
+    LinesBlock,
+    TextBlock,
+)
+from elementary.messages.message_body import Color, MessageBlock, MessageBody
+from elementary.messages.packing import (
+    AdaptiveCardsSizeLimit,
+    BlockKitSizeLimit,
+    MessageSizeLimit,
+    join_messages,
+    pack_messages,
+    split_message,
+)
+
+
+def _lines_block(*texts: str) -> LinesBlock:
+    return LinesBlock(
+        lines=[LineBlock(inlines=[TextBlock(text=text)]) for text in texts]
+    )
+
+
+def _texts(blocks: List[MessageBlock]) -> List[str]:
+    texts = []
+    for block in blocks:
+        if isinstance(block, LinesBlock):
+            texts.extend(line.inlines[0].text for line in block.lines)
+        elif isinstance(block, HeaderBlock):
+            texts.append(block.text)
+    return texts
+
+
+@pytest.mark.parametrize("size_limit", [BlockKitSizeLimit(), AdaptiveCardsSizeLimit()])
+def test_split_message_keeps_blocks_in_order(size_limit: MessageSizeLimit):
+    blocks: List[MessageBlock] = [HeaderBlock(text="Alert")]
+    for index in range(120):
+        blocks.extend([_lines_block(f"line {index} " + "x" * 200), DividerBlock()])
+    body = MessageBody(blocks=blocks, color=Color.RED, id="alert-id")
+
+    parts = split_message(body, size_limit)
+
+    assert len(parts) > 1
+    assert all(size_limit.fits(part) for part in parts)
+    assert [part.id for part in parts] == ["alert-id"] + [None] * (len(parts) - 1)
+    assert all(part.color == Color.RED for part in parts)
+    assert [text for part in parts for text in _texts(part.blocks)] == _texts(blocks)
+    assert not any(
+        isinstance(part.blocks[0], DividerBlock)
+        or isinstance(part.blocks[-1], DividerBlock)
+        for part in parts
+    )
+
+
+def test_split_message_splits_large_blocks():
+    texts = [f"line {index} " + "x" * 200 for index in range(400)]
+    body = MessageBody(
+        blocks=[ExpandableBlock(title="Results", body=[_lines_block(*texts)])]
+    )
+    size_limit = AdaptiveCardsSizeLimit()
+    assert not size_limit.fits(body)
+
+    parts = split_message(body, size_limit)
+
+    assert all(size_limit.fits(part) for part in parts)
+    assert [text for part in parts for text in _texts(part.blocks)] == [
+        "Results",
+        *texts,
+    ]
+
+
+def test_split_message_that_fits():
+    body = MessageBody(blocks=[HeaderBlock(text="Alert")])
+    assert split_message(body, BlockKitSizeLimit()) == [body]
+
+
+def test_pack_messages():
+    messages = [
+        (
+            index,
+            MessageBody(
+                blocks=[HeaderBlock(text=f"Alert {index}"), _lines_block("details")],
+                color=Color.RED if index == 3 else Color.YELLOW,
+            ),
+        )
+        for index in range(30)
+    ]
+    size_limit = BlockKitSizeLimit()
+
+    packed_messages = pack_messages(messages, size_limit)
+
+    # Every alert takes 2 blocks and a divider separates them, so about 50 / 3 alerts fit in a message.
+    assert len(packed_messages) == 2
+    assert [item for items, _ in packed_messages for item in items] == list(range(30))
+    assert all(size_limit.fits(digest) for _, digest in packed_messages)
+    assert [digest.color for _, digest in packed_messages] == [
+        Color.RED,
+        Color.YELLOW,
+    ]
+    second_digest_items, second_digest = packed_messages[1]
+    assert _texts(second_digest.blocks) == _texts(
+        join_messages([messages[item][1] for item in second_digest_items]).blocks
+    )
+
+
+def test_pack_messages_keeps_large_messages_on_their_own():
+    large_body = MessageBody(
+        blocks=[_lines_block(f"line {index}") for index in range(60)]
+    )
+    small_body = MessageBody(blocks=[HeaderBlock(text="Alert")])
+
+    packed_messages = pack_messages(
+        [("small", small_body), ("large", large_body), ("other", small_body)],
+        BlockKitSizeLimit(),
+    )
+
+    assert [items for items, _ in packed_messages] == [
+        ["small"],
+        ["large"],
+        ["other"],
+    ]
@@ -1,6 +1,12 @@
 from datetime import datetime
 
-from elementary.monitor.api.alerts.alert_filters import filter_alerts
+from elementary.monitor.api.alerts.alert_filters import (
+    CompiledFiltersSchema,
+    PendingAlertsQueryFilters,
+    apply_filters_schema_on_alert,
+    filter_alerts,
+    get_pending_alerts_query_filters,
+)
 from elementary.monitor.data_monitoring.schema import (
     FilterSchema,
     FiltersSchema,
@@ -1004,3 +1010,127 @@ def test_multi_filters():
         "test_alert_1",
         "test_alert_2",
     ]
+
+
+def test_compiled_filters_schema_matches_filters_schema():
+    test_alerts, model_alerts, source_freshness_alerts = initial_alerts()
+    alerts = [
+        *test_alerts,
+        *model_alerts,
+        *source_freshness_alerts,
+        _alert_with_status("unknown_status_alert", "not_a_real_status"),
+    ]
+    filters = [FiltersSchema(), FiltersSchema(statuses=[])]
+    for filter_type in FilterType:
+        filters.extend(
+            [
+                FiltersSchema(
+                    tags=[FilterSchema(values=["One", "four"], type=filter_type)]
+                ),
+                FiltersSchema(
+                    owners=[FilterSchema(values=["jeff", "ali"], type=filter_type)]
+                ),
+                FiltersSchema(
+                    models=[
+                        FilterSchema(
+                            values=["model_id_1", "ELEMENTARY.model_id_2", "id_3"],
+                            type=filter_type,
+                        )
+                    ]
+                ),
+                FiltersSchema(
+                    statuses=[
+                        StatusFilterSchema(values=[Status.WARN], type=filter_type)
+                    ]
+                ),
+                FiltersSchema(
+                    resource_types=[
+                        ResourceTypeFilterSchema(
+                            values=[ResourceType.MODEL], type=filter_type
+                        )
+                    ]
+                ),
+                FiltersSchema(
+                    test_ids=[FilterSchema(values=["test_id_2"], type=filter_type)]
+                ),
+            ]
+        )
+    filters.append(FiltersSchema(node_names=["test_1", "model_id_2", "model"]))
+
+    for alerts_filter in filters:
+        compiled_filter = CompiledFiltersSchema(alerts_filter)
+        for alert in alerts:
+            assert compiled_filter(alert) == apply_filters_schema_on_alert(
+                alert, alerts_filter
+            ), (alert.id, alerts_filter)
+
+
+def _matches_query_filters(
+    alert: PendingAlertSchema, query_filters: PendingAlertsQueryFilters
+) -> bool:
+    # Mimics the predicates get_pending_alerts applies on the raw alerts.
+    raw_data = alert.data.json().lower()
+    return (
+        query_filters.types is None or AlertTypes(alert.type) in query_filters.types
+    ) and all(
+        any(data_string in raw_data for data_string in data_strings)
+        for data_strings in query_filters.data_contains
+    )
+
+
+def test_get_pending_alerts_query_filters():
+    query_filters = get_pending_alerts_query_filters(
+        FiltersSchema(
+            tags=[FilterSchema(values=["One", "three"], type=FilterType.IS)],
+            owners=[FilterSchema(values=["jeff"], type=FilterType.IS_NOT)],
+            models=[FilterSchema(values=['mo"del'], type=FilterType.IS)],
+            resource_types=[
+                ResourceTypeFilterSchema(
+                    values=[ResourceType.MODEL], type=FilterType.IS_NOT
+                ),
+                ResourceTypeFilterSchema(
+                    values=[ResourceType.TEST, ResourceType.MODEL],
+                    type=FilterType.IS,
+                ),
+            ],
+        )
+    )
+    assert query_filters.types == [AlertTypes.TEST]
+    # Negative filters and values that JSON escapes are left to filter_alerts.
+    assert query_filters.data_contains == [
+        ["one", "three"],
+        ["error", "fail", "runtime error", "warn"],
+    ]
+
+    assert get_pending_alerts_query_filters(FiltersSchema(statuses=[])) == (
+        PendingAlertsQueryFilters(types=None, data_contains=[])
+    )
+
+
+def test_pending_alerts_query_filters_keep_filtered_alerts():
+    test_alerts, model_alerts, source_freshness_alerts = initial_alerts()
+    alerts = [*test_alerts, *model_alerts, *source_freshness_alerts]
+    filters = [
+        FiltersSchema(),
+        FiltersSchema(
+            tags=[FilterSchema(values=["one", "three"], type=FilterType.IS)],
+            owners=[FilterSchema(values=["jeff"], type=FilterType.IS)],
+        ),
+        FiltersSchema(models=[FilterSchema(values=["model_id_1"])]),
+        FiltersSchema(node_names=["test_1", "model_id_2"]),
+        FiltersSchema(
+            resource_types=[
+                ResourceTypeFilterSchema(
+                    values=[ResourceType.SOURCE_FRESHNESS], type=FilterType.IS_NOT
+                )
+            ]
+        ),
+    ]
+    for alerts_filter in filters:
+        query_filters = get_pending_alerts_query_filters(alerts_filter)
+        # The query may fetch more alerts than needed, but never less.
+        filtered_alerts = filter_alerts(alerts, alerts_filter)
+        assert filtered_alerts
+        assert all(
+            _matches_query_filters(alert, query_filters) for alert in filtered_alerts
+        )
@@ -1,5 +1,8 @@
+from collections import Counter
+
 import pytest
 
+from elementary.monitor.fetchers.tests.schema import TestRunHistoryDBRowSchema
 from tests.mocks.api.tests_api_mock import MockTestsAPI
 
 
@@ -64,6 +67,51 @@ def test_parse_test_db_row(
     )
 
 
+def test_get_invocations_from_history(tests_api_mock: MockTestsAPI):
+    test_result_db_rows = [
+        row.copy(
+            update={
+                "invocation_id": f"invocation_{index}",
+                "execution_time": index,
+                "test_results_description": f"Got {index} results, configured to fail if != 0",
+            }
+        )
+        for index, row in enumerate(
+            tests_api_mock.tests_fetcher.get_all_test_results_db_rows()
+        )
+    ]
+    # The history query returns the same invocations, with the totals aggregated per test.
+    statuses_per_test = Counter(
+        (row.elementary_unique_id, row.status) for row in test_result_db_rows
+    )
+    invocations_per_test = Counter(
+        row.elementary_unique_id for row in test_result_db_rows
+    )
+    test_runs_history_rows = [
+        TestRunHistoryDBRowSchema(
+            elementary_unique_id=row.elementary_unique_id,
+            invocation_id=row.invocation_id,
+            detected_at=row.detected_at,
+            status=row.status,
+            execution_time=row.execution_time,
+            results_description=row.test_results_description,
+            invocations_count=invocations_per_test[row.elementary_unique_id],
+            failures=statuses_per_test[(row.elementary_unique_id, "fail")],
+            errors=statuses_per_test[(row.elementary_unique_id, "error")],
+            warnings=statuses_per_test[(row.elementary_unique_id, "warn")],
+            passed=statuses_per_test[(row.elementary_unique_id, "pass")],
+        )
+        for row in test_result_db_rows
+    ]
+
+    tests_invocations = tests_api_mock._get_invocations(test_result_db_rows)
+    assert tests_invocations
+    assert (
+        tests_api_mock._get_invocations_from_history(test_runs_history_rows)
+        == tests_invocations
+    )
+
+
 @pytest.fixture
 def tests_api_mock() -> MockTestsAPI:
     return MockTestsAPI()
@@ -1,14 +1,32 @@
+import asyncio
 import json
+import os
+import sqlite3
 from datetime import datetime
+from unittest import mock
 
 import pytest
+import requests
 
+from elementary.messages.blocks import HeaderBlock, LineBlock, LinesBlock, TextBlock
+from elementary.messages.message_body import MessageBody
+from elementary.messages.messaging_integrations.base_messaging_integration import (
+    MessageSendResult,
+)
 from elementary.messages.messaging_integrations.slack_web import (
+    SlackWebMessageContext,
     SlackWebMessagingIntegration,
 )
 from elementary.monitor.alerts.model_alert import ModelAlertModel
 from elementary.monitor.alerts.source_freshness_alert import SourceFreshnessAlertModel
 from elementary.monitor.alerts.test_alert import TestAlertModel
+from elementary.monitor.data_monitoring.alerts.alerts_outbox import (
+    ALERTS_OUTBOX_FILE_NAME,
+    AlertsOutbox,
+)
+from elementary.monitor.data_monitoring.alerts.data_monitoring_alerts import (
+    _get_alert_ids,
+)
 from elementary.monitor.fetchers.alerts.schema.alert_data import (
     ModelAlertDataSchema,
     SourceFreshnessAlertDataSchema,
@@ -237,6 +255,299 @@ def test_format_alerts(data_monitoring_alerts_mock: DataMonitoringAlertsMock):
     assert len(sorted_formatted_alerts[6].alerts) == 1
 
 
+def test_populate_data(data_monitoring_alerts_mock: DataMonitoringAlertsMock):
+    with mock.patch.object(
+        data_monitoring_alerts_mock.internal_dbt_runner, "run", return_value=True
+    ) as run:
+        assert data_monitoring_alerts_mock._populate_data(days_back=2)
+
+    # The watermarks table is built with the alerts, so a full refresh resets both.
+    assert run.call_args.kwargs["select"].split() == [
+        "elementary_cli.alerts.alerts_population_watermarks",
+        "elementary_cli.alerts.alerts_v2",
+    ]
+    # The sample rows aren't limited by default.
+    assert run.call_args.kwargs["vars"] == dict(days_back=2)
+
+    data_monitoring_alerts_mock.config.test_sample_rows_limit = 10
+    with mock.patch.object(
+        data_monitoring_alerts_mock.internal_dbt_runner, "run", return_value=True
+    ) as run:
+        assert data_monitoring_alerts_mock._populate_data(days_back=2)
+    assert run.call_args.kwargs["vars"] == dict(days_back=2, test_sample_rows_limit=10)
+
+
+def test_send_alerts(data_monitoring_alerts_mock: DataMonitoringAlertsMock):
+    alerts = data_monitoring_alerts_mock._format_alerts(
+        data_monitoring_alerts_mock._fetch_data(days_back=1)
+    )
+    destinations = {alert: f"channel_{index % 2}" for index, alert in enumerate(alerts)}
+    failed_alert = alerts[-1]
+    sent_alerts = []
+    in_flight_destinations = set()
+    max_in_flight_destinations = 0
+
+    async def send_alert(integration, alert, destination):
+        nonlocal max_in_flight_destinations
+        in_flight_destinations.add(destination)
+        max_in_flight_destinations = max(
+            max_in_flight_destinations, len(in_flight_destinations)
+        )
+        await asyncio.sleep(0.01)
+        in_flight_destinations.discard(destination)
+        sent_alerts.append(alert)
+        return alert is not failed_alert
+
+    with mock.patch.object(
+        data_monitoring_alerts_mock,
+        "_get_alert_destination",
+        side_effect=lambda integration, alert: destinations[alert],
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_async_send_alert", side_effect=send_alert
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts"
+    ) as update_sent_alerts:
+        data_monitoring_alerts_mock._send_alerts(alerts)
+
+    # The destinations are sent to concurrently.
+    assert max_in_flight_destinations == 2
+    for destination in set(destinations.values()):
+        # Every destination gets its alerts in their original order.
+        assert [
+            alert for alert in sent_alerts if destinations[alert] == destination
+        ] == [alert for alert in alerts if destinations[alert] == destination]
+    assert not data_monitoring_alerts_mock.success
+    assert data_monitoring_alerts_mock.sent_alert_count == len(alerts) - 1
+    # The sent alerts are updated at once.
+    update_sent_alerts.assert_called_once()
+    assert sorted(update_sent_alerts.call_args.args[0]) == sorted(
+        alert.id for alert in alerts if alert is not failed_alert
+    )
+
+
+def test_send_alerts_digest(data_monitoring_alerts_mock: DataMonitoringAlertsMock):
+    alerts = data_monitoring_alerts_mock._format_alerts(
+        data_monitoring_alerts_mock._fetch_data(days_back=1)
+    )
+    data_monitoring_alerts_mock.config.alerts_digest = True
+    sent_bodies = []
+
+    async def send_alert_message(integration, body, destination):
+        sent_bodies.append(body)
+        return True
+
+    with mock.patch.object(
+        data_monitoring_alerts_mock,
+        "_async_send_alert_message",
+        side_effect=send_alert_message,
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts"
+    ) as update_sent_alerts:
+        data_monitoring_alerts_mock._send_alerts(alerts)
+
+    # The alerts are packed into fewer messages, and are all marked as sent.
+    assert 0 < len(sent_bodies) < len(alerts)
+    assert data_monitoring_alerts_mock.sent_alert_count == len(alerts)
+    assert sorted(update_sent_alerts.call_args.args[0]) == sorted(
+        alert.id for alert in alerts
+    )
+
+
+def test_send_large_alert_message_in_thread(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+):
+    integration = data_monitoring_alerts_mock.alerts_integration
+    assert isinstance(integration, SlackWebMessagingIntegration)
+    body = MessageBody(
+        blocks=[HeaderBlock(text="Alert")]
+        + [
+            LinesBlock(lines=[LineBlock(inlines=[TextBlock(text=f"line {index}")])])
+            for index in range(120)
+        ]
+    )
+    send_result = MessageSendResult(
+        message_context=SlackWebMessageContext(id="1", channel="C1"),
+        timestamp=datetime.now(),
+        message_format="block_kit",
+    )
+
+    with mock.patch.object(
+        integration, "async_send_message", return_value=send_result
+    ) as send_message, mock.patch.object(
+        integration, "async_reply_to_message", return_value=send_result
+    ) as reply_to_message:
+        assert asyncio.run(
+            data_monitoring_alerts_mock._async_send_alert_message(
+                integration, body, "alerts"
+            )
+        )
+
+    send_message.assert_called_once()
+    # The rest of the message is sent as replies in the thread of the first one.
+    assert reply_to_message.call_count == 2
+    assert all(
+        call.kwargs["message_context"] == send_result.message_context
+        for call in reply_to_message.call_args_list
+    )
+
+
+def _get_alerts_with_unique_ids(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+) -> list:
+    alerts = data_monitoring_alerts_mock._format_alerts(
+        data_monitoring_alerts_mock._fetch_data(days_back=1)
+    )
+    # The mocked alerts of different types share ids.
+    for index, alert in enumerate(alerts):
+        alert.id = f"{alert.id}_{index}"
+    return alerts
+
+
+def _get_outbox_delivered_alert_ids(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+) -> set:
+    outbox = AlertsOutbox(
+        os.path.join(
+            data_monitoring_alerts_mock.config.target_dir, ALERTS_OUTBOX_FILE_NAME
+        )
+    )
+    try:
+        return outbox.get_delivered_alert_ids()
+    finally:
+        outbox.close()
+
+
+def test_send_alerts_resumes_after_failed_run(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+):
+    alerts = _get_alerts_with_unique_ids(data_monitoring_alerts_mock)
+    alert_ids = sorted(
+        alert_id for alert in alerts for alert_id in _get_alert_ids(alert)
+    )
+    failed_alert = alerts[-1]
+    sent_alerts = []
+
+    async def send_alert(integration, alert, destination):
+        sent_alerts.append(alert)
+        return alert is not failed_alert
+
+    # The first run dies before updating the warehouse with the sent alerts.
+    with mock.patch.object(
+        data_monitoring_alerts_mock, "_async_send_alert", side_effect=send_alert
+    ), mock.patch.object(
+        data_monitoring_alerts_mock,
+        "_update_sent_alerts",
+        side_effect=RuntimeError("Interrupted"),
+    ):
+        with pytest.raises(RuntimeError):
+            data_monitoring_alerts_mock._send_alerts(alerts)
+    assert sent_alerts == alerts
+
+    # The next run only sends the alert that wasn't delivered, and updates all of them.
+    sent_alerts.clear()
+    with mock.patch.object(
+        data_monitoring_alerts_mock, "_async_send_alert", side_effect=send_alert
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts"
+    ) as update_sent_alerts:
+        data_monitoring_alerts_mock._send_alerts(alerts)
+    assert sent_alerts == [failed_alert]
+    assert sorted(update_sent_alerts.call_args.args[0]) == [
+        alert_id
+        for alert_id in alert_ids
+        if alert_id not in _get_alert_ids(failed_alert)
+    ]
+
+    # The flushed alerts are removed from the outbox.
+    assert _get_outbox_delivered_alert_ids(data_monitoring_alerts_mock) == set()
+
+
+def test_send_alerts_keeps_outbox_until_update_is_confirmed(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+):
+    alerts = _get_alerts_with_unique_ids(data_monitoring_alerts_mock)
+    alert_ids = {alert_id for alert in alerts for alert_id in _get_alert_ids(alert)}
+
+    async def send_alert(integration, alert, destination):
+        return True
+
+    with mock.patch.object(
+        data_monitoring_alerts_mock, "_async_send_alert", side_effect=send_alert
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts", return_value=False
+    ):
+        data_monitoring_alerts_mock._send_alerts(alerts)
+    assert _get_outbox_delivered_alert_ids(data_monitoring_alerts_mock) == alert_ids
+
+    # A run without alerts to send still flushes the delivered alerts.
+    with mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts", return_value=True
+    ) as update_sent_alerts:
+        data_monitoring_alerts_mock._send_alerts([])
+    assert sorted(update_sent_alerts.call_args.args[0]) == sorted(alert_ids)
+    assert _get_outbox_delivered_alert_ids(data_monitoring_alerts_mock) == set()
+
+
+def test_send_alerts_when_outbox_is_locked(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+):
+    alerts = _get_alerts_with_unique_ids(data_monitoring_alerts_mock)
+
+    async def send_alert(integration, alert, destination):
+        return True
+
+    with mock.patch.object(
+        data_monitoring_alerts_mock, "_async_send_alert", side_effect=send_alert
+    ), mock.patch.object(
+        AlertsOutbox,
+        "mark_delivered",
+        side_effect=sqlite3.OperationalError("database is locked"),
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts"
+    ) as update_sent_alerts:
+        data_monitoring_alerts_mock._send_alerts(alerts)
+
+    # The alerts are still sent and updated.
+    assert data_monitoring_alerts_mock.sent_alert_count == len(alerts)
+    assert sorted(update_sent_alerts.call_args.args[0]) == sorted(
+        alert.id for alert in alerts
+    )
+
+
+def test_send_alerts_when_a_destination_fails(
+    data_monitoring_alerts_mock: DataMonitoringAlertsMock,
+):
+    alerts = _get_alerts_with_unique_ids(data_monitoring_alerts_mock)
+    destinations = {alert: f"channel_{index % 2}" for index, alert in enumerate(alerts)}
+
+    async def send_alert(integration, alert, destination):
+        if destination == "channel_1":
+            raise requests.ConnectionError("Connection reset")
+        await asyncio.sleep(0.01)
+        return True
+
+    with mock.patch.object(
+        data_monitoring_alerts_mock,
+        "_get_alert_destination",
+        side_effect=lambda integration, alert: destinations[alert],
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_async_send_alert", side_effect=send_alert
+    ), mock.patch.object(
+        data_monitoring_alerts_mock, "_update_sent_alerts", return_value=True
+    ) as update_sent_alerts:
+        with pytest.raises(requests.ConnectionError):
+            data_monitoring_alerts_mock._send_alerts(alerts)
+
+    # The other destination still gets its alerts, and they're updated as sent before the error is raised.
+    assert sorted(update_sent_alerts.call_args.args[0]) == sorted(
+        alert.id for alert in alerts if destinations[alert] == "channel_0"
+    )
+    assert _get_outbox_delivered_alert_ids(data_monitoring_alerts_mock) == set()
+
+
 @pytest.fixture
-def data_monitoring_alerts_mock() -> DataMonitoringAlertsMock:
-    return DataMonitoringAlertsMock()
+def data_monitoring_alerts_mock(tmp_path) -> DataMonitoringAlertsMock:
+    data_monitoring_alerts_mock = DataMonitoringAlertsMock()
+    # Keeps the alerts outbox of every test to itself.
+    data_monitoring_alerts_mock.config.target_dir = str(tmp_path)
+    return data_monitoring_alerts_mock
@@ -16,9 +16,11 @@ from tests.mocks.config_mock import MockConfig
 
 
 def test_parse_selector_with_user_dbt_runner_no_models(
-    dbt_runner_no_models_mock, anonymous_tracking_mock
+    dbt_runner_no_models_mock, anonymous_tracking_mock, tmp_path
 ):
     config = MockConfig("mock_project_dir")
+    # The dbt runner and the selector fetcher cache their state in the target dir.
+    config.target_dir = str(tmp_path)
 
     data_monitoring_filter_with_user_dbt_runner = SelectorFilter(
         tracking=anonymous_tracking_mock,
@@ -34,9 +36,11 @@ def test_parse_selector_with_user_dbt_runner_no_models(
 
 
 def test_parse_selector_with_user_dbt_runner_with_models(
-    dbt_runner_with_models_mock, anonymous_tracking_mock
+    dbt_runner_with_models_mock, anonymous_tracking_mock, tmp_path
 ):
     config = MockConfig("mock_project_dir")
+    # The dbt runner and the selector fetcher cache their state in the target dir.
+    config.target_dir = str(tmp_path)
 
     data_monitoring_filter_with_user_dbt_runner = SelectorFilter(
         tracking=anonymous_tracking_mock,
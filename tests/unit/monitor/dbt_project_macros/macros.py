@@ -0,0 +1,54 @@
+import functools
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+import jinja2
+
+DBT_PROJECT_MACROS_DIR = (
+    Path(__file__).parents[4] / "elementary" / "monitor" / "dbt_project" / "macros"
+)
+
+
+class _MacroReturn(Exception):
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _return(value: Any) -> None:
+    raise _MacroReturn(value)
+
+
+def _call_macro(macro: Callable, *args: Any, **kwargs: Any) -> Any:
+    try:
+        return macro(*args, **kwargs)
+    except _MacroReturn as macro_return:
+        return macro_return.value
+
+
+def load_macros(
+    macros_path: str,
+    overrides: Optional[Dict[str, Callable]] = None,
+    **context: Any,
+) -> SimpleNamespace:
+    """Loads the macros of a file in the internal dbt project, under the 'elementary_cli' namespace like dbt does.
+
+    The dbt context (adapter, elementary's macros...) is given as keyword arguments, usually mocks. The overrides
+    replace macros of the file when they're called by other macros.
+    """
+    env = jinja2.Environment(extensions=["jinja2.ext.do"])
+    source = (DBT_PROJECT_MACROS_DIR / macros_path).read_text()
+    elementary_cli = SimpleNamespace()
+    template = env.from_string(
+        source, globals={"return": _return, "elementary_cli": elementary_cli, **context}
+    )
+    module = template.make_module()
+    for name in dir(module):
+        macro = getattr(module, name)
+        if isinstance(macro, jinja2.runtime.Macro):
+            # Macros of the file can call each other without the namespace, so the return is caught by the macro itself.
+            macro._func = functools.partial(_call_macro, macro._func)
+            setattr(elementary_cli, name, macro)
+    for name, macro in (overrides or {}).items():
+        setattr(elementary_cli, name, macro)
+    return elementary_cli
@@ -0,0 +1,115 @@
+from datetime import datetime
+from unittest import mock
+
+from tests.unit.monitor.dbt_project_macros.macros import load_macros
+
+WATERMARK_MACROS = "alerts/population/alerts_population_watermark.sql"
+POPULATE_ALERTS_TABLE_MACROS = "alerts/population/populate_alerts_table.sql"
+SOURCES = ["test_results", "model_runs", "source_freshness"]
+
+
+def _elementary_mock() -> mock.MagicMock:
+    elementary = mock.MagicMock()
+    elementary.edr_current_timestamp.return_value = "now()"
+    elementary.edr_timeadd.side_effect = (
+        lambda date_part, number, timestamp: f"timeadd({date_part}, {number}, {timestamp})"
+    )
+    elementary.edr_cast_as_timestamp.side_effect = lambda expression: (
+        f"cast({expression})"
+    )
+    elementary.get_elementary_relation.side_effect = lambda name: name
+    return elementary
+
+
+def test_population_since_is_per_source():
+    macros = load_macros(WATERMARK_MACROS, elementary=_elementary_mock())
+
+    since_by_source = macros.get_alerts_population_since(days_back=7)
+
+    assert list(since_by_source) == SOURCES
+    for source_name, since in since_by_source.items():
+        assert f"source_name = '{source_name}'" in since
+        # The scan starts a day before the mark by default.
+        assert "timeadd(hour, -24, max(high_water_mark))" in since
+        assert "timeadd(day, -7, now())" in since
+
+
+def test_population_since_without_watermarks():
+    elementary = _elementary_mock()
+    elementary.get_elementary_relation.side_effect = None
+    elementary.get_elementary_relation.return_value = None
+    macros = load_macros(WATERMARK_MACROS, elementary=elementary)
+
+    assert macros.get_alerts_population_since(days_back=7) == {
+        source_name: "timeadd(day, -7, now())" for source_name in SOURCES
+    }
+
+
+def test_watermark_records_high_water_mark_per_source():
+    elementary = _elementary_mock()
+    macros = load_macros(
+        WATERMARK_MACROS, elementary=elementary, adapter=mock.MagicMock()
+    )
+
+    macros.update_alerts_population_watermark(
+        {
+            "test_results": datetime(2026, 10, 18, 3, 0),
+            "model_runs": None,
+            "source_freshness": datetime(2026, 10, 17, 22, 30),
+        }
+    )
+
+    insert_watermarks_query = elementary.run_query.call_args_list[0].args[0]
+    assert "cast('2026-10-18 03:00:00')" in insert_watermarks_query
+    assert "cast('2026-10-17 22:30:00')" in insert_watermarks_query
+    assert "cast(null)" in insert_watermarks_query
+    assert insert_watermarks_query.count("union all") == len(SOURCES) - 1
+
+
+def test_high_water_marks_are_read_before_the_sources_are_scanned():
+    calls = mock.Mock()
+    calls.get_alerts_population_since.return_value = {
+        source_name: f"{source_name}_since" for source_name in SOURCES
+    }
+    calls.get_alerts_population_high_water_marks.return_value = {
+        "test_results": datetime(2026, 10, 18, 3, 0)
+    }
+    for populate_macro in [
+        "populate_test_alerts",
+        "populate_model_alerts",
+        "populate_source_freshness_alerts",
+    ]:
+        getattr(calls, populate_macro).return_value = []
+    macros = load_macros(
+        POPULATE_ALERTS_TABLE_MACROS,
+        overrides={
+            name: getattr(calls, name)
+            for name in [
+                "get_alerts_population_since",
+                "get_alerts_population_high_water_marks",
+                "populate_test_alerts",
+                "populate_model_alerts",
+                "populate_source_freshness_alerts",
+                "update_alerts_population_watermark",
+            ]
+        },
+        elementary=mock.MagicMock(),
+        execute=True,
+        ref=mock.MagicMock(),
+        load_relation=mock.Mock(return_value=None),
+    )
+
+    macros.populate_alerts_table(days_back=7)
+
+    assert [name for name, _, _ in calls.mock_calls] == [
+        "get_alerts_population_since",
+        "get_alerts_population_high_water_marks",
+        "populate_test_alerts",
+        "populate_model_alerts",
+        "populate_source_freshness_alerts",
+        "update_alerts_population_watermark",
+    ]
+    assert calls.populate_model_alerts.call_args.kwargs["since"] == "model_runs_since"
+    calls.update_alerts_population_watermark.assert_called_once_with(
+        {"test_results": datetime(2026, 10, 18, 3, 0)}, days_back=7
+    )
@@ -0,0 +1,27 @@
+from unittest import mock
+
+from tests.unit.monitor.dbt_project_macros.macros import load_macros
+
+
+def _run_result_rows_query(sample_rows_limit=None) -> str:
+    elementary = mock.MagicMock()
+    elementary.edr_cast_as_string.side_effect = lambda expression: (
+        f"cast({expression} as string)"
+    )
+    macros = load_macros("get_result_rows_agate.sql", elementary=elementary)
+    macros.run_result_rows_query("select * from test_result_rows", sample_rows_limit)
+    return " ".join(elementary.run_query.call_args[0][0].split())
+
+
+def test_sample_rows_are_ordered():
+    query = _run_result_rows_query(sample_rows_limit=5)
+
+    assert (
+        "row_number() over ( partition by elementary_test_results_id "
+        "order by created_at, cast(result_row as string) ) as sample_row_number"
+    ) in query
+    assert "where sample_row_number <= 5" in query
+
+
+def test_all_rows_are_fetched_without_a_limit():
+    assert _run_result_rows_query() == "select * from test_result_rows"
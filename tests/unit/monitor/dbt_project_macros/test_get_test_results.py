@@ -0,0 +1,38 @@
+from unittest import mock
+
+from tests.unit.monitor.dbt_project_macros.macros import load_macros
+
+
+def _select_columns(static_columns=None) -> dict:
+    elementary = mock.MagicMock()
+    elementary.edr_cast_as_timestamp.side_effect = lambda expression: (
+        f"cast({expression})"
+    )
+    macros = load_macros("get_test_results.sql", elementary=elementary)
+    select_columns = macros.get_test_results_columns(static_columns)
+    return {
+        select_column.split()[-1].split(".")[-1]: " ".join(select_column.split())
+        for select_column in select_columns.split(",")
+    }
+
+
+def test_wide_columns_are_selected_for_the_latest_invocation():
+    select_columns = _select_columns(static_columns=["meta", "test_params"])
+
+    for column in ["meta", "test_params", "test_results_query", "result_rows"]:
+        assert select_columns[column] == (
+            f"case when test_results.invocations_rank_index = 1 "
+            f"then test_results.{column} else NULL end as {column}"
+        )
+    assert select_columns["model_meta"] == "test_results.model_meta"
+    assert select_columns["status"] == "test_results.status"
+    assert select_columns["detected_at"] == (
+        "cast(test_results.detected_at) as detected_at"
+    )
+
+
+def test_metadata_is_selected_for_every_invocation_without_static_columns():
+    select_columns = _select_columns()
+
+    assert select_columns["meta"] == "test_results.meta"
+    assert select_columns["result_rows"].startswith("case when")
@@ -0,0 +1,45 @@
+from unittest import mock
+
+import pytest
+
+from tests.unit.monitor.dbt_project_macros.macros import load_macros
+
+UPDATE_ALERTS_STATUS_MACROS = "alerts/manage/update_alerts_status.sql"
+
+
+@pytest.mark.parametrize("has_temp_table_support", [True, False])
+def test_update_alerts_status_commits(has_temp_table_support):
+    dbt_context = mock.MagicMock()
+    dbt_context.elementary.has_temp_table_support.return_value = has_temp_table_support
+    macros = load_macros(
+        UPDATE_ALERTS_STATUS_MACROS,
+        overrides={
+            "stage_alert_ids": mock.Mock(return_value="alert_ids_to_update"),
+            "get_update_alerts_status_query": mock.Mock(return_value="update"),
+        },
+        elementary=dbt_context.elementary,
+        adapter=dbt_context.adapter,
+    )
+
+    macros.default__update_alerts_status(["alert_id"], "sent", None)
+
+    # The update is committed once it (and the cleanup of its ids) ran.
+    called_methods = [name for name, _, _ in dbt_context.mock_calls]
+    assert called_methods[-1] == "adapter.commit"
+    assert "elementary.run_query" in called_methods
+
+
+def test_stage_alert_ids_is_unique_per_invocation():
+    elementary = mock.MagicMock()
+    elementary.get_package_database_and_schema.return_value = ("db", "schema")
+    table_names = []
+    for invocation_id in ["0b1f-11", "0b1f-12"]:
+        macros = load_macros(
+            UPDATE_ALERTS_STATUS_MACROS,
+            elementary=elementary,
+            invocation_id=invocation_id,
+        )
+        macros.stage_alert_ids(["alert_id"])
+        table_names.append(elementary.create_temp_table.call_args.args[2])
+
+    assert table_names == ["alert_ids_to_update_0b1f11", "alert_ids_to_update_0b1f12"]
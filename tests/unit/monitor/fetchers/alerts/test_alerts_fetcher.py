@@ -20,31 +20,81 @@ def test_split_list_to_chunks(alerts_fetcher_mock: MockAlertsFetcher):
         assert len(chunk) == 50
 
 
+def _mock_run_operation_success(mock_subprocess_run):
+    mock_subprocess_run.return_value = mock.MagicMock(
+        returncode=0, stdout=b"", stderr=None
+    )
+
+
+def _get_macro_calls(mock_subprocess_run):
+    macro_calls = []
+    for call_args in mock_subprocess_run.call_args_list:
+        command_args = call_args[0][0]
+        assert "run-operation" in command_args
+        macro_call = json.loads(command_args[command_args.index("--args") + 1])
+        macro_calls.append((macro_call["macro_name"], macro_call["macro_args"]))
+    return macro_calls
+
+
 @mock.patch("subprocess.run")
 def test_update_sent_alerts(
     mock_subprocess_run, alerts_fetcher_mock: MockAlertsFetcher
 ):
+    _mock_run_operation_success(mock_subprocess_run)
     mock_alerts_ids_to_update = ["mock_alert_id"] * 60
     alerts_fetcher_mock.update_sent_alerts(alert_ids=mock_alerts_ids_to_update)
 
-    # Test that alert ids were split into chunks
-    assert mock_subprocess_run.call_count == 2
+    # All the alerts are updated by a single run-operation.
+    macro_calls = _get_macro_calls(mock_subprocess_run)
+    assert len(macro_calls) == 1
+    macro_name, macro_args = macro_calls[0]
+    assert macro_name == "elementary_cli.update_alerts_status"
+    assert macro_args["alert_ids"] == mock_alerts_ids_to_update
+    assert macro_args["status"] == "sent"
+    assert macro_args["sent_at"]
+
+
+@pytest.mark.parametrize(
+    "macro_output,updated_successfully",
+    [
+        ("true", True),
+        (None, False),
+    ],
+)
+@mock.patch("subprocess.run")
+def test_update_sent_alerts_confirmation(
+    mock_subprocess_run,
+    macro_output,
+    updated_successfully,
+    alerts_fetcher_mock: MockAlertsFetcher,
+):
+    stdout = (
+        json.dumps(
+            {
+                "info": {
+                    "msg": f"Elementary: --ELEMENTARY-MACRO-OUTPUT-START--{macro_output}--ELEMENTARY-MACRO-OUTPUT-END--",
+                    "level": "info",
+                }
+            }
+        )
+        if macro_output
+        else ""
+    )
+    mock_subprocess_run.return_value = mock.MagicMock(
+        returncode=0, stdout=stdout.encode(), stderr=None
+    )
 
-    calls_args = mock_subprocess_run.call_args_list
-    for call_args in calls_args:
-        # Test that update_sent_alerts has been called with alert_ids as arguments.
-        # Indices account for --log-format json being prepended to all dbt commands.
-        assert call_args[0][0][3] == "run"
-        assert call_args[0][0][4] == "-s"
-        assert call_args[0][0][5] == "elementary_cli.update_alerts.update_sent_alerts"
-        dbt_run_params = json.loads(call_args[0][0][11])
-        assert "alert_ids" in dbt_run_params
-        assert "sent_at" in dbt_run_params
+    # The update is only confirmed once the macro returned, after committing it.
+    assert (
+        alerts_fetcher_mock.update_sent_alerts(alert_ids=["mock_alert_id"])
+        is updated_successfully
+    )
 
 
 @mock.patch("subprocess.run")
 def test_skip_alerts(mock_subprocess_run, alerts_fetcher_mock: MockAlertsFetcher):
-    # Create 100 alerts
+    _mock_run_operation_success(mock_subprocess_run)
+    # Create 300 alerts
     alerts = alerts_fetcher_mock.query_pending_alerts()
     mock_alerts_ids_to_skip = alerts * 20
 
@@ -52,20 +102,36 @@ def test_skip_alerts(mock_subprocess_run, alerts_fetcher_mock: MockAlertsFetcher
         alerts_to_skip=mock_alerts_ids_to_skip,
     )
 
-    # Test that alert ids were split into chunks
-    assert mock_subprocess_run.call_count == 6
+    macro_calls = _get_macro_calls(mock_subprocess_run)
+    assert len(macro_calls) == 1
+    macro_name, macro_args = macro_calls[0]
+    assert macro_name == "elementary_cli.update_alerts_status"
+    assert macro_args["alert_ids"] == [alert.id for alert in mock_alerts_ids_to_skip]
+    assert macro_args["status"] == "skipped"
+    assert macro_args["sent_at"] is None
+
 
-    calls_args = mock_subprocess_run.call_args_list
-    for call_args in calls_args:
-        # Test that update_skipped_alerts has been called with alert_ids as arguments.
-        # Indices account for --log-format json being prepended to all dbt commands.
-        assert call_args[0][0][3] == "run"
-        assert call_args[0][0][4] == "-s"
+@mock.patch("subprocess.run")
+def test_update_alerts_status_fits_command_line(
+    mock_subprocess_run, alerts_fetcher_mock: MockAlertsFetcher
+):
+    _mock_run_operation_success(mock_subprocess_run)
+    alert_ids = [f"{index:040d}" for index in range(5000)]
+    alerts_fetcher_mock.update_sent_alerts(alert_ids=alert_ids)
+
+    macro_calls = _get_macro_calls(mock_subprocess_run)
+    assert len(macro_calls) > 1
+    assert [
+        alert_id
+        for _, macro_args in macro_calls
+        for alert_id in macro_args["alert_ids"]
+    ] == alert_ids
+    for call_args in mock_subprocess_run.call_args_list:
+        command_args = call_args[0][0]
         assert (
-            call_args[0][0][5] == "elementary_cli.update_alerts.update_skipped_alerts"
+            len(command_args[command_args.index("--args") + 1])
+            <= alerts_fetcher_mock.dbt_runner.max_command_arg_length
         )
-        dbt_run_params = json.loads(call_args[0][0][11])
-        assert "alert_ids" in dbt_run_params
 
 
 @pytest.fixture
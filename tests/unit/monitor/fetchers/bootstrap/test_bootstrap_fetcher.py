@@ -0,0 +1,73 @@
+import json
+from unittest import mock
+
+from elementary.monitor.fetchers.bootstrap.bootstrap import BootstrapFetcher
+from tests.mocks.dbt_runner_mock import MockDbtRunner
+
+BOOTSTRAP_RESULT = {
+    "latest_invocation": {"project_name": "my_project", "elementary_version": "0.1.0"},
+    "warehouse_type": "postgres",
+    "warehouse_unique_id": "localhost",
+    "elementary_database_and_schema": '"db"."schema"',
+}
+
+
+def _create_bootstrap_fetcher(**kwargs) -> BootstrapFetcher:
+    dbt_runner = MockDbtRunner()
+    dbt_runner.run_operation = mock.MagicMock(  # type: ignore[method-assign]
+        return_value=[json.dumps(BOOTSTRAP_RESULT)]
+    )
+    return BootstrapFetcher(dbt_runner, **kwargs)
+
+
+def test_get_bootstrap():
+    bootstrap_fetcher = _create_bootstrap_fetcher()
+    bootstrap = bootstrap_fetcher.get_bootstrap()
+
+    assert bootstrap.dict() == BOOTSTRAP_RESULT
+    bootstrap_fetcher.dbt_runner.run_operation.assert_called_once_with(
+        "elementary_cli.bootstrap", quiet=True
+    )
+
+
+def test_get_bootstrap_cached(tmp_path):
+    bootstrap_fetcher = _create_bootstrap_fetcher(
+        cache_dir=str(tmp_path), cache_key="target", cache_ttl=300
+    )
+    assert bootstrap_fetcher.get_bootstrap() == bootstrap_fetcher.get_bootstrap()
+    assert bootstrap_fetcher.dbt_runner.run_operation.call_count == 1
+
+    # The cache is kept on disk, so it is shared between runs.
+    other_run_fetcher = _create_bootstrap_fetcher(
+        cache_dir=str(tmp_path), cache_key="target", cache_ttl=300
+    )
+    assert other_run_fetcher.get_bootstrap().dict() == BOOTSTRAP_RESULT
+    assert other_run_fetcher.dbt_runner.run_operation.call_count == 0
+
+    # But it is keyed by the profile's target.
+    other_target_fetcher = _create_bootstrap_fetcher(
+        cache_dir=str(tmp_path), cache_key="other_target", cache_ttl=300
+    )
+    other_target_fetcher.get_bootstrap()
+    assert other_target_fetcher.dbt_runner.run_operation.call_count == 1
+
+
+def test_get_bootstrap_cache_expired(tmp_path):
+    bootstrap_fetcher = _create_bootstrap_fetcher(
+        cache_dir=str(tmp_path), cache_key="target", cache_ttl=300
+    )
+    with mock.patch("time.time", return_value=1000):
+        bootstrap_fetcher.get_bootstrap()
+    with mock.patch("time.time", return_value=1400):
+        bootstrap_fetcher.get_bootstrap()
+    assert bootstrap_fetcher.dbt_runner.run_operation.call_count == 2
+
+
+def test_get_bootstrap_cache_disabled(tmp_path):
+    bootstrap_fetcher = _create_bootstrap_fetcher(
+        cache_dir=str(tmp_path), cache_key="target", cache_ttl=0
+    )
+    bootstrap_fetcher.get_bootstrap()
+    bootstrap_fetcher.get_bootstrap()
+    assert bootstrap_fetcher.dbt_runner.run_operation.call_count == 2
+    assert list(tmp_path.iterdir()) == []
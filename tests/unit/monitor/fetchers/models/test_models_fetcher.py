@@ -0,0 +1,42 @@
+import json
+from unittest import mock
+
+from elementary.monitor.fetchers.models.models import ModelsFetcher
+from tests.mocks.dbt_runner_mock import MockDbtRunner
+
+
+def _table(unique_id: str) -> dict:
+    return dict(unique_id=unique_id, schema_name="schema", table_name="table")
+
+
+def test_get_artifacts():
+    dbt_runner = MockDbtRunner()
+    dbt_runner.run_operations_batch = mock.MagicMock(  # type: ignore[method-assign]
+        return_value={
+            "elementary_cli.get_seeds": [json.dumps([_table("seed.a")])],
+            "elementary_cli.get_snapshots": [],
+            "elementary_cli.get_models": [json.dumps([_table("model.a")])],
+            "elementary_cli.get_sources": [json.dumps([])],
+            "elementary_cli.get_exposures": [
+                json.dumps([{"unique_id": "exposure.a", "raw_queries": '["select 1"]'}])
+            ],
+            "elementary_cli.get_dbt_models_test_coverage": [
+                json.dumps([{"model_unique_id": "model.a", "table_tests": 2}])
+            ],
+        }
+    )
+
+    artifacts = ModelsFetcher(dbt_runner).get_artifacts(exclude_elementary_models=True)
+
+    # All the artifacts are fetched by a single dbt invocation.
+    dbt_runner.run_operations_batch.assert_called_once()
+    assert (
+        "elementary_cli.get_models",
+        {"exclude_elementary": True},
+    ) in dbt_runner.run_operations_batch.call_args.args[0]
+    assert [seed.unique_id for seed in artifacts.seeds] == ["seed.a"]
+    assert artifacts.snapshots == []
+    assert [model.unique_id for model in artifacts.models] == ["model.a"]
+    assert artifacts.sources == []
+    assert artifacts.exposures[0].raw_queries == ["select 1"]
+    assert artifacts.coverages[0].table_tests == 2
@@ -0,0 +1,46 @@
+from unittest import mock
+
+import pytest
+
+from elementary.monitor.fetchers.selector.selector import SelectorFetcher
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    project_dir = tmp_path / "project"
+    (project_dir / "target").mkdir(parents=True)
+    (project_dir / "target" / "manifest.json").write_text('{"nodes": {}}')
+    return project_dir
+
+
+def _create_selector_fetcher(project_dir, cache_dir) -> SelectorFetcher:
+    dbt_runner = mock.MagicMock(project_dir=str(project_dir))
+    dbt_runner.ls.return_value = ["model.a", "model.b"]
+    return SelectorFetcher(dbt_runner, cache_dir=str(cache_dir))
+
+
+def test_get_selector_results_cached(project_dir, tmp_path):
+    selector_fetcher = _create_selector_fetcher(project_dir, tmp_path / "edr_target")
+    assert selector_fetcher.get_selector_results("tag:a") == ["model.a", "model.b"]
+
+    other_run_fetcher = _create_selector_fetcher(project_dir, tmp_path / "edr_target")
+    assert other_run_fetcher.get_selector_results("tag:a") == ["model.a", "model.b"]
+    other_run_fetcher.dbt_runner.ls.assert_not_called()
+
+    other_run_fetcher.get_selector_results("tag:b")
+    other_run_fetcher.dbt_runner.ls.assert_called_once_with(select="tag:b")
+
+
+def test_get_selector_results_changed_manifest(project_dir, tmp_path):
+    selector_fetcher = _create_selector_fetcher(project_dir, tmp_path / "edr_target")
+    selector_fetcher.get_selector_results("tag:a")
+    (project_dir / "target" / "manifest.json").write_text('{"nodes": {"a": {}}}')
+    selector_fetcher.get_selector_results("tag:a")
+    assert selector_fetcher.dbt_runner.ls.call_count == 2
+
+
+def test_get_selector_results_without_manifest(tmp_path):
+    selector_fetcher = _create_selector_fetcher(tmp_path, tmp_path / "edr_target")
+    selector_fetcher.get_selector_results("tag:a")
+    selector_fetcher.get_selector_results("tag:a")
+    assert selector_fetcher.dbt_runner.ls.call_count == 2
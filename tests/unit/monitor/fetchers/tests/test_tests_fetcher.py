@@ -0,0 +1,194 @@
+import json
+from unittest import mock
+
+from elementary.monitor.fetchers.tests.tests import TEST_RESULTS_STATIC_COLUMNS
+from tests.mocks.fetchers.tests_fetcher_mock import MockTestsFetcher
+
+
+def _raw_test_result(
+    id: str,
+    status: str = "fail",
+    test_type: str = "dbt_test",
+    invocations_rank_index: int = 1,
+    meta: str = "{}",
+    result_rows=None,
+    test_result_rows=None,
+) -> dict:
+    raw_test_result = dict(
+        id=id,
+        invocation_id=f"invocation_{invocations_rank_index}",
+        test_unique_id=f"test.{id}",
+        elementary_unique_id=f"test.{id}.None.generic",
+        detected_at="2023-01-01 10:00:00",
+        schema_name="schema",
+        column_name=None,
+        test_type=test_type,
+        test_sub_type="generic",
+        test_results_description="Got 2 results, configured to fail if != 0",
+        test_description=None,
+        original_path="tests/test.sql",
+        owners="[]",
+        model_owner="[]",
+        meta=meta,
+        model_meta="{}",
+        test_results_query="select 1",
+        other=None,
+        test_name=id,
+        test_params="{}",
+        status=status,
+        days_diff=0,
+        invocations_rank_index=invocations_rank_index,
+        result_rows=result_rows,
+    )
+    if test_result_rows is not None:
+        raw_test_result["test_result_rows"] = test_result_rows
+    return raw_test_result
+
+
+def test_process_raw_test_results():
+    test_results = [
+        _raw_test_result("failed", test_result_rows=['{"id": 1}', '{"id": 2}']),
+        _raw_test_result("failed", status="pass", invocations_rank_index=2),
+        _raw_test_result("passed", status="pass"),
+        _raw_test_result(
+            "anomaly",
+            status="pass",
+            test_type="anomaly_detection",
+            test_result_rows=['{"value": 3}'],
+        ),
+        _raw_test_result("legacy", result_rows=json.dumps([{"legacy": 1}])),
+        _raw_test_result("excluded", meta='{"elementary": {"include": false}}'),
+    ]
+
+    processed_test_results = list(
+        MockTestsFetcher._process_raw_test_results(test_results)
+    )
+
+    assert [
+        (test_result.id, test_result.invocations_rank_index, test_result.sample_data)
+        for test_result in processed_test_results
+    ] == [
+        ("failed", 1, [{"id": 1}, {"id": 2}]),
+        ("failed", 2, None),
+        ("passed", 1, None),
+        ("anomaly", 1, [{"value": 3}]),
+        ("legacy", 1, [{"legacy": 1}]),
+    ]
+    assert processed_test_results[0].test_results_query == "select 1"
+    assert processed_test_results[1].test_results_query is None
+
+
+def test_process_raw_test_results_without_samples():
+    test_results = [
+        _raw_test_result("failed"),
+        _raw_test_result(
+            "anomaly",
+            status="pass",
+            test_type="anomaly_detection",
+            test_result_rows=['{"value": 3}'],
+        ),
+    ]
+
+    assert [
+        test_result.sample_data
+        for test_result in MockTestsFetcher._process_raw_test_results(
+            test_results, disable_passed_test_metrics=True
+        )
+    ] == [[], None]
+    assert [
+        test_result.sample_data
+        for test_result in MockTestsFetcher._process_raw_test_results(
+            test_results, skip_test_result_rows=True
+        )
+    ] == [None, None]
+
+
+def test_process_raw_test_results_sample_limit_and_columns():
+    test_results = [
+        _raw_test_result(
+            "failed",
+            test_result_rows=[
+                '{"id": 1, "name": "a"}',
+                '{"id": 2, "name": "b"}',
+                '{"id": 3, "name": "c"}',
+            ],
+        ),
+        _raw_test_result(
+            "legacy",
+            result_rows=json.dumps([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]),
+        ),
+    ]
+
+    assert [
+        test_result.sample_data
+        for test_result in MockTestsFetcher._process_raw_test_results(
+            test_results,
+            sample_rows_limit=1,
+            sample_columns=["name", "missing"],
+        )
+    ] == [[{"name": "a"}], [{"name": "a"}]]
+
+
+def test_iter_all_test_results_db_rows_passes_sample_limit():
+    fetcher = MockTestsFetcher()
+    with mock.patch.object(
+        fetcher.dbt_runner, "run_operation", return_value=[json.dumps([])]
+    ) as run_operation:
+        assert list(fetcher.iter_all_test_results_db_rows(sample_rows_limit=5)) == []
+
+    macro_args = run_operation.call_args.kwargs["macro_args"]
+    assert macro_args["sample_rows_limit"] == 5
+    assert macro_args["static_columns"] == TEST_RESULTS_STATIC_COLUMNS
+
+
+def test_iter_all_test_results_db_rows_streams_test_results():
+    fetcher = MockTestsFetcher()
+    raw_test_results = [
+        _raw_test_result("first", test_result_rows=['{"id": 1}']),
+        _raw_test_result("second"),
+    ]
+    with mock.patch.object(
+        fetcher.dbt_runner,
+        "run_operation",
+        return_value=[json.dumps(raw_test_results)],
+    ), mock.patch.object(
+        MockTestsFetcher,
+        "_process_raw_test_results",
+        side_effect=MockTestsFetcher._process_raw_test_results,
+    ) as process_raw_test_results:
+        test_results = fetcher.iter_all_test_results_db_rows()
+        assert next(test_results).sample_data == [{"id": 1}]
+        # The test results are decoded lazily, not loaded as a whole before they're processed.
+        assert not isinstance(
+            process_raw_test_results.call_args.kwargs["test_results"], list
+        )
+        assert [test_result.id for test_result in test_results] == ["second"]
+
+
+def test_process_raw_test_results_fills_history_metadata():
+    history_test_result = _raw_test_result(
+        "failed", status="pass", invocations_rank_index=2
+    )
+    for column in ["meta", "model_meta", "test_params", "original_path", "owners"]:
+        history_test_result[column] = None
+    test_results = [
+        history_test_result,
+        _raw_test_result("failed", meta='{"owner": "me"}'),
+    ]
+
+    processed_test_results = list(
+        MockTestsFetcher._process_raw_test_results(test_results)
+    )
+
+    assert [
+        (
+            test_result.invocations_rank_index,
+            test_result.meta,
+            test_result.original_path,
+        )
+        for test_result in processed_test_results
+    ] == [
+        (2, {"owner": "me"}, "tests/test.sql"),
+        (1, {"owner": "me"}, "tests/test.sql"),
+    ]
+    assert processed_test_results[0].status == "pass"
@@ -0,0 +1,54 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from elementary.utils.http_session import PooledWebhookClient, create_http_session
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list = []
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.client_ports.append(self.client_address[1])
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url():
+    KeepAliveHandler.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_session_reuses_connections(server_url):
+    session = create_http_session(timeout=5, pool_maxsize=2)
+    for _ in range(3):
+        assert session.post(server_url, json={}).text == "ok"
+
+    assert len(KeepAliveHandler.client_ports) == 3
+    assert len(set(KeepAliveHandler.client_ports)) == 1
+    assert session.get_adapter(server_url).timeout == 5
+
+
+def test_pooled_webhook_client(server_url):
+    client = PooledWebhookClient(f"{server_url}/webhook")
+    for _ in range(2):
+        response = client.send(text="alert")
+        assert response.status_code == 200
+        assert response.body == "ok"
+
+    assert len(set(KeepAliveHandler.client_ports)) == 1
@@ -0,0 +1,102 @@
+import json
+import math
+
+import pytest
+
+from elementary.utils import json_utils
+from elementary.utils.json_utils import iter_json_array
+
+
+@pytest.mark.parametrize(
+    "json_array",
+    [
+        "[]",
+        " [ ] ",
+        "null",
+        '[{"id": 1, "tags": ["a", "b"]}, {"id": 2, "nested": {"x": [1, 2]}}]',
+        '\n[ 1 , "two" , null , true , 3.5 ]\n',
+        '[[1, 2], [], "a,]b"]',
+    ],
+)
+def test_iter_json_array(json_array):
+    assert list(iter_json_array(json_array)) == (json.loads(json_array) or [])
+
+
+def test_iter_json_array_is_lazy():
+    items = iter_json_array('[{"id": 1}, {"id": 2}, invalid]')
+    assert next(items) == {"id": 1}
+    assert next(items) == {"id": 2}
+    with pytest.raises(json.JSONDecodeError):
+        next(items)
+
+
+@pytest.mark.parametrize("json_array", ['{"id": 1}', "[1 2]", "[1,"])
+def test_iter_json_array_invalid(json_array):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(json_array))
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": 1, "b": [1.5, None, True], "c": {"d": "שלום"}},
+        [2**70, "big ints are handled by the stdlib fallback"],
+        [],
+    ],
+)
+def test_dumps_and_loads(json_backend, obj):
+    dumped = json_utils.dumps(obj)
+    assert json.loads(dumped) == obj
+    assert json_utils.loads(dumped) == obj
+    assert json_utils.loads(dumped.encode()) == obj
+
+
+def test_dumps_with_inf_and_nan_to_str(json_backend):
+    dumped = json_utils.dumps(
+        json_utils.inf_and_nan_to_str({"a": float("nan"), "b": [float("inf")]})
+    )
+    assert json_utils.loads(dumped) == {"a": "NaN", "b": ["Infinity"]}
+
+
+@pytest.mark.parametrize(
+    "obj", [{"a": 1}, {"a": 2**70}], ids=["small_int", "big_int"]
+)
+def test_dumps_non_finite_floats_as_null(json_backend, obj):
+    dumped = json_utils.dumps(
+        {
+            **obj,
+            "nan": float("nan"),
+            "inf": [float("inf"), (float("-inf"), 1.5)],
+            "default": {3},
+        },
+        default=lambda value: [float("nan"), *value],
+    )
+    assert json.loads(dumped) == {
+        **obj,
+        "nan": None,
+        "inf": [None, [None, 1.5]],
+        "default": [None, 3],
+    }
+
+
+def test_loads_nan_literals(json_backend):
+    loaded = json_utils.loads('{"a": NaN, "b": -Infinity}')
+    assert math.isnan(loaded["a"])
+    assert loaded["b"] == float("-inf")
+
+
+def test_dumps_default(json_backend):
+    assert json_utils.loads(json_utils.dumps({"a": {1, 2}}, default=sorted)) == {
+        "a": [1, 2]
+    }
+    with pytest.raises(TypeError):
+        json_utils.dumps({"a": object()})
@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from elementary.utils.task_scheduler import TaskScheduler
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_task_scheduler_passes_dependency_results(max_workers):
+    scheduler = TaskScheduler(max_workers=max_workers)
+    scheduler.add_task("a", lambda: 1)
+    scheduler.add_task("b", lambda: 2)
+    scheduler.add_task("sum", lambda a, b: a + b, depends_on=["a", "b"])
+    scheduler.add_task("double", lambda sum: sum * 2, depends_on=["sum"])
+
+    assert scheduler.run() == {"a": 1, "b": 2, "sum": 3, "double": 6}
+
+
+def test_task_scheduler_runs_independent_tasks_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_others():
+        barrier.wait()
+        return True
+
+    scheduler = TaskScheduler(max_workers=3)
+    for task_name in ["a", "b", "c"]:
+        scheduler.add_task(task_name, wait_for_others)
+
+    # Would time out (BrokenBarrierError) if the tasks ran one after the other.
+    assert all(scheduler.run().values())
+
+
+def test_task_scheduler_waits_for_dependencies():
+    finished = []
+
+    def slow():
+        time.sleep(0.1)
+        finished.append("slow")
+
+    def dependent(slow):
+        finished.append("dependent")
+
+    scheduler = TaskScheduler(max_workers=4)
+    scheduler.add_task("dependent", dependent, depends_on=["slow"])
+    scheduler.add_task("slow", slow)
+    scheduler.run()
+
+    assert finished == ["slow", "dependent"]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_task_scheduler_raises_task_error(max_workers):
+    def fail():
+        raise RuntimeError("failed")
+
+    scheduler = TaskScheduler(max_workers=max_workers)
+    scheduler.add_task("fail", fail)
+    scheduler.add_task("after", lambda fail: None, depends_on=["fail"])
+
+    with pytest.raises(RuntimeError):
+        scheduler.run()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_task_scheduler_invalid_dependencies(max_workers):
+    scheduler = TaskScheduler(max_workers=max_workers)
+    scheduler.add_task("a", lambda missing: None, depends_on=["missing"])
+    with pytest.raises(ValueError):
+        scheduler.run()
+
+    scheduler = TaskScheduler(max_workers=max_workers)
+    scheduler.add_task("a", lambda b: None, depends_on=["b"])
+    scheduler.add_task("b", lambda a: None, depends_on=["a"])
+    with pytest.raises(ValueError):
+        scheduler.run()